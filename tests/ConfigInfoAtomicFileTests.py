@@ -0,0 +1,104 @@
+##
+#
+# File:    ConfigInfoAtomicFileTests.py
+# Date:    19-Oct-2026
+# Version: 0.001
+##
+"""
+Test cases for atomic replacement of cache files including concurrent readers and writers
+
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "John Westbrook"
+__email__ = "jwest@rcsb.rutgers.edu"
+__license__ = "Apache 2.0"
+__version__ = "V0.01"
+
+import json
+import os
+import shutil
+import stat
+import tempfile
+import threading
+import unittest
+
+from wwpdb.utils.config.ConfigInfoAtomicFile import ConfigInfoAtomicFile
+from wwpdb.utils.config.ConfigInfoFile import ConfigInfoFile
+
+
+class ConfigInfoAtomicFileTests(unittest.TestCase):
+    def setUp(self):
+        self.__workPath = tempfile.mkdtemp()
+        self.__filePath = os.path.join(self.__workPath, "ConfigInfoFileCache.json")
+
+    def tearDown(self):
+        shutil.rmtree(self.__workPath, ignore_errors=True)
+
+    def testWrite(self):
+        umask = os.umask(0o027)
+        try:
+            with ConfigInfoAtomicFile(self.__filePath, "w") as ofh:
+                ofh.write("first")
+            # new files are created subject to the process umask (read once at import without /proc)
+            if os.path.exists("/proc/self/status"):
+                self.assertEqual(stat.S_IMODE(os.stat(self.__filePath).st_mode), 0o640)
+            self.assertEqual(os.umask(0o027), 0o027)
+        finally:
+            os.umask(umask)
+        os.chmod(self.__filePath, 0o600)
+        with ConfigInfoAtomicFile(self.__filePath, "w") as ofh:
+            ofh.write("second")
+        with open(self.__filePath) as ifh:
+            self.assertEqual(ifh.read(), "second")
+        self.assertEqual(stat.S_IMODE(os.stat(self.__filePath).st_mode), 0o600)
+        self.assertEqual(os.listdir(self.__workPath), ["ConfigInfoFileCache.json"])
+
+    def testWriteFailure(self):
+        with ConfigInfoAtomicFile(self.__filePath, "w") as ofh:
+            ofh.write("first")
+        with self.assertRaises(RuntimeError), ConfigInfoAtomicFile(self.__filePath, "w") as ofh:
+            ofh.write("partial")
+            raise RuntimeError("interrupted")
+        with open(self.__filePath) as ifh:
+            self.assertEqual(ifh.read(), "first")
+        self.assertEqual(os.listdir(self.__workPath), ["ConfigInfoFileCache.json"])
+
+    def testConcurrentReadWrite(self):
+        """Readers running concurrently with cache writers always see a complete cache file."""
+        cacheL = [{"SITE_%d" % ii: dict(("KEY_%d" % jj, "V" * 200) for jj in range(2000))} for ii in range(3)]
+        cf = ConfigInfoFile()
+        self.assertTrue(cf.writeJsonConfigCache(cacheL[0], self.__filePath, withBackup=False))
+        failL = []
+        done = threading.Event()
+
+        def writer(idx):
+            for ii in range(20):
+                if not cf.writeJsonConfigCache(cacheL[(idx + ii) % len(cacheL)], self.__filePath, withBackup=False):
+                    failL.append("write")
+
+        def reader():
+            while not done.is_set():
+                try:
+                    with open(self.__filePath) as ifh:
+                        d = json.load(ifh)
+                    if d not in cacheL:
+                        failL.append("content")
+                except Exception as e:  # noqa: BLE001
+                    failL.append(str(e))
+
+        readerL = [threading.Thread(target=reader) for _ in range(4)]
+        writerL = [threading.Thread(target=writer, args=(ii,)) for ii in range(3)]
+        for th in readerL + writerL:
+            th.start()
+        for th in writerL:
+            th.join()
+        done.set()
+        for th in readerL:
+            th.join()
+        self.assertEqual(failL, [])
+        self.assertEqual(os.listdir(self.__workPath), ["ConfigInfoFileCache.json"])
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()
@@ -0,0 +1,98 @@
+##
+#
+# File:    ConfigInfoBackupTests.py
+# Date:    19-Oct-2026
+# Version: 0.001
+##
+"""
+Test cases for timestamped backup files and backup retention policies
+
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "John Westbrook"
+__email__ = "jwest@rcsb.rutgers.edu"
+__license__ = "Apache 2.0"
+__version__ = "V0.01"
+
+import datetime
+import gzip
+import os
+import shutil
+import tempfile
+import unittest
+
+from wwpdb.utils.config.ConfigInfoBackup import ConfigInfoBackup
+
+
+class ConfigInfoBackupTests(unittest.TestCase):
+    def setUp(self):
+        self.__workPath = tempfile.mkdtemp()
+        self.__filePath = os.path.join(self.__workPath, "ConfigInfoFileCache.json")
+        self.__writeFile(self.__filePath, "current")
+
+    def tearDown(self):
+        shutil.rmtree(self.__workPath, ignore_errors=True)
+
+    def __writeFile(self, filePath, content):
+        with open(filePath, "w") as ofh:
+            ofh.write(content)
+
+    def __writeBackups(self, contentList, daysAgo=0):
+        """Write backups of the test file with the input content one minute apart ending daysAgo days ago."""
+        tS = datetime.datetime.now() - datetime.timedelta(days=daysAgo, minutes=len(contentList))  # noqa: DTZ005
+        for ii, content in enumerate(contentList):
+            ts = (tS + datetime.timedelta(minutes=ii)).strftime("-%Y-%m-%d-%H-%M-%S")
+            self.__writeFile(self.__filePath + ts, content)
+
+    def testBackupDedup(self):
+        bU = ConfigInfoBackup()
+        self.assertTrue(bU.backup(self.__filePath))
+        self.assertTrue(bU.backup(self.__filePath))
+        self.assertEqual(len(bU.getBackupList(self.__filePath)), 1)
+
+    def testKeepCount(self):
+        self.__writeBackups(["a", "b", "c", "d"])
+        removedL = ConfigInfoBackup(keepCount=2).prune(self.__filePath)
+        self.assertEqual(len(removedL), 2)
+        bckupL = ConfigInfoBackup.getBackupList(self.__filePath)
+        self.assertEqual([open(fp).read() for fp in bckupL], ["c", "d"])
+
+    def testKeepDays(self):
+        self.__writeBackups(["a", "b"], daysAgo=30)
+        self.__writeBackups(["c"], daysAgo=1)
+        ConfigInfoBackup(keepDays=7).prune(self.__filePath)
+        bckupL = ConfigInfoBackup.getBackupList(self.__filePath)
+        self.assertEqual([open(fp).read() for fp in bckupL], ["c"])
+        # the latest backup is retained regardless of age
+        ConfigInfoBackup(keepDays=0).prune(self.__filePath)
+        self.assertEqual(len(ConfigInfoBackup.getBackupList(self.__filePath)), 1)
+
+    def testCompactDirectory(self):
+        self.__writeBackups(["a", "a", "b", "b", "a"])
+        retD = ConfigInfoBackup(compress=True).compactDirectory(self.__workPath)
+        self.assertEqual(retD, {"files": 1, "removed": 2, "compressed": 3})
+        bckupL = ConfigInfoBackup.getBackupList(self.__filePath)
+        self.assertTrue(all(fp.endswith(".gz") for fp in bckupL))
+        contentL = []
+        for fp in bckupL:
+            with gzip.open(fp, "rt") as ifh:
+                contentL.append(ifh.read())
+        self.assertEqual(contentL, ["a", "b", "a"])
+        # compressed backups are compared on content
+        self.__writeFile(self.__filePath, "a")
+        self.assertTrue(ConfigInfoBackup(compress=True).backup(self.__filePath))
+        self.assertEqual(len(ConfigInfoBackup.getBackupList(self.__filePath)), 3)
+
+    def testFromConfig(self):
+        cD = {"SITE_CONFIG_BACKUP_KEEP_COUNT": "1", "SITE_CONFIG_BACKUP_COMPRESS": "true"}
+        self.__writeBackups(["a", "b"])
+        bU = ConfigInfoBackup.fromConfig(cD)
+        self.assertTrue(bU.backup(self.__filePath))
+        bckupL = bU.getBackupList(self.__filePath)
+        self.assertEqual(len(bckupL), 1)
+        self.assertTrue(bckupL[0].endswith(".gz"))
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()
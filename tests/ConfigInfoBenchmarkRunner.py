@@ -0,0 +1,187 @@
+##
+#
+# File:    ConfigInfoBenchmarkRunner.py
+# Date:    19-Oct-2026
+# Version: 0.001
+##
+"""
+Microbenchmark runner shared by the benchmark scripts in this directory with comparison against a stored baseline.
+
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "John Westbrook"
+__email__ = "jwest@rcsb.rutgers.edu"
+__license__ = "Apache 2.0"
+__version__ = "V0.01"
+
+import gc
+import json
+import logging
+import platform
+import sys
+import time
+
+from wwpdb.utils.config.ConfigInfoAtomicFile import ConfigInfoAtomicFile
+
+try:
+    import tracemalloc
+except ImportError:  # pragma: no cover
+    tracemalloc = None  # type: ignore[assignment]
+try:
+    import resource
+except ImportError:  # pragma: no cover
+    resource = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+_timer = getattr(time, "perf_counter", time.time)
+
+
+class ConfigInfoBenchmarkRunner:
+    """
+    Runs registered benchmark callables and reports for each -
+
+        ops             calls per second (best of repeat timed batches)
+        peak_bytes      peak traced memory allocated by a single call (tracemalloc)
+        retained_bytes  traced memory retained per call over a batch of calls
+        rss_kb          peak resident set size of the process after the benchmark
+
+    Results are compared with a baseline file (written by writeBaseline()) using relative
+    thresholds for the loss of throughput and the growth of per call allocations.
+    """
+
+    def __init__(self, minTime=0.2, repeat=5, log=sys.stdout):
+        self.__minTime = minTime
+        self.__repeat = repeat
+        self.__lfh = log
+        self.__benchL = []
+
+    def add(self, name, func, setup=None):
+        """Register the callable func under the input name.  setup() is run once before measurement."""
+        self.__benchL.append((name, func, setup))
+
+    def getNames(self):
+        return [name for name, _, _ in self.__benchL]
+
+    def run(self, nameFilter=None):
+        """Run the registered benchmarks (optionally only those with names containing nameFilter).
+
+        Returns: {name: {"ops", "peak_bytes", "retained_bytes", "rss_kb", "calls"}}
+        """
+        resultD = {}
+        for name, func, setup in self.__benchL:
+            if nameFilter and nameFilter not in name:
+                continue
+            if setup is not None:
+                setup()
+            func()
+            ops, calls = self.__timeIt(func)
+            peakBytes, retainedBytes = self.__traceIt(func, min(calls, 1000))
+            resultD[name] = {
+                "ops": ops,
+                "peak_bytes": peakBytes,
+                "retained_bytes": retainedBytes,
+                "rss_kb": self.__getPeakRssKb(),
+                "calls": calls,
+            }
+            self.__lfh.write("%-56s %14.1f ops/s  peak %10d B  retained %10.1f B/op  rss %8d KB\n" % (name, ops, peakBytes, retainedBytes, resultD[name]["rss_kb"]))
+        return resultD
+
+    def __timeIt(self, func):
+        # calibrate the batch size to run for a fraction of the minimum time
+        calls = 1
+        while True:
+            elapsed = self.__timeBatch(func, calls)
+            if elapsed >= self.__minTime / self.__repeat or calls >= 10000000:
+                break
+            calls = calls * 10 if elapsed < 1.0e-4 else max(calls + 1, int(calls * self.__minTime / self.__repeat / elapsed))
+        best = min([elapsed] + [self.__timeBatch(func, calls) for _ in range(self.__repeat - 1)])
+        return (calls / best if best > 0 else float("inf")), calls
+
+    @staticmethod
+    def __timeBatch(func, calls):
+        gcEnabled = gc.isenabled()
+        gc.disable()
+        try:
+            tS = _timer()
+            for _ in range(calls):
+                func()
+            return _timer() - tS
+        finally:
+            if gcEnabled:
+                gc.enable()
+
+    @staticmethod
+    def __traceIt(func, calls):
+        if tracemalloc is None:
+            return 0, 0.0
+        gc.collect()
+        tracemalloc.start()
+        try:
+            start, _ = tracemalloc.get_traced_memory()
+            func()
+            _, peak = tracemalloc.get_traced_memory()
+            peakBytes = peak - start
+            start, _ = tracemalloc.get_traced_memory()
+            for _ in range(calls):
+                func()
+            current, _ = tracemalloc.get_traced_memory()
+            return peakBytes, float(current - start) / calls
+        finally:
+            tracemalloc.stop()
+
+    @staticmethod
+    def __getPeakRssKb():
+        if resource is None:
+            return 0
+        maxRss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # bytes on macOS, kilobytes elsewhere
+        return int(maxRss / 1024) if sys.platform == "darwin" else int(maxRss)
+
+    @staticmethod
+    def writeBaseline(filePath, resultD):
+        baseD = {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "date": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime()),
+            "results": resultD,
+        }
+        with ConfigInfoAtomicFile(filePath, "w") as ofh:
+            json.dump(baseD, ofh, indent=2, sort_keys=True)
+        return True
+
+    @staticmethod
+    def readBaseline(filePath):
+        try:
+            with open(filePath) as ifh:
+                return json.load(ifh)
+        except (OSError, ValueError) as e:
+            logger.info("no usable benchmark baseline %s - %s", filePath, str(e))
+        return None
+
+    def compare(self, resultD, baseD, opsThreshold=0.25, memThreshold=0.5, memFloor=1024):
+        """Compare results with the input baseline.
+
+        A benchmark regresses if its throughput falls by more than opsThreshold (fraction of the baseline)
+        or its peak per call allocation grows by more than memThreshold and by more than memFloor bytes.
+
+        Returns: list of regression messages (empty if none)
+        """
+        regressionL = []
+        baseResultD = baseD.get("results", {})
+        if baseD.get("python") != platform.python_version():
+            self.__lfh.write("baseline recorded with Python %s - running %s\n" % (baseD.get("python"), platform.python_version()))
+        for name in sorted(resultD):
+            if name not in baseResultD:
+                self.__lfh.write("%-56s no baseline\n" % name)
+                continue
+            cur, base = resultD[name], baseResultD[name]
+            ratio = cur["ops"] / base["ops"] if base["ops"] else 1.0
+            self.__lfh.write("%-56s %7.2fx baseline ops/s\n" % (name, ratio))
+            if ratio < 1.0 - opsThreshold:
+                regressionL.append("%s throughput %.1f ops/s baseline %.1f ops/s" % (name, cur["ops"], base["ops"]))
+            growth = cur["peak_bytes"] - base["peak_bytes"]
+            if growth > memFloor and growth > memThreshold * base["peak_bytes"]:
+                regressionL.append("%s peak allocation %d B baseline %d B" % (name, cur["peak_bytes"], base["peak_bytes"]))
+        return regressionL
@@ -0,0 +1,65 @@
+##
+#
+# File:    ConfigInfoBenchmarkRunnerTests.py
+# Date:    19-Oct-2026
+# Version: 0.001
+##
+"""
+Test cases for the microbenchmark runner and baseline comparison
+
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "John Westbrook"
+__email__ = "jwest@rcsb.rutgers.edu"
+__license__ = "Apache 2.0"
+__version__ = "V0.01"
+
+import io
+import logging
+import os
+import shutil
+import tempfile
+import unittest
+
+from tests.ConfigInfoBenchmarkRunner import ConfigInfoBenchmarkRunner
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s]-%(module)s.%(funcName)s: %(message)s")
+logger = logging.getLogger()
+
+
+class ConfigInfoBenchmarkTests(unittest.TestCase):
+    def setUp(self):
+        self.__workPath = tempfile.mkdtemp()
+        self.__lfh = io.StringIO()
+
+    def tearDown(self):
+        shutil.rmtree(self.__workPath, ignore_errors=True)
+
+    def testRunAndCompare(self):
+        setupL = []
+        bm = ConfigInfoBenchmarkRunner(minTime=0.01, repeat=2, log=self.__lfh)
+        bm.add("dict-get", {"a": 1}.get, setup=lambda: setupL.append(1))
+        bm.add("list-build", lambda: list(range(1000)))
+        self.assertEqual(bm.getNames(), ["dict-get", "list-build"])
+        resultD = bm.run(nameFilter="list")
+        self.assertEqual(list(resultD), ["list-build"])
+        self.assertEqual(setupL, [])
+        rD = resultD["list-build"]
+        self.assertGreater(rD["ops"], 0)
+        self.assertGreater(rD["calls"], 0)
+        self.assertGreaterEqual(rD["peak_bytes"], 1000 * 8)
+        fp = os.path.join(self.__workPath, "baseline.json")
+        self.assertIsNone(bm.readBaseline(fp))
+        self.assertTrue(bm.writeBaseline(fp, resultD))
+        baseD = bm.readBaseline(fp)
+        self.assertEqual(bm.compare(resultD, baseD), [])
+        # a large loss of throughput or growth of allocation is reported
+        slowD = {"list-build": dict(rD, ops=rD["ops"] * 0.5, peak_bytes=rD["peak_bytes"] * 3)}
+        regressionL = bm.compare(slowD, baseD, opsThreshold=0.25, memThreshold=0.5)
+        self.assertEqual(len(regressionL), 2)
+        self.assertEqual(bm.compare(slowD, baseD, opsThreshold=0.6, memThreshold=3.0), [])
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()
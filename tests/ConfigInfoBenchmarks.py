@@ -0,0 +1,130 @@
+##
+#
+# File:    ConfigInfoBenchmarks.py
+# Date:    19-Oct-2026
+# Version: 0.001
+##
+"""
+Microbenchmarks for the configuration runtime hot paths using the mock-data site configuration tree.
+
+Run (offline) from the top of the source tree -
+
+    python tests/ConfigInfoBenchmarks.py                       compare with tests/ConfigInfoBenchmarkBaseline.json
+    python tests/ConfigInfoBenchmarks.py --save_baseline       record a new baseline on this host
+    python tests/ConfigInfoBenchmarks.py --threshold 0.1 --filter ConfigInfo.get
+
+Baselines hold absolute timings and are not part of the source tree - the first run on a host records
+the baseline.  The exit status is 1 if any benchmark regresses beyond the thresholds.
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "John Westbrook"
+__email__ = "jwest@rcsb.rutgers.edu"
+__license__ = "Apache 2.0"
+__version__ = "V0.01"
+
+import os
+import platform
+import runpy
+import sys
+from optparse import OptionParser  # pylint: disable=deprecated-module
+
+HERE = os.path.abspath(os.path.dirname(__file__))
+TOPDIR = os.path.dirname(HERE)
+sys.path.insert(0, TOPDIR)
+TESTOUTPUT = os.path.join(HERE, "test-output", platform.python_version())
+if not os.path.exists(TESTOUTPUT):  # pragma: no cover
+    os.makedirs(TESTOUTPUT)
+mockTopPath = os.path.join(TOPDIR, "wwpdb", "mock-data")
+rwMockTopPath = os.path.join(TESTOUTPUT)
+
+# Must create config file before importing ConfigInfo
+from wwpdb.utils.testing.CreateRWTree import CreateRWTree  # noqa: E402
+from wwpdb.utils.testing.SiteConfigSetup import SiteConfigSetup  # noqa: E402
+
+# Copy site-config and selected items
+crw = CreateRWTree(mockTopPath, TESTOUTPUT)
+crw.createtree(["site-config", "depuiresources", "webapps"])
+# Use populate r/w site-config using top mock site-config
+SiteConfigSetup().setupEnvironment(rwMockTopPath, rwMockTopPath)
+
+from tests.ConfigInfoBenchmarkRunner import ConfigInfoBenchmarkRunner  # noqa: E402
+from wwpdb.utils.config.ConfigInfo import ConfigInfo, getSiteId  # noqa: E402
+from wwpdb.utils.config.ConfigInfoApp import ConfigInfoAppCommon, ConfigInfoAppDepUI  # noqa: E402
+from wwpdb.utils.config.ConfigInfoDataSet import ConfigInfoDataSet  # noqa: E402
+from wwpdb.utils.config.ConfigInfoGroupDataSet import ConfigInfoGroupDataSet  # noqa: E402
+
+BASELINE_PATH = os.path.join(HERE, "ConfigInfoBenchmarkBaseline.json")
+
+
+def getBenchmarks(minTime=0.2, repeat=5, log=sys.stdout):
+    siteId = getSiteId()
+    cachePath = os.path.join(
+        os.environ["TOP_WWPDB_SITE_CONFIG_DIR"],
+        str(os.getenv("WWPDB_SITE_LOC")).lower(),
+        siteId.lower(),
+        "ConfigInfoFileCache.py",
+    )
+    cI = ConfigInfo()
+    cfds = ConfigInfoDataSet()
+    cfgds = ConfigInfoGroupDataSet()
+    cICommon = ConfigInfoAppCommon()
+    cIDepUI = ConfigInfoAppDepUI()
+
+    bm = ConfigInfoBenchmarkRunner(minTime=minTime, repeat=repeat, log=log)
+    bm.add("ConfigInfo()", ConfigInfo)
+    bm.add("ConfigInfo.get(hit)", lambda: cI.get("SITE_PREFIX"))
+    bm.add("ConfigInfo.get(miss)", lambda: cI.get("SITE_NO_SUCH_OPTION", "default"))
+    bm.add("ConfigInfoDataSet()", ConfigInfoDataSet)
+    bm.add("ConfigInfoDataSet.getSiteId(range)", lambda: cfds.getSiteId("D_1000200001"))
+    bm.add("ConfigInfoDataSet.getSiteId(int)", lambda: cfds.getSiteId(1200000001))
+    bm.add("ConfigInfoGroupDataSet.getDefaultSiteId", lambda: cfgds.getDefaultSiteId("G_1000001"))
+    bm.add("ConfigInfoAppCommon.get_site_packages_path", cICommon.get_site_packages_path)
+    bm.add("ConfigInfoAppDepUI.get_site_dataset_siteloc_file_path", cIDepUI.get_site_dataset_siteloc_file_path)
+    bm.add(
+        "ConfigInfoFileCache.py load",
+        lambda: runpy.run_path(cachePath)["ConfigInfoFileCache"].getConfigDictionary(siteId),
+    )
+    bm.add(
+        "ConfigInfoFileCache.getJsonConfigDictionary",
+        lambda: runpy.run_path(cachePath)["ConfigInfoFileCache"].getJsonConfigDictionary(siteId),
+    )
+    return bm
+
+
+def main():  # pragma: no cover
+    parser = OptionParser(usage="usage: %prog [options]")
+    parser.add_option("--baseline", dest="baselinePath", default=BASELINE_PATH, help="Baseline file path")
+    parser.add_option("--save_baseline", dest="saveBaseline", action="store_true", default=False, help="Write results as baseline")
+    parser.add_option("--threshold", dest="opsThreshold", type="float", default=0.25, help="Allowed fractional loss of ops/s")
+    parser.add_option(
+        "--mem_threshold",
+        dest="memThreshold",
+        type="float",
+        default=0.5,
+        help="Allowed fractional growth of peak bytes",
+    )
+    parser.add_option("--min_time", dest="minTime", type="float", default=0.2, help="Minimum seconds per benchmark")
+    parser.add_option("--filter", dest="nameFilter", default=None, help="Run benchmarks with names containing this")
+    options, _args = parser.parse_args()
+
+    bm = getBenchmarks(minTime=options.minTime)
+    resultD = bm.run(nameFilter=options.nameFilter)
+    if options.saveBaseline:
+        bm.writeBaseline(options.baselinePath, resultD)
+        sys.stdout.write("baseline written to %s\n" % options.baselinePath)
+        return 0
+    baseD = bm.readBaseline(options.baselinePath)
+    if baseD is None:
+        # baselines are host specific and are recorded by the first run on each host
+        bm.writeBaseline(options.baselinePath, resultD)
+        sys.stdout.write("no baseline - results recorded as the baseline for this host in %s\n" % options.baselinePath)
+        return 0
+    regressionL = bm.compare(resultD, baseD, opsThreshold=options.opsThreshold, memThreshold=options.memThreshold)
+    for msg in regressionL:
+        sys.stdout.write("REGRESSION %s\n" % msg)
+    return 1 if regressionL else 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    sys.exit(main())
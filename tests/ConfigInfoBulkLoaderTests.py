@@ -0,0 +1,80 @@
+##
+#
+# File:    ConfigInfoBulkLoaderTests.py
+# Date:    19-Oct-2026
+# Version: 0.001
+##
+"""
+Test cases for bulk loading of multi-site configuration
+
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "John Westbrook"
+__email__ = "jwest@rcsb.rutgers.edu"
+__license__ = "Apache 2.0"
+__version__ = "V0.01"
+
+import json
+import logging
+import os
+import shutil
+import tempfile
+import unittest
+
+from wwpdb.utils.config.ConfigInfo import ConfigInfo
+from wwpdb.utils.config.ConfigInfoBulkLoader import ConfigInfoBulkLoader
+from wwpdb.utils.config.ConfigInfoData import ConfigInfoData
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s]-%(module)s.%(funcName)s: %(message)s")
+logger = logging.getLogger()
+
+
+class ConfigInfoBulkLoaderTests(unittest.TestCase):
+    def setUp(self):
+        self.__workPath = tempfile.mkdtemp()
+        self.__siteIdL = []
+        for siteLoc, siteId in [
+            ("rcsb-east", "WWPDB_BULK_TEST_A"),
+            ("rcsb-east", "WWPDB_BULK_TEST_B"),
+            ("pdbe", "WWPDB_BULK_TEST_C"),
+            # the first location in the search order providing a site is used
+            ("pdbj", "WWPDB_BULK_TEST_A"),
+        ]:
+            dirPath = os.path.join(self.__workPath, siteLoc, siteId.lower())
+            os.makedirs(dirPath)
+            with open(os.path.join(dirPath, "ConfigInfoFileCache.json"), "w") as ofh:
+                json.dump({siteId: {"SITE_PREFIX": siteId, "SITE_LOC": siteLoc}}, ofh)
+            self.__siteIdL.append(siteId)
+        os.makedirs(os.path.join(self.__workPath, "pdbe", "wwpdb_bulk_test_empty"))
+        ConfigInfoData.registerSiteConfig("WWPDB_BULK_TEST_REG", {"SITE_PREFIX": "registered"})
+
+    def tearDown(self):
+        for siteId in set(self.__siteIdL) | {"WWPDB_BULK_TEST_REG"}:
+            ConfigInfoData.unregisterSiteConfig(siteId)
+        shutil.rmtree(self.__workPath, ignore_errors=True)
+
+    def testLoad(self):
+        bl = ConfigInfoBulkLoader(topConfigPath=self.__workPath)
+        pathD = bl.discover()
+        self.assertEqual(sorted(pathD), ["WWPDB_BULK_TEST_A", "WWPDB_BULK_TEST_B", "WWPDB_BULK_TEST_C"])
+        self.assertIn("rcsb-east", pathD["WWPDB_BULK_TEST_A"])
+        siteIdL = ["WWPDB_BULK_TEST_A", "WWPDB_BULK_TEST_B", "WWPDB_BULK_TEST_C", "WWPDB_BULK_TEST_REG", "MISSING"]
+        rD = bl.load(siteIdL)
+        self.assertEqual(list(rD), siteIdL)
+        self.assertEqual(rD["WWPDB_BULK_TEST_A"]["SITE_LOC"], "rcsb-east")
+        self.assertEqual(rD["WWPDB_BULK_TEST_C"]["SITE_LOC"], "pdbe")
+        self.assertEqual(rD["WWPDB_BULK_TEST_REG"]["SITE_PREFIX"], "registered")
+        self.assertEqual(rD["MISSING"], {})
+        # files are read serially with a single worker (or without concurrent.futures)
+        self.assertEqual(ConfigInfoBulkLoader(topConfigPath=self.__workPath, maxWorkers=1).load(siteIdL), rD)
+        self.assertIsNone(ConfigInfoData.getRegisteredSiteConfig("WWPDB_BULK_TEST_B"))
+        # loaded sites may be registered for subsequently constructed ConfigInfo() instances
+        bl.load(["WWPDB_BULK_TEST_B", "WWPDB_BULK_TEST_C"], register=True)
+        self.assertEqual(ConfigInfo(siteId="WWPDB_BULK_TEST_B").get("SITE_PREFIX"), "WWPDB_BULK_TEST_B")
+        self.assertEqual(ConfigInfo(siteId="WWPDB_BULK_TEST_C").get("SITE_LOC"), "pdbe")
+        self.assertEqual(bl.load(["WWPDB_BULK_TEST_C"])["WWPDB_BULK_TEST_C"]["SITE_LOC"], "pdbe")
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()
@@ -0,0 +1,145 @@
+##
+#
+# File:    ConfigInfoCacheWatcherTests.py
+# Date:    19-Oct-2026
+# Version: 0.001
+##
+"""
+Test cases for hot reload of site configuration cache files
+
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "John Westbrook"
+__email__ = "jwest@rcsb.rutgers.edu"
+__license__ = "Apache 2.0"
+__version__ = "V0.01"
+
+import os
+import runpy
+import shutil
+import tempfile
+import threading
+import unittest
+
+from wwpdb.utils.config.ConfigInfo import ConfigInfo
+from wwpdb.utils.config.ConfigInfoCacheWatcher import ConfigInfoCacheWatcher
+from wwpdb.utils.config.ConfigInfoData import ConfigInfoData
+from wwpdb.utils.config.ConfigInfoDataSet import ConfigInfoDataSet
+from wwpdb.utils.config.ConfigInfoFile import ConfigInfoFile
+
+
+class ConfigInfoCacheWatcherTests(unittest.TestCase):
+    def setUp(self):
+        self.__siteId = "WWPDB_DEPLOY_WATCH_TEST"
+        self.__workPath = tempfile.mkdtemp()
+        self.__cachePath = os.path.join(self.__workPath, "rcsb-east", self.__siteId.lower())
+        os.makedirs(self.__cachePath)
+        self.__writeCache("V1")
+
+    def tearDown(self):
+        ConfigInfoData.unregisterSiteConfig(self.__siteId)
+        shutil.rmtree(self.__workPath, ignore_errors=True)
+
+    def __writeCache(self, value):
+        cf = ConfigInfoFile()
+        cacheD = {self.__siteId: {"SITE_TEST_OPTION": value, "SITE_TEST_RANGE": (1, 10)}}
+        cf.writePythonConfigCache(cacheD, os.path.join(self.__cachePath, "ConfigInfoFileCache.py"), withBackup=False)
+        cf.writeJsonConfigCache(cacheD, os.path.join(self.__cachePath, "ConfigInfoFileCache.json"), withBackup=False)
+
+    def __getWatcher(self, useInotify):
+        return ConfigInfoCacheWatcher(
+            siteId=self.__siteId,
+            siteLoc="rcsb-east",
+            topConfigPath=self.__workPath,
+            pollInterval=0.1,
+            useInotify=useInotify,
+        )
+
+    def __getOption(self):
+        return ConfigInfoData(siteId=self.__siteId).getConfigDictionary().get("SITE_TEST_OPTION")
+
+    def testCheckNow(self):
+        cW = self.__getWatcher(useInotify=False)
+        eventL = []
+        cW.addCallback(lambda kind, filePath, dataD: eventL.append((kind, dataD["SITE_TEST_OPTION"])))
+        cW.start()
+        cW.stop()
+        self.assertEqual(self.__getOption(), "V1")
+        # registered dictionaries retain tuple values from the Python cache
+        self.assertEqual(ConfigInfoData.getRegisteredSiteConfig(self.__siteId)["SITE_TEST_RANGE"], (1, 10))
+        self.assertEqual(cW.checkNow(), [])
+        cI = ConfigInfo(siteId=self.__siteId)
+        self.assertEqual(cI.get("SITE_TEST_OPTION"), "V1")
+        self.__writeCache("V2")
+        self.assertEqual(cW.checkNow(), ["config"])
+        self.assertEqual(self.__getOption(), "V2")
+        # existing ConfigInfo instances follow the reloaded configuration
+        self.assertEqual(cI.get("SITE_TEST_OPTION"), "V2")
+        self.assertGreaterEqual(ConfigInfo.refreshSite(self.__siteId), 1)
+        self.assertEqual(eventL, [("config", "V2")])
+        # rewriting identical content does not notify
+        self.__writeCache("V2")
+        self.assertEqual(cW.checkNow(), [])
+        self.assertEqual(len(eventL), 1)
+
+    def testCacheModule(self):
+        cacheCls = runpy.run_path(os.path.join(self.__cachePath, "ConfigInfoFileCache.py"))["ConfigInfoFileCache"]
+        self.assertTrue(cacheCls.hasConfigDictionary(self.__siteId))
+        self.assertFalse(cacheCls.hasConfigDictionary("WWPDB_DEPLOY_OTHER_TEST"))
+        self.assertEqual(cacheCls.getConfigDictionary(self.__siteId)["SITE_TEST_OPTION"], "V1")
+
+    def testDataSetLocations(self):
+        dsLocPath = os.path.join(self.__workPath, "site_dataset_siteloc_info.json")
+        ConfigInfoFile().writeJsonConfigCache({"D_1000000001": "WWPDB_DEPLOY_TEST_RU"}, dsLocPath, withBackup=False)
+        cW = ConfigInfoCacheWatcher(siteId=self.__siteId, siteLoc="rcsb-east", topConfigPath=self.__workPath, dataSetLocFilePath=dsLocPath)
+        eventL = []
+        cW.addCallback(lambda kind, filePath, dataD: eventL.append((kind, filePath, dataD)))
+        cW.start()
+        cW.stop()
+        try:
+            ConfigInfoFile().writeJsonConfigCache({"D_1000000001": "PDBE_PROD"}, dsLocPath, withBackup=False)
+            self.assertEqual(cW.checkNow(), ["dataset"])
+            self.assertEqual(eventL, [("dataset", dsLocPath, {"D_1000000001": "PDBE_PROD"})])
+        finally:
+            ConfigInfoDataSet.unregisterLocationDictionary(dsLocPath)
+
+    def testPollThread(self):
+        self.__runThread(useInotify=False)
+
+    def testInotifyThread(self):
+        self.__runThread(useInotify=True)
+
+    def __runThread(self, useInotify):
+        cW = self.__getWatcher(useInotify=useInotify)
+        changed = threading.Event()
+        cW.addCallback(lambda kind, filePath, dataD: changed.set())
+        cW.start()
+        try:
+            if not useInotify:
+                self.assertEqual(cW.getMode(), "poll")
+            self.__writeCache("V3")
+            self.assertTrue(changed.wait(10.0))
+            self.assertEqual(self.__getOption(), "V3")
+            # a failing check does not stop the watcher
+            failedL = []
+            checkNow = cW.checkNow
+
+            def failOnce():
+                if not failedL:
+                    failedL.append(True)
+                    raise IOError("check failure")  # noqa: UP024
+                return checkNow()
+
+            cW.checkNow = failOnce
+            changed.clear()
+            self.__writeCache("V4")
+            self.assertTrue(changed.wait(10.0))
+            self.assertEqual(failedL, [True])
+            self.assertEqual(self.__getOption(), "V4")
+        finally:
+            cW.stop()
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()
@@ -0,0 +1,72 @@
+##
+#
+# File:    ConfigInfoContentTypeTests.py
+# Date:    19-Oct-2026
+# Version: 0.001
+##
+"""
+Test cases for content type, format and file name lookup indexes
+
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "John Westbrook"
+__email__ = "jwest@rcsb.rutgers.edu"
+__license__ = "Apache 2.0"
+__version__ = "V0.01"
+
+import unittest
+
+from wwpdb.utils.config.ConfigInfoContentType import ConfigInfoContentType
+from wwpdb.utils.config.ConfigInfoData import ConfigInfoData
+
+
+class ConfigInfoContentTypeTests(unittest.TestCase):
+    def testIndexes(self):
+        cT = ConfigInfoContentType()
+        self.assertEqual(cT.getContentTypeForAcronym("model"), ("model", None))
+        self.assertEqual(cT.getContentTypeForAcronym("sf-upload-convert"), ("structure-factors", "upload-convert"))
+        self.assertIsNone(cT.getContentTypeForAcronym("no-such-acronym"))
+        self.assertEqual(cT.getAcronym("structure-factors-release"), "sf-release")
+        self.assertEqual(cT.getFormats("model-upload"), ["pdbx", "pdb", "pdbml", "cifeps"])
+        self.assertTrue(cT.isValidFormat("model-review", "pdbml"))
+        self.assertFalse(cT.isValidFormat("model", "mtz"))
+        self.assertEqual(cT.getExtension("mrc2000"), "mrc")
+        self.assertEqual(cT.getFormatsForExtension("xml"), ["pdbml", "xml"])
+        self.assertEqual(cT.getFormatsForExtension("nope"), [])
+
+    def testConsistentWithContentTypeDictionary(self):
+        cD = ConfigInfoData(siteId="WWPDB_DEPLOY_CONTENT_TEST").getConfigDictionary()["CONTENT_TYPE_DICTIONARY"]
+        cT = ConfigInfoContentType()
+        for contentType, (formatL, acronym) in cD.items():
+            self.assertEqual(cT.getAcronym(contentType), acronym)
+            self.assertEqual(cT.getFormats(contentType), formatL)
+            for fmt in formatL:
+                self.assertTrue(cT.isValidFormat(contentType, fmt))
+
+    def testParseFileName(self):
+        cT = ConfigInfoContentType()
+        self.assertEqual(
+            cT.parseFileName("/archive/D_1000000001/D_1000000001_model-upload_P1.cif.V2"),
+            {
+                "dataSetId": "D_1000000001",
+                "contentType": "model",
+                "milestone": "upload",
+                "format": "pdbx",
+                "partNumber": 1,
+                "version": 2,
+            },
+        )
+        tD = cT.parseFileName("D_1000000001_model_P1.xml")
+        self.assertEqual((tD["contentType"], tD["milestone"], tD["format"], tD["version"]), ("model", None, "pdbml", None))
+        tD = cT.parseFileName("D_1000000001_mr_P3.mr.V1")
+        self.assertEqual((tD["contentType"], tD["format"], tD["partNumber"]), ("nmr-restraints", "pdb-mr", 3))
+        self.assertEqual(cT.parseFileName("D_1000000001_em-volume_P1.map.V1")["format"], "map")
+        # unknown acronym, format not allowed for the content type, or not an archive file name
+        self.assertIsNone(cT.parseFileName("D_1000000001_unknown_P1.cif.V1"))
+        self.assertIsNone(cT.parseFileName("D_1000000001_model_P1.mtz.V1"))
+        self.assertIsNone(cT.parseFileName("README.txt"))
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()
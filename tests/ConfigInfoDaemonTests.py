@@ -0,0 +1,144 @@
+##
+#
+# File:    ConfigInfoDaemonTests.py
+# Date:    19-Oct-2026
+# Version: 0.001
+##
+"""
+Test cases for the configuration daemon and the ConfigInfo client mode
+
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "John Westbrook"
+__email__ = "jwest@rcsb.rutgers.edu"
+__license__ = "Apache 2.0"
+__version__ = "V0.01"
+
+import logging
+import os
+import shutil
+import socket
+import stat
+import tempfile
+import unittest
+
+from wwpdb.utils.config.ConfigInfo import ConfigInfo
+from wwpdb.utils.config.ConfigInfoDaemon import ConfigInfoDaemon, ConfigInfoDaemonClient
+from wwpdb.utils.config.ConfigInfoData import ConfigInfoData
+from wwpdb.utils.config.ConfigInfoFile import ConfigInfoFile
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s]-%(module)s.%(funcName)s: %(message)s")
+logger = logging.getLogger()
+
+SITE_ID = "WWPDB_DEPLOY_DAEMON_TEST"
+
+
+@unittest.skipUnless(hasattr(socket, "AF_UNIX"), "requires Unix domain sockets")
+class ConfigInfoDaemonTests(unittest.TestCase):
+    def setUp(self):
+        self.__workPath = tempfile.mkdtemp()
+        self.__socketPath = os.path.join(self.__workPath, "config.sock")
+        self.__envSave = os.environ.get("WWPDB_CONFIG_DAEMON_SOCKET")
+        ConfigInfoData.registerSiteConfig(SITE_ID, {"SITE_PREFIX": "daemon", "SITE_PORT": 8080, "SITE_HOSTS": ("a", "b"), "SITE_NONE": None})
+        ConfigInfoDaemonClient.reset()
+        self.__daemon = ConfigInfoDaemon(self.__socketPath, [SITE_ID])
+        self.__daemon.start()
+
+    def tearDown(self):
+        self.__daemon.stop()
+        ConfigInfoDaemonClient.reset()
+        ConfigInfoData.unregisterSiteConfig(SITE_ID)
+        if self.__envSave is None:
+            os.environ.pop("WWPDB_CONFIG_DAEMON_SOCKET", None)
+        else:
+            os.environ["WWPDB_CONFIG_DAEMON_SOCKET"] = self.__envSave
+        shutil.rmtree(self.__workPath, ignore_errors=True)
+
+    def testRequests(self):
+        self.assertEqual(stat.S_IMODE(os.stat(self.__socketPath).st_mode), 0o600)
+        client = ConfigInfoDaemonClient(socketPath=self.__socketPath)
+        self.assertEqual(client.getSiteIds(), [SITE_ID])
+        self.assertEqual(client.get(SITE_ID, "SITE_PREFIX"), "daemon")
+        self.assertEqual(client.get(SITE_ID, "SITE_PORT"), 8080)
+        # values are served as JSON types
+        self.assertEqual(client.get(SITE_ID, "SITE_HOSTS"), ["a", "b"])
+        self.assertIsNone(client.get(SITE_ID, "SITE_NONE", "x"))
+        self.assertEqual(client.get(SITE_ID, "SITE_MISSING", "x"), "x")
+        self.assertEqual(client.get("OTHER_SITE", "SITE_PREFIX", "x"), "x")
+        self.assertEqual(
+            client.getMany(SITE_ID, ["SITE_PREFIX", "SITE_PORT", "SITE_MISSING"]),
+            {"SITE_PREFIX": "daemon", "SITE_PORT": 8080},
+        )
+        sD = client.snapshot(SITE_ID)
+        self.assertEqual(sD["SITE_PREFIX"], "daemon")
+        # class-level options are served with the site options
+        self.assertIn("model", sD["CONTENT_TYPE_BASE_DICTIONARY"])
+        self.assertIsNone(client.snapshot("OTHER_SITE"))
+        # the configuration is resolved again on reload
+        ConfigInfoData.registerSiteConfig(SITE_ID, {"SITE_PREFIX": "reloaded"})
+        self.assertEqual(client.get(SITE_ID, "SITE_PREFIX"), "daemon")
+        self.assertEqual(self.__daemon.reload(), 1)
+        self.assertEqual(client.get(SITE_ID, "SITE_PREFIX"), "reloaded")
+        client.close()
+
+    def testReloadCacheFiles(self):
+        """SIGHUP style reloads read the rebuilt cache files of the site."""
+        siteId = "WWPDB_DEPLOY_DAEMON_CACHE"
+        topPath = os.path.join(self.__workPath, "site-config")
+        cachePath = os.path.join(topPath, "pdbe", siteId.lower())
+        os.makedirs(cachePath)
+        socketPath = os.path.join(self.__workPath, "cache.sock")
+
+        def writeCache(value):
+            cacheD = {siteId: {"SITE_PREFIX": value, "SITE_RANGE": (1, 10)}}
+            cf = ConfigInfoFile()
+            cf.writePythonConfigCache(cacheD, os.path.join(cachePath, "ConfigInfoFileCache.py"), withBackup=False)
+            cf.writeJsonConfigCache(cacheD, os.path.join(cachePath, "ConfigInfoFileCache.json"), withBackup=False)
+
+        writeCache("V1")
+        daemon = ConfigInfoDaemon(socketPath, [siteId], mode=0o640, siteLoc="rcsb-east", topConfigPath=topPath)
+        daemon.start()
+        try:
+            self.assertEqual(stat.S_IMODE(os.stat(socketPath).st_mode), 0o640)
+            # the socket is bound in a private directory which is removed once the socket is in place
+            self.assertEqual(sorted(os.listdir(self.__workPath)), ["cache.sock", "config.sock", "site-config"])
+            client = ConfigInfoDaemonClient(socketPath=socketPath)
+            self.assertEqual(client.get(siteId, "SITE_PREFIX"), "V1")
+            self.assertEqual(client.get(siteId, "SITE_RANGE"), [1, 10])
+            writeCache("V2")
+            self.assertEqual(client.get(siteId, "SITE_PREFIX"), "V1")
+            self.assertEqual(daemon.reload(), 1)
+            self.assertEqual(client.get(siteId, "SITE_PREFIX"), "V2")
+            client.close()
+        finally:
+            daemon.stop()
+            ConfigInfoData.unregisterSiteConfig(siteId)
+        self.assertFalse(os.path.exists(socketPath))
+
+    def testClientMode(self):
+        ConfigInfoData.registerSiteConfig(SITE_ID, {"SITE_PREFIX": "local"})
+        self.assertEqual(ConfigInfo(siteId=SITE_ID).get("SITE_PREFIX"), "local")
+        os.environ["WWPDB_CONFIG_DAEMON_SOCKET"] = self.__socketPath
+        cI = ConfigInfo(siteId=SITE_ID)
+        self.assertEqual(cI.get("SITE_PREFIX"), "daemon")
+        self.assertEqual(cI.get("SITE_HOSTS"), ["a", "b"])
+        # sites not served by the daemon are loaded locally
+        ConfigInfoData.registerSiteConfig("WWPDB_DEPLOY_DAEMON_OTHER", {"SITE_PREFIX": "other"})
+        try:
+            self.assertEqual(ConfigInfo(siteId="WWPDB_DEPLOY_DAEMON_OTHER").get("SITE_PREFIX"), "other")
+            # and the missing site is remembered so later constructions make no request
+            self.assertIn((self.__socketPath, "WWPDB_DEPLOY_DAEMON_OTHER"), ConfigInfoDaemonClient._failedD)  # pylint: disable=protected-access
+            self.assertEqual(ConfigInfo(siteId="WWPDB_DEPLOY_DAEMON_OTHER").get("SITE_PREFIX"), "other")
+        finally:
+            ConfigInfoData.unregisterSiteConfig("WWPDB_DEPLOY_DAEMON_OTHER")
+        # an unavailable daemon falls back to local loading
+        self.__daemon.stop()
+        ConfigInfoDaemonClient.reset()
+        self.assertEqual(ConfigInfo(siteId=SITE_ID).get("SITE_PREFIX"), "local")
+        os.environ["WWPDB_CONFIG_DAEMON_SOCKET"] = os.path.join(self.__workPath, "missing.sock")
+        self.assertEqual(ConfigInfo(siteId=SITE_ID).get("SITE_PREFIX"), "local")
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()
@@ -16,6 +16,7 @@ __email__ = "peisach@rcsb.rutgers.edu"
 __license__ = "Creative Commons Attribution 3.0 Unported"
 __version__ = "V0.01"
 
+import io
 import os
 import platform
 import unittest
@@ -54,8 +55,11 @@ class ConfigDataSetExecTests(unittest.TestCase):
 
     def testCheckConfig(self):
         cidse = ConfigInfoDataSetExec()
-        cidse.checkConfig()
-        # Nothing to check here
+        sD = cidse.checkConfig(bucketSize=1000000)
+        self.assertIsNotNone(sD)
+        self.assertEqual(sD["total"], sum(sD["sites"].values()))
+        sD = cidse.checkConfig(outFormat="json")
+        self.assertIsNotNone(sD)
 
     def testPrintConfig(self):
         cidse = ConfigInfoDataSetExec()
@@ -82,6 +86,23 @@ class ConfigDataSetExecTests(unittest.TestCase):
         cids = ConfigInfoDataSet()
         self.assertEqual(cids.getSiteId(tset[0]), "UNASSIGNED", "Removal failed")
 
+    def testStreamLocations(self):
+        cidse = ConfigInfoDataSetExec()
+        # differently padded forms of an id are normalized to D_%010d and refer to the same entry
+        # and ids repeated in a later batch are duplicates
+        ifh = io.StringIO("D_800004\n\n# comment\nD_0000800004\n800005\nD_BAD\nD_800006\n800004\n")
+        countD = cidse.streamLocations(ifh, siteId="WWPDB_DEPLOY_DUMMY_RU", batchSize=2)
+        self.assertEqual(countD, {"read": 6, "invalid": 1, "duplicate": 2, "applied": 3, "batches": 2, "failed": 0})
+        cids = ConfigInfoDataSet()
+        for d in ["D_0000800004", "D_0000800005", "D_0000800006"]:
+            self.assertEqual(cids.getSiteId(d), "WWPDB_DEPLOY_DUMMY_RU")
+        self.assertNotIn("D_800004", cids.getDataSetLocationDict())
+
+        countD = cidse.streamLocations(io.StringIO("D_800004\n800005\nD_0000800006\n"), remove=True)
+        self.assertEqual(countD["applied"], 3)
+        cids = ConfigInfoDataSet()
+        self.assertEqual(cids.getSiteId("D_0000800004"), "UNASSIGNED")
+
 
 if __name__ == "__main__":  # pragma: no cover
     unittest.main()
@@ -0,0 +1,205 @@
+##
+#
+# File:    ConfigInfoDataSetUpdateTests.py
+# Date:    19-Oct-2026
+# Version: 0.001
+##
+"""
+Test cases and multi-process contention benchmark for transactional updates of the data set location file
+
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "John Westbrook"
+__email__ = "jwest@rcsb.rutgers.edu"
+__license__ = "Apache 2.0"
+__version__ = "V0.01"
+
+import json
+import logging
+import multiprocessing
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+from wwpdb.utils.config.ConfigInfoData import ConfigInfoData
+from wwpdb.utils.config.ConfigInfoDataSet import ConfigInfoDataSet
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s]-%(module)s.%(funcName)s: %(message)s")
+logger = logging.getLogger()
+
+SITE_ID = "WWPDB_DEPLOY_UPDATE_TEST"
+
+
+def _registerSite(workPath):
+    os.environ["WWPDB_SITE_ID"] = SITE_ID
+    ConfigInfoData.registerSiteConfig(
+        SITE_ID,
+        {
+            "RO_RESOURCE_PATH": workPath,
+            "SITE_SERVICE_REGISTRATION_LOCKDIR_PATH": os.path.join(workPath, "locks"),
+            "SITE_CONFIG_BACKUP_KEEP_COUNT": 2,
+        },
+    )
+
+
+def _updateWorker(workPath, workerId, nUpdates, resultQ):
+    """Apply nUpdates single data set transactions and report the elapsed time."""
+    _registerSite(workPath)
+    cfds = ConfigInfoDataSet()
+    startTime = time.time()
+    ok = True
+    for ii in range(nUpdates):
+        dsId = "D_%010d" % (1000000000 + workerId * nUpdates + ii)
+        ok = cfds.updateLocations(addD={dsId: "SITE_%d" % workerId}, backup=False) and ok
+    resultQ.put((workerId, ok, time.time() - startTime))
+
+
+class ConfigInfoDataSetUpdateTests(unittest.TestCase):
+    def setUp(self):
+        self.__workPath = tempfile.mkdtemp()
+        os.makedirs(os.path.join(self.__workPath, "depui"))
+        os.makedirs(os.path.join(self.__workPath, "locks"))
+        self.__locPath = os.path.join(self.__workPath, "depui", "site_dataset_siteloc_info.json")
+        self.__siteIdSave = os.environ.get("WWPDB_SITE_ID")
+        _registerSite(self.__workPath)
+
+    def tearDown(self):
+        ConfigInfoData.unregisterSiteConfig(SITE_ID)
+        if self.__siteIdSave is None:
+            os.environ.pop("WWPDB_SITE_ID", None)
+        else:
+            os.environ["WWPDB_SITE_ID"] = self.__siteIdSave
+        shutil.rmtree(self.__workPath, ignore_errors=True)
+
+    def __readFile(self):
+        with open(self.__locPath) as ifh:
+            return json.load(ifh)
+
+    def testUpdateLocations(self):
+        cfds = ConfigInfoDataSet()
+        self.assertTrue(cfds.writeLocationList("PDBE_PROD", ["D_1000000001", "D_1000000002"]))
+        self.assertTrue(cfds.updateLocations(addD={"D_1000000003": "PDBE_PROD"}, removeL=["D_1000000001"]))
+        self.assertEqual(self.__readFile(), {"D_1000000002": "PDBE_PROD", "D_1000000003": "PDBE_PROD"})
+        # the lock file is shared with writers of earlier releases
+        self.assertEqual(os.listdir(os.path.join(self.__workPath, "locks")), ["configdataset.exceptionfile-lock"])
+        self.assertEqual(sorted(cfds.getDataSetLocations("PDBE_PROD")), ["D_1000000002", "D_1000000003"])
+        # readers in other instances see the update
+        self.assertEqual(ConfigInfoDataSet().getSiteId("D_1000000003"), "PDBE_PROD")
+        # removed data sets revert to the default range assignment
+        self.assertEqual(ConfigInfoDataSet().getSiteId("D_1000000001"), "WWPDB_DEPLOY_LEGACY_RU")
+        self.assertTrue(cfds.removeDataSets(["D_1000000002", "D_1000000003"]))
+        self.assertEqual(cfds.getDataSetLocationDict(), {})
+
+    def testSiteIndex(self):
+        cfds = ConfigInfoDataSet()
+        self.assertEqual(cfds.getDataSetLocations("PDBE_PROD"), [])
+        self.assertTrue(cfds.writeLocationList("PDBE_PROD", ["D_1000000003", "D_1000000001", "D_1000000002"]))
+        self.assertTrue(cfds.writeLocationList("BMRB", ["D_1000000004"]))
+        self.assertEqual(cfds.getDataSetLocations("PDBE_PROD"), ["D_1000000001", "D_1000000002", "D_1000000003"])
+        # relocation and removal update the index incrementally
+        dsL = cfds.getDataSetLocations("PDBE_PROD")
+        self.assertTrue(cfds.updateLocations(addD={"D_1000000002": "BMRB", "D_1000000000": "PDBE_PROD"}))
+        self.assertTrue(cfds.removeDataSets(["D_1000000003", "D_1000000009"]))
+        self.assertEqual(cfds.getDataSetLocations("PDBE_PROD"), ["D_1000000000", "D_1000000001"])
+        self.assertEqual(cfds.getDataSetLocations("BMRB"), ["D_1000000002", "D_1000000004"])
+        # previously returned lists are not modified
+        self.assertEqual(dsL, ["D_1000000001", "D_1000000002", "D_1000000003"])
+        # the index agrees with one built from the file content
+        d = self.__readFile()
+        for siteId in ["PDBE_PROD", "BMRB", "UNKNOWN"]:
+            self.assertEqual(cfds.getDataSetLocations(siteId), sorted(k for k, v in d.items() if v == siteId))
+
+    def testSnapshotRead(self):
+        cfds = ConfigInfoDataSet()
+        self.assertTrue(cfds.writeLocationList("PDBE_PROD", ["D_1000000001"]))
+        d = cfds.getDataSetLocationDict()
+        d["D_1000000002"] = "BMRB"
+        # returned dictionaries are copies of the shared snapshot
+        self.assertEqual(cfds.getDataSetLocationDict(), {"D_1000000001": "PDBE_PROD"})
+        # a change made outside this process is picked up on the next read
+        time.sleep(0.01)
+        with open(self.__locPath, "w") as ofh:
+            json.dump({"D_1000000004": "BMRB"}, ofh)
+        self.assertEqual(cfds.getDataSetLocationDict(), {"D_1000000004": "BMRB"})
+
+    def testStaleSnapshot(self):
+        """Updates read the file again even if its status matches the snapshot."""
+        cfds = ConfigInfoDataSet()
+        self.assertTrue(cfds.writeLocationList("PDBE_PROD", ["D_1000000001"]))
+        self.assertEqual(cfds.getDataSetLocations("PDBE_PROD"), ["D_1000000001"])
+        # another writer rewrites the file in place with content of the same size and the same mtime
+        st = os.stat(self.__locPath)
+        with open(self.__locPath, "r+") as ofh:
+            ofh.write(json.dumps({"D_1000000002": "PDBE_PROD"}, indent=4).ljust(st.st_size))
+        os.utime(self.__locPath, (st.st_atime, st.st_mtime))
+        self.assertEqual(os.stat(self.__locPath).st_size, st.st_size)
+        self.assertTrue(cfds.writeLocationList("BMRB", ["D_1000000003"]))
+        self.assertEqual(self.__readFile(), {"D_1000000002": "PDBE_PROD", "D_1000000003": "BMRB"})
+        self.assertEqual(cfds.getDataSetLocations("PDBE_PROD"), ["D_1000000002"])
+
+    def testUnreadableFile(self):
+        """An update must not replace a location file which cannot be read."""
+        with open(self.__locPath, "w") as ofh:
+            ofh.write("{ truncated")
+        self.assertFalse(ConfigInfoDataSet().writeLocationList("PDBE_PROD", ["D_1000000001"]))
+        with open(self.__locPath) as ifh:
+            self.assertEqual(ifh.read(), "{ truncated")
+
+    def testLocationStatistics(self):
+        cfds = ConfigInfoDataSet()
+        self.assertTrue(
+            cfds.updateLocations(
+                addD={
+                    "D_1000200005": "WWPDB_DEPLOY_PRODUCTION_RU",
+                    "D_1000200006": "PDBE_PROD",
+                    "D_1200000001": "WWPDB_DEPLOY_PRODUCTION_RU",
+                    "D_9": "BMRB",
+                    "D_EAD": "BMRB",
+                }
+            )
+        )
+        sD = cfds.getLocationStatistics(bucketSize=1000000000)
+        self.assertEqual(sD["total"], 5)
+        self.assertEqual(sD["sites"], {"WWPDB_DEPLOY_PRODUCTION_RU": 2, "PDBE_PROD": 1, "BMRB": 2})
+        self.assertEqual(sD["ranges"], {"WWPDB_DEPLOY_PRODUCTION_RU": 2, "PDBE_PROD": 1, None: 1})
+        self.assertEqual(sD["buckets"], {0: 1, 1000000000: 3})
+        self.assertEqual(sD["redundant"], ["D_1000200005"])
+        self.assertEqual(sD["invalid"], ["D_EAD"])
+        # default range lookups agree with the assignment dictionary including overlapping ranges
+        self.assertEqual(cfds.getSiteId("D_1000200007"), "WWPDB_DEPLOY_PRODUCTION_RU")
+        self.assertEqual(cfds.getSiteId("D_800001"), "UNASSIGNED")
+        self.assertIsNone(cfds.getSiteId("D_5"))
+
+    def testContention(self):
+        """Benchmark concurrent single data set updates from several processes - no update may be lost."""
+        nWorkers = 6
+        nUpdates = 25
+        resultQ = multiprocessing.Queue()
+        startTime = time.time()
+        procL = [multiprocessing.Process(target=_updateWorker, args=(self.__workPath, ii, nUpdates, resultQ)) for ii in range(nWorkers)]
+        for proc in procL:
+            proc.start()
+        resultL = [resultQ.get(timeout=120) for _ in procL]
+        for proc in procL:
+            proc.join()
+        elapsed = time.time() - startTime
+        self.assertTrue(all(ok for _, ok, _ in resultL))
+        d = self.__readFile()
+        self.assertEqual(len(d), nWorkers * nUpdates)
+        for ii in range(nWorkers):
+            self.assertEqual(len(ConfigInfoDataSet().getDataSetLocations("SITE_%d" % ii)), nUpdates)
+        logger.info(
+            "%d processes x %d updates in %.3f s (%.1f updates/s, slowest worker %.3f s)",
+            nWorkers,
+            nUpdates,
+            elapsed,
+            nWorkers * nUpdates / elapsed,
+            max(t for _, _, t in resultL),
+        )
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()
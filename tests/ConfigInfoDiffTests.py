@@ -0,0 +1,64 @@
+##
+#
+# File:    ConfigInfoDiffTests.py
+# Date:    19-Oct-2026
+# Version: 0.001
+##
+"""
+Test cases for structured differences between configuration dictionaries
+
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "John Westbrook"
+__email__ = "jwest@rcsb.rutgers.edu"
+__license__ = "Apache 2.0"
+__version__ = "V0.01"
+
+import unittest
+
+from wwpdb.utils.config.ConfigInfoDiff import ConfigInfoDiff
+
+
+class ConfigInfoDiffTests(unittest.TestCase):
+    def setUp(self):
+        self.__leftD = {
+            "SITE_PREFIX": "WWPDB_DEPLOY_TEST_RU",
+            "SITE_PORT": "8080",
+            "SITE_DATASET_RANGE": (1, 10),
+            "SITE_REMOVED": "gone",
+            "OS_ENVIRONMENT": {"PATH_A": "/a", "PATH_B": "/b"},
+        }
+        self.__rightD = {
+            "SITE_PREFIX": "WWPDB_DEPLOY_PRODUCTION_RU",
+            "SITE_PORT": 8080,
+            "SITE_DATASET_RANGE": [1, 10],
+            "SITE_ADDED": "new",
+            "OS_ENVIRONMENT": {"PATH_A": "/a", "PATH_C": "/c"},
+        }
+
+    def testDiff(self):
+        diffL = ConfigInfoDiff().diff(self.__leftD, self.__rightD)
+        changeD = dict((".".join(d["path"]), d["change"]) for d in diffL)
+        self.assertEqual(changeD["SITE_PREFIX"], "modified")
+        self.assertEqual(changeD["SITE_PORT"], "type")
+        self.assertEqual(changeD["SITE_REMOVED"], "removed")
+        self.assertEqual(changeD["SITE_ADDED"], "added")
+        self.assertEqual(changeD["OS_ENVIRONMENT.PATH_B"], "removed")
+        self.assertEqual(changeD["OS_ENVIRONMENT.PATH_C"], "added")
+        # tuple and list renderings are equivalent
+        self.assertNotIn("SITE_DATASET_RANGE", changeD)
+        self.assertNotIn("OS_ENVIRONMENT.PATH_A", changeD)
+        self.assertEqual(ConfigInfoDiff.summarize(diffL), {"added": 2, "removed": 2, "modified": 1, "type": 1})
+
+    def testIdentical(self):
+        self.assertEqual(ConfigInfoDiff().diff(self.__leftD, dict(self.__leftD)), [])
+
+    def testIgnore(self):
+        diffL = ConfigInfoDiff(ignoreKeyList=["site_prefix", "site_port"]).diff(self.__leftD, self.__rightD)
+        self.assertNotIn(["SITE_PREFIX"], [d["path"] for d in diffL])
+        self.assertNotIn(["SITE_PORT"], [d["path"] for d in diffL])
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()
@@ -0,0 +1,154 @@
+##
+#
+# File:    ConfigInfoFileBenchmarks.py
+# Date:    19-Oct-2026
+# Version: 0.001
+##
+"""
+Scaling benchmarks for the configuration cache build pipeline using synthetic site configuration trees.
+
+Run (offline) from the top of the source tree -
+
+    python tests/ConfigInfoFileBenchmarks.py                          sites x options scaled by 1, 2 and 4
+    python tests/ConfigInfoFileBenchmarks.py --scales 1,4,16 --depth 8
+    python tests/ConfigInfoFileBenchmarks.py --save_baseline          record a new baseline on this host
+    python tests/ConfigInfoFileBenchmarks.py --generate /tmp/site-config --sites 40 --options 500
+
+Baselines hold absolute timings and are not part of the source tree - the first run on a host records
+the baseline (tests/ConfigInfoFileBenchmarkBaseline.json).  The exit status is 1 if any benchmark regresses
+beyond the thresholds.
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "John Westbrook"
+__email__ = "jwest@rcsb.rutgers.edu"
+__license__ = "Apache 2.0"
+__version__ = "V0.01"
+
+import logging
+import os
+import shutil
+import sys
+import tempfile
+from optparse import OptionParser  # pylint: disable=deprecated-module
+
+HERE = os.path.abspath(os.path.dirname(__file__))
+TOPDIR = os.path.dirname(HERE)
+sys.path.insert(0, TOPDIR)
+
+from tests.ConfigInfoBenchmarkRunner import ConfigInfoBenchmarkRunner  # noqa: E402
+from wwpdb.utils.config.ConfigInfoFile import ConfigInfoFile  # noqa: E402
+from wwpdb.utils.config.ConfigInfoFileExec import ConfigInfoFileExec  # noqa: E402
+from wwpdb.utils.config.ConfigInfoGenerator import ConfigInfoGenerator  # noqa: E402
+
+BASELINE_PATH = os.path.join(HERE, "ConfigInfoFileBenchmarkBaseline.json")
+
+
+def getGenerator(options, scale=1):
+    return ConfigInfoGenerator(
+        locations=options.locations,
+        sites=options.sites * scale,
+        options=options.options * scale,
+        interpolationDepth=options.depth,
+        privateSections=options.privateSections,
+        privateOptions=options.privateOptions,
+        wildcardSections=options.wildcardSections,
+        seed=options.seed,
+    )
+
+
+def addBenchmarks(bm, gen, topPath, tag):
+    """Register the cache build benchmarks for the generated tree below topPath."""
+    os.environ["TOP_WWPDB_SITE_CONFIG_DIR"] = topPath
+    fe = ConfigInfoFileExec(verbose=False, log=open(os.devnull, "w"))  # noqa: SIM115 pylint: disable=consider-using-with
+    fe.setPrivateSectionNames(gen.getPrivateSectionNames())
+    fe.addCommonSectionNames(gen.getCommonSectionNames())
+    siteLoc, siteIdL = next(iter(gen.getLocationSiteD().items()))
+    pathSectL = fe.getConfigPathSectionList(siteLoc, siteIdL[0])
+    cf = ConfigInfoFile()
+    rawD = cf.readConfigFileList(configPathSectionList=pathSectL)
+
+    def deserialize():
+        return cf.deserializeSiteConfig(rawD)
+
+    bm.add("readConfigFileList%s" % tag, lambda: cf.readConfigFileList(configPathSectionList=pathSectL))
+    bm.add("deserializeConfig%s" % tag, deserialize)
+    bm.add("writeLocationConfigCache%s" % tag, lambda: fe.writeLocationConfigCache(siteLoc))
+
+
+def printScaling(resultD, scaleL, tagD, log=sys.stdout):
+    """Report the time per operation at each scale relative to the first scale."""
+    nameL = sorted({name[: -len(tagD[scaleL[0]])] for name in resultD if name.endswith(tagD[scaleL[0]])})
+    log.write("\n%-32s %s\n" % ("scaling (time per op / first scale)", "  ".join("%10s" % ("x%d" % s) for s in scaleL)))
+    for name in nameL:
+        tL = [1.0 / resultD[name + tagD[s]]["ops"] for s in scaleL if name + tagD[s] in resultD]
+        log.write("%-32s %s\n" % (name, "  ".join("%10.2f" % (t / tL[0]) for t in tL)))
+
+
+def main():  # pragma: no cover
+    parser = OptionParser(usage="usage: %prog [options]")
+    parser.add_option("--locations", dest="locations", type="int", default=5, help="Number of locations")
+    parser.add_option("--sites", dest="sites", type="int", default=4, help="Number of sites per location")
+    parser.add_option("--options", dest="options", type="int", default=100, help="Number of options per site")
+    parser.add_option("--depth", dest="depth", type="int", default=4, help="Interpolation depth")
+    parser.add_option("--private", dest="privateSections", type="int", default=3, help="Number of private sections")
+    parser.add_option("--private_options", dest="privateOptions", type="int", default=20, help="Number of options per private section")
+    parser.add_option("--wildcard", dest="wildcardSections", type="int", default=2, help="Number of sections per wildcard pattern")
+    parser.add_option("--seed", dest="seed", type="int", default=1, help="Random seed")
+    parser.add_option("--scales", dest="scales", default="1,2,4", help="Comma separated scale factors for sites and options")
+    parser.add_option("--generate", dest="generatePath", default=None, help="Write a synthetic tree to this path and exit")
+    parser.add_option("--baseline", dest="baselinePath", default=BASELINE_PATH, help="Baseline file path")
+    parser.add_option("--save_baseline", dest="saveBaseline", action="store_true", default=False, help="Write results as baseline")
+    parser.add_option("--threshold", dest="opsThreshold", type="float", default=0.25, help="Allowed fractional loss of ops/s")
+    parser.add_option(
+        "--mem_threshold",
+        dest="memThreshold",
+        type="float",
+        default=0.5,
+        help="Allowed fractional growth of peak bytes",
+    )
+    parser.add_option("--min_time", dest="minTime", type="float", default=0.5, help="Minimum seconds per benchmark")
+    parser.add_option("--filter", dest="nameFilter", default=None, help="Run benchmarks with names containing this")
+    options, _args = parser.parse_args()
+
+    logging.getLogger("wwpdb.utils.config.ConfigInfoFile").setLevel(logging.WARNING)
+    if options.generatePath:
+        sD = getGenerator(options).generate(options.generatePath)
+        sys.stdout.write("generated %r\n" % sD)
+        return 0
+
+    scaleL = [int(s) for s in options.scales.split(",")]
+    tagD = {s: "[x%d]" % s for s in scaleL}
+    workPath = tempfile.mkdtemp()
+    try:
+        resultD = {}
+        for scale in scaleL:
+            gen = getGenerator(options, scale)
+            topPath = os.path.join(workPath, "x%d" % scale)
+            sD = gen.generate(topPath)
+            sys.stdout.write("scale x%d - %d sites %d files %d options\n" % (scale, sD["sites"], sD["files"], sD["options"]))
+            bm = ConfigInfoBenchmarkRunner(minTime=options.minTime)
+            addBenchmarks(bm, gen, topPath, tagD[scale])
+            resultD.update(bm.run(nameFilter=options.nameFilter))
+    finally:
+        shutil.rmtree(workPath, ignore_errors=True)
+    printScaling(resultD, scaleL, tagD)
+
+    if options.saveBaseline:
+        bm.writeBaseline(options.baselinePath, resultD)
+        sys.stdout.write("baseline written to %s\n" % options.baselinePath)
+        return 0
+    baseD = bm.readBaseline(options.baselinePath)
+    if baseD is None:
+        # baselines are host specific and are recorded by the first run on each host
+        bm.writeBaseline(options.baselinePath, resultD)
+        sys.stdout.write("no baseline - results recorded as the baseline for this host in %s\n" % options.baselinePath)
+        return 0
+    regressionL = bm.compare(resultD, baseD, opsThreshold=options.opsThreshold, memThreshold=options.memThreshold)
+    for msg in regressionL:
+        sys.stdout.write("REGRESSION %s\n" % msg)
+    return 1 if regressionL else 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    sys.exit(main())
@@ -0,0 +1,107 @@
+##
+#
+# File:    ConfigInfoFileDeserializeTests.py
+# Date:    19-Oct-2026
+# Version: 0.001
+##
+"""
+Test cases for compiled deserialization filter plans and the shared value memo
+
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "John Westbrook"
+__email__ = "jwest@rcsb.rutgers.edu"
+__license__ = "Apache 2.0"
+__version__ = "V0.01"
+
+import logging
+import unittest
+
+from wwpdb.utils.config.ConfigInfoFile import ConfigInfoFile
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s]-%(module)s.%(funcName)s: %(message)s")
+logger = logging.getLogger()
+
+
+class ConfigInfoFileDeserializeTests(unittest.TestCase):
+    def setUp(self):
+        self.__rawD = {
+            "CONFIG_AS_INT": "SITE_PORT, SITE_COUNT",
+            "Config_As_Float": "SITE_RATIO",
+            "config_csv_as_list": "SITE_HOSTS",
+            "CONFIG_CSV_AS_INT_LIST": "SITE_IDS",
+            "CONFIG_AS_OBJECT": "SITE_MAP, SITE_BAD",
+            "SITE_PORT": "8080",
+            "SITE_RATIO": "0.5",
+            "SITE_HOSTS": "a, b",
+            "SITE_IDS": "1, 2",
+            "SITE_MAP": "{'k': (1, 2)}",
+            "SITE_BAD": "bad(",
+            "SITE_NONE": "None",
+            "SITE_SECTION": {"SITE_COUNT": "3", "SITE_HOSTS": "c", "SITE_OTHER": "None"},
+        }
+
+    def testFilterPlan(self):
+        cf = ConfigInfoFile()
+        plan = cf.compileFilterPlan(self.__rawD)
+        self.assertEqual(plan["SITE_PORT"], ("int",))
+        self.assertEqual(plan["SITE_RATIO"], ("float",))
+        self.assertEqual(plan["SITE_HOSTS"], ("csv_list",))
+        self.assertEqual(plan["SITE_IDS"], ("int_list",))
+        self.assertEqual(plan["SITE_MAP"], ("object",))
+        # plans are reused for the same selector values
+        self.assertIs(cf.compileFilterPlan(dict(self.__rawD)), plan)
+        self.assertEqual(cf.compileFilterPlan(None), {})
+        cD = cf.deserializeConfig(self.__rawD, plan=plan)
+        self.assertEqual(cD, cf.deserializeConfig(self.__rawD, optionD=self.__rawD))
+        self.assertEqual(
+            (cD["SITE_PORT"], cD["SITE_RATIO"], cD["SITE_HOSTS"], cD["SITE_IDS"], cD["SITE_MAP"]),
+            (8080, 0.5, ["a", "b"], [1, 2], {"k": (1, 2)}),
+        )
+        self.assertEqual(cD["SITE_BAD"], "bad(")
+        self.assertIsNone(cD["SITE_NONE"])
+        self.assertEqual(cD["SITE_SECTION"], self.__rawD["SITE_SECTION"])
+
+    def testSiteConfig(self):
+        cf = ConfigInfoFile()
+        cD = cf.deserializeSiteConfig(self.__rawD)
+        # sections are filtered with the selectors of the top-level options
+        self.assertEqual(cD["SITE_SECTION"], {"SITE_COUNT": 3, "SITE_HOSTS": ["c"], "SITE_OTHER": None})
+        self.assertEqual(cD["SITE_PORT"], 8080)
+        expectedD = cf.deserializeConfig(self.__rawD, optionD=self.__rawD)
+        expectedD["SITE_SECTION"] = cf.deserializeConfig(self.__rawD["SITE_SECTION"], optionD=expectedD)
+        self.assertEqual(cD, expectedD)
+        # converted selector options are used as deserialized for the sections
+        rawD = {"CONFIG_AS_INT": "None", "SITE_SECTION": {"SITE_COUNT": "3"}}
+        self.assertEqual(cf.deserializeSiteConfig(rawD), {"CONFIG_AS_INT": None, "SITE_SECTION": {}})
+        # a failing int filter stops filtering as for deserializeConfig()
+        rawD = {"CONFIG_AS_INT": "SITE_PORT", "SITE_SECTION": {"SITE_PORT": "1"}, "SITE_PORT": "x", "SITE_LAST": "None"}
+        self.assertEqual(
+            cf.deserializeSiteConfig(rawD),
+            {"CONFIG_AS_INT": "SITE_PORT", "SITE_SECTION": {"SITE_PORT": 1}, "SITE_PORT": "x"},
+        )
+
+    def testMemo(self):
+        memoD = {}
+        siteL = []
+        for siteId in ("A", "B"):
+            # separate string instances as returned by the configuration file parser for each site
+            rawD = {"".join(list(k)): "".join(list(v)) if isinstance(v, str) else v for k, v in self.__rawD.items()}
+            rawD["SITE_NAME"] = siteId
+            siteL.append(ConfigInfoFile().deserializeSiteConfig(rawD, memoD=memoD))
+        aD, bD = siteL[0], siteL[1]
+        self.assertEqual(aD, dict(ConfigInfoFile().deserializeSiteConfig(self.__rawD), SITE_NAME="A"))
+        self.assertEqual(bD["SITE_NAME"], "B")
+        # converted values and repeated strings are shared across sites
+        self.assertIs(aD["SITE_MAP"], bD["SITE_MAP"])
+        self.assertIs(aD["SITE_HOSTS"], bD["SITE_HOSTS"])
+        self.assertIs(aD["SITE_BAD"], bD["SITE_BAD"])
+        self.assertIs(next(k for k in aD if k == "SITE_PORT"), next(k for k in bD if k == "SITE_PORT"))
+        self.assertEqual(memoD[("object", "{'k': (1, 2)}")], {"k": (1, 2)})
+        # failed conversions are not memoized
+        self.assertNotIn(("object", "bad("), memoD)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()
@@ -64,6 +64,25 @@ class ConfigInfoFileExecTests(unittest.TestCase):
         # Test coverage
         cif.printConfig("rcsb-east", "WWPDB_DEPLOY_TEST")
 
+    def testProvenance(self):
+        """Test provenance of resolved options"""
+        cif = ConfigInfoFileExec(mockTopPath=mockTopPath)
+        pD = cif.getProvenance("rcsb-east", "WWPDB_DEPLOY_TEST")
+        self.assertIn("VARTEST", pD)
+        self.assertTrue(pD["VARTEST"]["file"].endswith(".cfg"))
+        self.assertIsNotNone(pD["VARTEST"]["line"])
+        self.assertIsInstance(pD["VARTEST"]["interpolation"], list)
+        # Test coverage
+        cif.printProvenance("rcsb-east", "WWPDB_DEPLOY_TEST", keyWord="VARTEST")
+
+    def testDiffConfig(self):
+        """Test comparison of site configurations"""
+        cif = ConfigInfoFileExec(mockTopPath=mockTopPath)
+        diffL = cif.diffConfig("rcsb-east", "WWPDB_DEPLOY_TEST", "rcsb-east", "WWPDB_DEPLOY_TEST")
+        self.assertEqual(diffL, [])
+        # Test coverage
+        cif.printDiff(diffL)
+
     def testWriteConfig(self):
         """Test writing config file"""
         subtestdir = os.path.join(TESTOUTPUT, "testconfig")
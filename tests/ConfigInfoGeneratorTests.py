@@ -0,0 +1,100 @@
+##
+#
+# File:    ConfigInfoGeneratorTests.py
+# Date:    19-Oct-2026
+# Version: 0.001
+##
+"""
+Test cases for synthetic site configuration trees and their cache build
+
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "John Westbrook"
+__email__ = "jwest@rcsb.rutgers.edu"
+__license__ = "Apache 2.0"
+__version__ = "V0.01"
+
+import filecmp
+import json
+import logging
+import os
+import shutil
+import tempfile
+import unittest
+
+from wwpdb.utils.config.ConfigInfoFileExec import ConfigInfoFileExec
+from wwpdb.utils.config.ConfigInfoGenerator import ConfigInfoGenerator
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s]-%(module)s.%(funcName)s: %(message)s")
+logger = logging.getLogger()
+
+
+class ConfigInfoGeneratorTests(unittest.TestCase):
+    def setUp(self):
+        self.__workPath = tempfile.mkdtemp()
+        self.__topSave = os.environ.get("TOP_WWPDB_SITE_CONFIG_DIR")
+
+    def tearDown(self):
+        if self.__topSave is None:
+            os.environ.pop("TOP_WWPDB_SITE_CONFIG_DIR", None)
+        else:
+            os.environ["TOP_WWPDB_SITE_CONFIG_DIR"] = self.__topSave
+        shutil.rmtree(self.__workPath, ignore_errors=True)
+
+    def testGenerate(self):
+        gen = ConfigInfoGenerator(locations=6, sites=2, options=24, interpolationDepth=3, wildcardSections=2)
+        locSiteD = gen.getLocationSiteD()
+        self.assertEqual(len(locSiteD), 6)
+        self.assertIn("LOCATION-5", locSiteD)
+        topPath = os.path.join(self.__workPath, "a")
+        sD = gen.generate(topPath)
+        self.assertEqual(sD["locations"], 6)
+        self.assertEqual(sD["sites"], 12)
+        self.assertEqual(sD["files"], 1 + 6 + 12)
+        self.assertTrue(os.access(os.path.join(topPath, "pdbe", "wwpdb_synth_pdbe_001", "site.cfg"), os.R_OK))
+        # output is determined by the parameters and seed
+        otherPath = os.path.join(self.__workPath, "b")
+        ConfigInfoGenerator(locations=6, sites=2, options=24, interpolationDepth=3, wildcardSections=2).generate(otherPath)
+        for relPath in ["common/common.cfg", "pdbj/site_common/common.cfg", "pdbj/wwpdb_synth_pdbj_000/site.cfg"]:
+            self.assertTrue(filecmp.cmp(os.path.join(topPath, relPath), os.path.join(otherPath, relPath), shallow=False))
+
+    def testCacheBuild(self):
+        gen = ConfigInfoGenerator(locations=2, sites=3, options=24, interpolationDepth=3, wildcardSections=2)
+        gen.generate(self.__workPath)
+        os.environ["TOP_WWPDB_SITE_CONFIG_DIR"] = self.__workPath
+        fe = ConfigInfoFileExec(verbose=False)
+        fe.setPrivateSectionNames(gen.getPrivateSectionNames())
+        fe.addCommonSectionNames(gen.getCommonSectionNames())
+        self.assertTrue(fe.writeLocationConfigCache("rcsb-west"))
+        siteId = "WWPDB_SYNTH_RCSB_WEST_002"
+        with open(os.path.join(self.__workPath, "rcsb-west", siteId.lower(), "ConfigInfoFileCache.json")) as ifh:
+            cD = json.load(ifh)[siteId]
+        # interpolation chains are resolved in order of site, location and project files
+        self.assertEqual(cD["SITE_PATH_3"], "/net/rcsb-west/%s/level_1/level_2/level_3" % siteId.lower())
+        self.assertEqual(cD["LOC_PATH_3"], "/net/rcsb-west/level_1/level_2/level_3")
+        self.assertEqual(cD["TOP_PATH_3"], "/net/wwpdb_synthetic/level_1/level_2/level_3")
+        self.assertEqual(cD["SITE_PREFIX"], siteId)
+        self.assertEqual(cD["SITE_LOCATION_SITE_DICT"], gen.getLocationSiteD())
+        # selectors cast the typed options
+        self.assertIsInstance(cD["SITE_OPT_0002"], int)
+        self.assertIsInstance(cD["SITE_OPT_0004"], list)
+        self.assertIsInstance(cD["COMMON_OPT_0008"], dict)
+        self.assertIsInstance(cD["COMMON_OPT_0009"], float)
+        self.assertIsNone(cD["SITE_OPT_0010"])
+        # site options override common options
+        self.assertTrue(cD["COMMON_OPT_0000"].startswith("/net/rcsb-west/%s" % siteId.lower()))
+        for sectionName in [
+            "OS_ENVIRONMENT",
+            "HTTPD_SERVICES",
+            "BACKUP_SERVER_2",
+            "TEST_SETUP_1",
+            "HOST_SITE_DEFAULTS",
+        ]:
+            self.assertIsInstance(cD[sectionName], dict)
+            self.assertGreater(len(cD[sectionName]), 0)
+        self.assertNotIn("%(", json.dumps(cD))
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()
@@ -0,0 +1,76 @@
+##
+#
+# File:    ConfigInfoIdRangeTests.py
+# Date:    19-Oct-2026
+# Version: 0.001
+##
+"""
+Test cases for the interval index and analysis of data set identifier range assignments
+
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "John Westbrook"
+__email__ = "jwest@rcsb.rutgers.edu"
+__license__ = "Apache 2.0"
+__version__ = "V0.01"
+
+import random
+import unittest
+
+from wwpdb.utils.config.ConfigInfoData import ConfigInfoData
+from wwpdb.utils.config.ConfigInfoIdRange import ConfigInfoIdRange
+
+
+class ConfigInfoIdRangeTests(unittest.TestCase):
+    def setUp(self):
+        self.__assignD = {
+            "SITE_A": (100, 199),
+            "SITE_B": (150, 249),
+            "SITE_C": (100, 199),
+            "SITE_D": (120, 130),
+            "UNASSIGNED": (0, 99),
+            "SITE_E": (300, 399),
+            "SITE_F": (10, 5),
+        }
+
+    @staticmethod
+    def __getSiteId(assignD, idVal):
+        """Sequential search as used by the data set and group data set accessors."""
+        for ky, (idMin, idMax) in assignD.items():
+            if idMin <= idVal <= idMax:
+                return ky
+        return None
+
+    def testLookup(self):
+        rI = ConfigInfoIdRange(self.__assignD)
+        for idVal in range(-5, 450):
+            self.assertEqual(rI.getSiteId(idVal), self.__getSiteId(self.__assignD, idVal), idVal)
+        self.assertEqual(rI.getSegments(), [(0, 99, "UNASSIGNED"), (100, 199, "SITE_A"), (200, 249, "SITE_B"), (300, 399, "SITE_E")])
+
+    def testLookupAssignments(self):
+        cD = ConfigInfoData(verbose=False, useCache=False).getConfigDictionary()
+        for assignD in [
+            cD["SITE_DATASET_ID_ASSIGNMENT_DICTIONARY"],
+            cD["SITE_DATASET_TEST_ID_ASSIGNMENT_DICTIONARY"],
+            cD["SITE_GROUP_DATASET_ID_ASSIGNMENT_DICTIONARY"],
+        ]:
+            rI = ConfigInfoIdRange(assignD)
+            idL = [t + d for rng in assignD.values() for t in rng for d in (-1, 0, 1)]
+            idL += [random.randint(0, 10000000000) for _ in range(2000)]  # noqa: S311
+            for idVal in idL:
+                self.assertEqual(rI.getSiteId(idVal), self.__getSiteId(assignD, idVal), idVal)
+
+    def testAnalyze(self):
+        aD = ConfigInfoIdRange(self.__assignD).analyze()
+        self.assertEqual(aD["ranges"], 6)
+        self.assertEqual(aD["invalid"], [("SITE_F", (10, 5))])
+        self.assertEqual(aD["aliases"], [("SITE_C", "SITE_A", 100, 199)])
+        self.assertEqual(aD["overlaps"], [("SITE_D", "SITE_A", 120, 130, "SITE_A"), ("SITE_B", "SITE_A", 150, 199, "SITE_A")])
+        self.assertEqual(aD["shadowed"], ["SITE_D"])
+        self.assertEqual(aD["gaps"], [(250, 299)])
+        self.assertEqual(aD["unassigned"], [(0, 99)])
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()
@@ -0,0 +1,78 @@
+##
+#
+# File:    ConfigInfoImportTimeTests.py
+# Date:    19-Oct-2026
+# Version: 0.001
+##
+"""
+Test cases guarding the import footprint of the configuration modules
+
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "John Westbrook"
+__email__ = "jwest@rcsb.rutgers.edu"
+__license__ = "Apache 2.0"
+__version__ = "V0.01"
+
+import json
+import logging
+import os
+import subprocess
+import sys
+import unittest
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s]-%(module)s.%(funcName)s: %(message)s")
+logger = logging.getLogger()
+
+HERE = os.path.abspath(os.path.dirname(__file__))
+TOPDIR = os.path.dirname(HERE)
+
+# Modules with a large import footprint which must only be imported on demand
+DEFERRED_MODULE_PREFIXES = ("oslo_", "oslo.", "ssl", "urllib.request", "http.client")
+
+# Imports the input module in a fresh interpreter and reports the modules loaded and the elapsed time
+IMPORT_SCRIPT = """
+import json, sys, time
+tS = time.time()
+__import__(sys.argv[1])
+sys.stdout.write(json.dumps({"seconds": time.time() - tS, "modules": sorted(sys.modules)}))
+"""
+
+
+class ConfigInfoImportTimeTests(unittest.TestCase):
+    def __importModule(self, moduleName):
+        """Return (seconds, [module names loaded]) for importing the input module in a fresh interpreter."""
+        env = dict(os.environ)
+        env["PYTHONPATH"] = os.pathsep.join([TOPDIR, env.get("PYTHONPATH", "")])
+        pr = subprocess.Popen(  # noqa: S603
+            [sys.executable, "-c", IMPORT_SCRIPT, moduleName],
+            cwd=TOPDIR,
+            env=env,
+            stdout=subprocess.PIPE,
+            universal_newlines=True,
+        )
+        out, _ = pr.communicate()
+        self.assertEqual(pr.returncode, 0)
+        rD = json.loads(out)
+        return rD["seconds"], rD["modules"]
+
+    def testDeferredImports(self):
+        _, baseL = self.__importModule("os")
+        for moduleName in [
+            "ConfigInfo",
+            "ConfigInfoApp",
+            "ConfigInfoDataSet",
+            "ConfigInfoSiteAccess",
+            "ConfigInfoGroupDataSet",
+        ]:
+            seconds, moduleL = self.__importModule("wwpdb.utils.config.%s" % moduleName)
+            # timing is informational only - an absolute budget is not reliable on shared hosts
+            logger.info("%s imported in %.1f ms", moduleName, seconds * 1000.0)
+            newL = sorted(set(moduleL) - set(baseL))
+            deferredL = [t for t in newL if t.startswith(DEFERRED_MODULE_PREFIXES)]
+            self.assertEqual(deferredL, [], "%s imports %r" % (moduleName, deferredL))
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()
@@ -0,0 +1,146 @@
+##
+#
+# File:    ConfigInfoPreloadTests.py
+# Date:    19-Oct-2026
+# Version: 0.001
+##
+"""
+Test cases for pre-fork configuration warm-up and per-worker memory sharing
+
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "John Westbrook"
+__email__ = "jwest@rcsb.rutgers.edu"
+__license__ = "Apache 2.0"
+__version__ = "V0.01"
+
+import gc
+import json
+import logging
+import os
+import subprocess
+import sys
+import unittest
+
+from wwpdb.utils.config.ConfigInfo import ConfigInfo
+from wwpdb.utils.config.ConfigInfoData import ConfigInfoData
+from wwpdb.utils.config.ConfigInfoPreload import ConfigInfoPreload
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s]-%(module)s.%(funcName)s: %(message)s")
+logger = logging.getLogger()
+
+HERE = os.path.abspath(os.path.dirname(__file__))
+TOPDIR = os.path.dirname(HERE)
+SITE_ID = "WWPDB_DEPLOY_PRELOAD_TEST"
+
+# Forks workers from a master holding a large site configuration (optionally preloaded and frozen) and
+# reports the growth of each worker's unique set size (private clean + dirty pages) over a configuration lookup
+# and a garbage collection.
+WORKER_SCRIPT = """
+import gc, json, os, sys
+from wwpdb.utils.config.ConfigInfo import ConfigInfo
+from wwpdb.utils.config.ConfigInfoData import ConfigInfoData
+from wwpdb.utils.config.ConfigInfoPreload import ConfigInfoPreload
+
+siteId = "%s"
+cD = {"SITE_PREFIX": siteId}
+for i in range(100000):
+    cD["SITE_OPT_%%06d" %% i] = ["/net/wwpdb/site/path_%%d" %% i, "/net/wwpdb/site/alt_path_%%d" %% i]
+ConfigInfoData.registerSiteConfig(siteId, cD)
+del cD
+if sys.argv[1] == "preload":
+    ConfigInfoPreload.preload([siteId], apps=False)
+
+
+def getUniqueKb():
+    with open("/proc/self/smaps_rollup") as ifh:
+        return sum(int(line.split()[1]) for line in ifh if line.startswith(("Private_Clean:", "Private_Dirty:")))
+
+
+growthL = []
+for _ in range(2):
+    rfd, wfd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        os.close(rfd)
+        uS = getUniqueKb()
+        ConfigInfo(siteId=siteId).get("SITE_OPT_000001")
+        gc.collect()
+        os.write(wfd, str(getUniqueKb() - uS).encode())
+        os._exit(0)
+    os.close(wfd)
+    growthL.append(int(os.read(rfd, 64)))
+    os.close(rfd)
+    os.waitpid(pid, 0)
+print(json.dumps(growthL))
+"""
+
+
+class ConfigInfoPreloadTests(unittest.TestCase):
+    def tearDown(self):
+        ConfigInfoData.unregisterSiteConfig(SITE_ID)
+
+    def testPreload(self):
+        ConfigInfoData.registerSiteConfig(
+            SITE_ID,
+            {
+                "SITE_PREFIX": SITE_ID,
+                "RO_RESOURCE_PATH": "/net/wwpdb/resources",
+                "REFERENCE_PATH": "/net/wwpdb/reference",
+                "SITE_LOCAL_APPS_PATH": "/net/wwpdb/apps",
+            },
+        )
+        rD = ConfigInfoPreload.preload([SITE_ID, "WWPDB_DEPLOY_PRELOAD_MISSING"], freeze=False)
+        self.assertEqual(rD[SITE_ID]["options"], 4)
+        self.assertGreater(rD[SITE_ID]["accessors"], 50)
+        self.assertIsInstance(rD[SITE_ID]["failed"], list)
+        self.assertEqual(rD["WWPDB_DEPLOY_PRELOAD_MISSING"]["options"], 0)
+        self.assertIn(SITE_ID, ConfigInfoPreload.getPreloadedSiteIds())
+        self.assertEqual(ConfigInfo(siteId=SITE_ID).get("REFERENCE_PATH"), "/net/wwpdb/reference")
+        # preloaded sites share a single configuration dictionary
+        d1 = ConfigInfoData(siteId=SITE_ID).getConfigDictionary()
+        self.assertIs(ConfigInfoData(siteId=SITE_ID).getConfigDictionary(), d1)
+        self.assertEqual(ConfigInfoData.preloadSiteConfig(SITE_ID), 4)
+        # registering another dictionary supersedes the preloaded dictionary
+        ConfigInfoData.registerSiteConfig(SITE_ID, {"SITE_PREFIX": SITE_ID})
+        d2 = ConfigInfoData(siteId=SITE_ID).getConfigDictionary()
+        self.assertIsNot(d2, d1)
+        self.assertNotIn("REFERENCE_PATH", d2)
+        # class-level content type definitions are built once and shared by all instances
+        self.assertIs(d1["CONTENT_TYPE_DICTIONARY"], d2["CONTENT_TYPE_DICTIONARY"])
+        # the archive milestone list is not shared between configuration dictionaries
+        self.assertEqual(d1["CONTENT_MILESTONE_ARCHIVE_LIST"], d2["CONTENT_MILESTONE_ARCHIVE_LIST"])
+        self.assertIsNot(d1["CONTENT_MILESTONE_ARCHIVE_LIST"], d2["CONTENT_MILESTONE_ARCHIVE_LIST"])
+        # instances for a registered dictionary share a single copy extended with the class-level options
+        self.assertIs(ConfigInfoData(siteId=SITE_ID).getConfigDictionary(), d2)
+        self.assertNotIn("CONTENT_TYPE_DICTIONARY", ConfigInfoData.getRegisteredSiteConfig(SITE_ID))
+        self.assertIn("model-upload", d1["CONTENT_TYPE_DICTIONARY"])
+        self.assertNotIn("upload-convert", d1["CONTENT_MILESTONE_ARCHIVE_LIST"])
+
+    @unittest.skipUnless(
+        hasattr(gc, "freeze") and hasattr(os, "fork") and os.path.exists("/proc/self/smaps_rollup"),
+        "requires gc.freeze(), fork() and /proc/self/smaps_rollup",
+    )
+    def testWorkerMemory(self):
+        """Workers forked from a preloaded master keep the configuration pages shared."""
+        env = dict(os.environ)
+        env["PYTHONPATH"] = os.pathsep.join([TOPDIR, env.get("PYTHONPATH", "")])
+        growthD = {}
+        for mode in ["plain", "preload"]:
+            pr = subprocess.Popen(  # noqa: S603
+                [sys.executable, "-c", WORKER_SCRIPT % SITE_ID, mode],
+                cwd=TOPDIR,
+                env=env,
+                stdout=subprocess.PIPE,
+                universal_newlines=True,
+            )
+            out, _ = pr.communicate()
+            self.assertEqual(pr.returncode, 0)
+            growthD[mode] = json.loads(out)
+            logger.info("%s master - per-worker unique memory growth (kB) %r", mode, growthD[mode])
+        self.assertLess(max(growthD["preload"]), min(growthD["plain"]) / 2)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()
@@ -0,0 +1,146 @@
+##
+#
+# File:    ConfigInfoProfilerTests.py
+# Date:    19-Oct-2026
+# Version: 0.001
+##
+"""
+Test cases for the configuration lookup profiler
+
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "John Westbrook"
+__email__ = "jwest@rcsb.rutgers.edu"
+__license__ = "Apache 2.0"
+__version__ = "V0.01"
+
+import io
+import json
+import logging
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+import warnings
+
+from wwpdb.utils.config.ConfigInfo import ConfigInfo
+from wwpdb.utils.config.ConfigInfoApp import ConfigInfoAppBase, ConfigInfoAppCc
+from wwpdb.utils.config.ConfigInfoData import ConfigInfoData
+from wwpdb.utils.config.ConfigInfoProfiler import ConfigInfoProfiler
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s]-%(module)s.%(funcName)s: %(message)s")
+logger = logging.getLogger()
+
+HERE = os.path.abspath(os.path.dirname(__file__))
+TOPDIR = os.path.dirname(HERE)
+SITE_ID = "WWPDB_DEPLOY_PROFILE_TEST"
+
+
+class ConfigInfoProfilerTests(unittest.TestCase):
+    def setUp(self):
+        self.__workPath = tempfile.mkdtemp()
+        ConfigInfoData.registerSiteConfig(
+            SITE_ID,
+            {
+                "SITE_PREFIX": SITE_ID,
+                "SITE_PACKAGES_PATH": "/opt/packages",
+                "SITE_NONE_OPT": None,
+                "SITE_CC_DICT_PATH": None,
+            },
+        )
+        ConfigInfoProfiler.reset()
+
+    def tearDown(self):
+        ConfigInfoProfiler.disable()
+        ConfigInfoProfiler.reset()
+        ConfigInfoData.unregisterSiteConfig(SITE_ID)
+        shutil.rmtree(self.__workPath, ignore_errors=True)
+
+    def __getCounts(self):
+        return {(d["accessor"], d["key"]): (d["hits"], d["misses"], d["defaults"]) for d in ConfigInfoProfiler.getReport()}
+
+    def testProfile(self):
+        getFunc = ConfigInfo.get
+        getValueFunc = ConfigInfoAppBase._getValue  # pylint: disable=protected-access
+        cI = ConfigInfo(siteId=SITE_ID)
+        cI.get("SITE_PREFIX")
+        self.assertEqual(ConfigInfoProfiler.getReport(), [])
+        self.assertFalse(ConfigInfoProfiler.isEnabled())
+        ConfigInfoProfiler.enable(atExit=False)
+        self.assertTrue(ConfigInfoProfiler.isEnabled())
+        cIApp = ConfigInfoAppCc(siteId=SITE_ID)
+        for _ in range(3):
+            self.assertEqual(cI.get("SITE_PREFIX"), SITE_ID)
+        self.assertIsNone(cI.get("SITE_MISSING_OPT"))
+        self.assertEqual(cI.get("SITE_MISSING_OPT", "x"), "x")
+        self.assertIsNone(cI.get("SITE_NONE_OPT", "x"))
+        self.assertTrue(cIApp.get_extended_ccd_supp())
+        with warnings.catch_warnings(record=True) as wL:
+            warnings.simplefilter("always")
+            self.assertEqual(cIApp.get_site_packages_path(), "/opt/packages")
+            self.assertEqual(cIApp.get_site_cc_dict_path(), os.path.join("components", "cc-dict"))
+        # the deprecation warning is still attributed to the caller of the accessor
+        self.assertEqual(len(wL), 1)
+        self.assertEqual(wL[0].filename, __file__)
+        cD = self.__getCounts()
+        self.assertEqual(cD[("get", "SITE_PREFIX")], (3, 0, 0))
+        self.assertEqual(cD[("get", "SITE_MISSING_OPT")], (0, 1, 1))
+        # a key present with the value None is counted as absent by ConfigInfo.get() and the accessors
+        self.assertEqual(cD[("get", "SITE_NONE_OPT")], (0, 0, 1))
+        self.assertEqual(cD[("_getValue", "EXTENDED_CCD_SUPPORT")], (0, 0, 1))
+        self.assertEqual(cD[("_getlegacy", "SITE_PACKAGES_PATH")], (1, 0, 0))
+        self.assertEqual(cD[("_getlegacy", "SITE_CC_DICT_PATH")], (0, 0, 1))
+        # lookups within the accessors are counted once under the accessor
+        self.assertNotIn(("get", "EXTENDED_CCD_SUPPORT"), cD)
+        # direct ConfigInfo lookups by the accessors are attributed to the application module
+        self.assertEqual(cD[("get", "SITE_LOCAL_APPS_PATH")], (0, 1, 0))
+        rL = ConfigInfoProfiler.getReport()
+        self.assertEqual(rL[0]["key"], "SITE_PREFIX")
+        self.assertEqual(rL[0]["callers"], [[__name__, 3]])
+        ofh = io.StringIO()
+        ConfigInfoProfiler.writeReport(ofh)
+        self.assertIn("SITE_PREFIX", ofh.getvalue())
+        ConfigInfoProfiler.disable()
+        self.assertIs(ConfigInfo.get, getFunc)
+        self.assertIs(ConfigInfoAppBase._getValue, getValueFunc)  # pylint: disable=protected-access
+        cI.get("SITE_PREFIX")
+        self.assertEqual(self.__getCounts()[("get", "SITE_PREFIX")], (3, 0, 0))
+
+    def testEnvironment(self):
+        """Profiling enabled from the environment reports on a signal and at exit."""
+        reportPath = os.path.join(self.__workPath, "profile-{pid}.json")
+        script = "\n".join(
+            [
+                "import os, signal, json",
+                "from wwpdb.utils.config.ConfigInfoData import ConfigInfoData",
+                "from wwpdb.utils.config.ConfigInfo import ConfigInfo",
+                "ConfigInfoData.registerSiteConfig('%s', {'SITE_PREFIX': 'P'})" % SITE_ID,
+                "cI = ConfigInfo(siteId='%s')" % SITE_ID,
+                "cI.get('SITE_PREFIX')",
+                "os.kill(os.getpid(), signal.SIGUSR1)",
+                "fp = %r.replace('{pid}', str(os.getpid()))" % reportPath,
+                "print(len(json.load(open(fp))['lookups']))",
+                "cI.get('SITE_PREFIX')",
+                "cI.get('SITE_OTHER', 1)",
+                "print(fp)",
+            ]
+        )
+        env = dict(os.environ)
+        env["PYTHONPATH"] = os.pathsep.join([TOPDIR, env.get("PYTHONPATH", "")])
+        env["WWPDB_CONFIG_PROFILE"] = reportPath
+        pr = subprocess.Popen([sys.executable, "-c", script], cwd=TOPDIR, env=env, stdout=subprocess.PIPE, universal_newlines=True)  # noqa: S603
+        out, _ = pr.communicate()
+        self.assertEqual(pr.returncode, 0)
+        nLookups, filePath = out.split()
+        self.assertEqual(nLookups, "1")
+        with open(filePath) as ifh:
+            rD = json.load(ifh)
+        self.assertEqual([(d["key"], d["hits"], d["defaults"]) for d in rD["lookups"]], [("SITE_PREFIX", 2, 0), ("SITE_OTHER", 0, 1)])
+        self.assertEqual(rD["lookups"][0]["callers"], [["__main__", 2]])
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()
@@ -0,0 +1,119 @@
+##
+#
+# File:    ConfigInfoSchemaTests.py
+# Date:    19-Oct-2026
+# Version: 0.001
+##
+"""
+Test cases for typed configuration options applied at cache build time
+
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "John Westbrook"
+__email__ = "jwest@rcsb.rutgers.edu"
+__license__ = "Apache 2.0"
+__version__ = "V0.01"
+
+import io
+import json
+import logging
+import os
+import shutil
+import tempfile
+import unittest
+
+from wwpdb.utils.config.ConfigInfoApp import ConfigInfoAppCc, ConfigInfoAppCommon
+from wwpdb.utils.config.ConfigInfoData import ConfigInfoData
+from wwpdb.utils.config.ConfigInfoFileExec import ConfigInfoFileExec
+from wwpdb.utils.config.ConfigInfoGenerator import ConfigInfoGenerator
+from wwpdb.utils.config.ConfigInfoSchema import ConfigInfoSchema
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s]-%(module)s.%(funcName)s: %(message)s")
+logger = logging.getLogger()
+
+SITE_ID = "WWPDB_DEPLOY_SCHEMA_TEST"
+
+
+class ConfigInfoSchemaTests(unittest.TestCase):
+    def setUp(self):
+        self.__workPath = tempfile.mkdtemp()
+        self.__topSave = os.environ.get("TOP_WWPDB_SITE_CONFIG_DIR")
+
+    def tearDown(self):
+        ConfigInfoData.unregisterSiteConfig(SITE_ID)
+        if self.__topSave is None:
+            os.environ.pop("TOP_WWPDB_SITE_CONFIG_DIR", None)
+        else:
+            os.environ["TOP_WWPDB_SITE_CONFIG_DIR"] = self.__topSave
+        shutil.rmtree(self.__workPath, ignore_errors=True)
+
+    def testApply(self):
+        schema = ConfigInfoSchema(schemaD={"SITE_PORT": "int", "SITE_RATIO": "float", "SITE_HOSTS": "csv_list", "SITE_IDS": "int_list"})
+        cD = {
+            "EXTENDED_CCD_SUPPORT": "on",
+            "FILE_ACTIVITY_DB_SUPPORT": None,
+            "SITE_PORT": "8080",
+            "SITE_RATIO": 0.5,
+            "SITE_HOSTS": "a, b",
+            "SITE_IDS": "1,x",
+            "SITE_OTHER": "on",
+        }
+        tD, errorL = schema.apply(cD)
+        self.assertIs(tD["EXTENDED_CCD_SUPPORT"], True)
+        self.assertIsNone(tD["FILE_ACTIVITY_DB_SUPPORT"])
+        self.assertEqual(tD["SITE_PORT"], 8080)
+        self.assertEqual(tD["SITE_RATIO"], 0.5)
+        self.assertEqual(tD["SITE_HOSTS"], ["a", "b"])
+        self.assertEqual(tD["SITE_IDS"], "1,x")
+        self.assertEqual(tD["SITE_OTHER"], "on")
+        self.assertEqual(len(errorL), 1)
+        self.assertTrue(errorL[0].startswith("SITE_IDS:"))
+        self.assertEqual(cD["EXTENDED_CCD_SUPPORT"], "on")
+        # unrecognized bool values are cast to False as by the runtime accessors
+        tD, errorL = schema.apply({"EXTENDED_CCD_SUPPORT": "yes", "FILE_ACTIVITY_DB_SUPPORT": "Off"})
+        self.assertEqual((tD["EXTENDED_CCD_SUPPORT"], tD["FILE_ACTIVITY_DB_SUPPORT"]), (False, False))
+        self.assertEqual(len(errorL), 1)
+        with self.assertRaises(ValueError):
+            ConfigInfoSchema(schemaD={"SITE_PORT": "integer"})
+
+    def testCacheBuild(self):
+        gen = ConfigInfoGenerator(locations=1, sites=1, options=8, interpolationDepth=2)
+        gen.generate(self.__workPath)
+        os.environ["TOP_WWPDB_SITE_CONFIG_DIR"] = self.__workPath
+        siteLoc = next(iter(gen.getLocationSiteD())).lower()
+        siteId = gen.getLocationSiteD()[siteLoc.upper()][0]
+        sitePath = os.path.join(self.__workPath, siteLoc, siteId.lower(), "site.cfg")
+        with open(sitePath) as ifh:
+            content = ifh.read()
+        sectionHeader = "[%s]\n" % siteId.lower()
+        content = content.replace(
+            sectionHeader,
+            sectionHeader + "extended_ccd_support = Off\nfile_activity_db_support = enabled\nsite_port = 80x\n",
+        )
+        with open(sitePath, "w") as ofh:
+            ofh.write(content)
+        lfh = io.StringIO()
+        fe = ConfigInfoFileExec(verbose=False, log=lfh)
+        fe.setPrivateSectionNames(gen.getPrivateSectionNames())
+        fe.addCommonSectionNames(gen.getCommonSectionNames())
+        fe.setSchema({"SITE_PORT": "int", "SITE_OPT_0002": "int"})
+        self.assertTrue(fe.writeLocationConfigCache(siteLoc))
+        self.assertEqual(sorted(t[2].split(":")[0] for t in fe.getSchemaErrors()), ["FILE_ACTIVITY_DB_SUPPORT", "SITE_PORT"])
+        self.assertIn("schema validation error", lfh.getvalue())
+        with open(os.path.join(self.__workPath, siteLoc, siteId.lower(), "ConfigInfoFileCache.json")) as ifh:
+            cD = json.load(ifh)[siteId]
+        self.assertIs(cD["EXTENDED_CCD_SUPPORT"], False)
+        self.assertIs(cD["FILE_ACTIVITY_DB_SUPPORT"], False)
+        self.assertIsInstance(cD["SITE_OPT_0002"], int)
+        self.assertEqual(cD["SITE_PORT"], "80x")
+
+    def testAccessors(self):
+        for val, expected in [(False, False), (True, True), ("on", True), ("Off", False)]:
+            ConfigInfoData.registerSiteConfig(SITE_ID, {"EXTENDED_CCD_SUPPORT": val, "FILE_ACTIVITY_DB_SUPPORT": val})
+            self.assertIs(ConfigInfoAppCc(siteId=SITE_ID).get_extended_ccd_supp(), expected)
+            self.assertIs(ConfigInfoAppCommon(siteId=SITE_ID).get_file_activity_db_support(), expected)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()
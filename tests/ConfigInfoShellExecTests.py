@@ -16,6 +16,8 @@ __email__ = "peisach@rcsb.rutgers.edu"
 __license__ = "Creative Commons Attribution 3.0 Unported"
 __version__ = "V0.01"
 
+import io
+import json
 import os
 import platform
 import sys
@@ -63,6 +65,66 @@ class ConfigDataSetExecTests(unittest.TestCase):
         self.__cise.validationConfig()
         self.__cise.databaseConfig()
 
+    def testExportSections(self):
+        """Tests single pass export of several sections to separate and combined files"""
+        outDirPath = os.path.join(TESTOUTPUT, "env")
+        if not os.path.exists(outDirPath):
+            os.makedirs(outDirPath)
+        ok = self.__cise.exportSections(["shell", "httpd", "database"], outDirPath=outDirPath)
+        self.assertTrue(ok)
+        for exportName in ["shell", "httpd", "database"]:
+            self.assertTrue(os.path.exists(os.path.join(outDirPath, "%s.env.sh" % exportName)))
+        outFilePath = os.path.join(outDirPath, "combined.env.csh")
+        ok = self.__cise.exportSections(["shell", "install"], shellType="csh", outFilePath=outFilePath)
+        self.assertTrue(ok)
+        with open(outFilePath) as ifh:
+            content = ifh.read()
+        self.assertIn("# --- begin OS_ENVIRONMENT ---", content)
+        self.assertIn("# --- end INSTALL_ENVIRONMENT ---", content)
+
+    def testEnvironmentFiles(self):
+        """Tests serving pre-rendered environment files while these match the cache fingerprint"""
+        topConfigPath = os.path.join(TESTOUTPUT, "env-files")
+        dirPath = os.path.join(topConfigPath, "rcsb-east", "wwpdb_deploy_env_test")
+        if not os.path.exists(dirPath):
+            os.makedirs(dirPath)
+        jsonPath = os.path.join(dirPath, "ConfigInfoFileCache.json")
+        with open(jsonPath, "w") as ofh:
+            ofh.write("{}")
+        cD = {"OS_ENVIRONMENT": {"ENV_TEST_PATH": "/a/b"}, "HTTPD_SERVICES": {"HTTPD_TEST": "on"}}
+        ok = ConfigInfoShellExec.writeEnvironmentFiles(cD, dirPath, ConfigInfoShellExec.getCacheFingerprint(jsonPath))
+        self.assertTrue(ok)
+        for fileName in ["site.env.sh", "site.env.csh", "httpd.env"]:
+            self.assertTrue(os.path.exists(os.path.join(dirPath, fileName)))
+        ofh = io.StringIO()
+        cise = ConfigInfoShellExec(topConfigPath=topConfigPath, siteLoc="rcsb-east", siteId="WWPDB_DEPLOY_ENV_TEST", log=ofh)
+        cise.shellConfig(shellType="csh")
+        cise.httpdConfig()
+        self.assertEqual(ofh.getvalue(), 'setenv ENV_TEST_PATH "/a/b"\nexport HTTPD_TEST="on"\n')
+        # stale files are not served
+        with open(jsonPath, "w") as ofh:
+            ofh.write('{"changed": 1}')
+        ofh = io.StringIO()
+        cise = ConfigInfoShellExec(topConfigPath=topConfigPath, siteLoc="rcsb-east", siteId="WWPDB_DEPLOY_ENV_TEST", log=ofh)
+        cise.shellConfig()
+        self.assertNotIn("ENV_TEST_PATH", ofh.getvalue())
+
+    def testHostSiteMap(self):
+        """Tests host name resolution from the precomputed host site map including host patterns"""
+        topConfigPath = os.path.join(TESTOUTPUT, "host-map")
+        if not os.path.exists(os.path.join(topConfigPath, "common")):
+            os.makedirs(os.path.join(topConfigPath, "common"))
+        with open(os.path.join(topConfigPath, "common", "common.cfg"), "w") as ofh:
+            ofh.write("[host_site_defaults]\n")
+            ofh.write("testhost.test.com = rcsb-east,WWPDB_DEPLOY_TEST\n")
+            ofh.write("node*.cluster.org = rcsb-east, WWPDB_DEPLOY_TEST_RU\n")
+        self.assertTrue(ConfigInfoShellExec.writeHostSiteMap(topConfigPath))
+        with open(os.path.join(topConfigPath, "common", "host_site_map.json")) as ifh:
+            mapD = json.load(ifh)
+        self.assertEqual(ConfigInfoShellExec.lookupHostSite(mapD, "TestHost.test.com"), ("rcsb-east", "WWPDB_DEPLOY_TEST"))
+        self.assertEqual(ConfigInfoShellExec.lookupHostSite(mapD, "node17.cluster.org"), ("rcsb-east", "WWPDB_DEPLOY_TEST_RU"))
+        self.assertEqual(ConfigInfoShellExec.lookupHostSite(mapD, "other.test.com"), (None, None))
+
     def testBrokenConfig(self):
         """Tests error handling"""
         ConfigInfoShellExec(
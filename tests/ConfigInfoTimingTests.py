@@ -0,0 +1,104 @@
+##
+#
+# File:    ConfigInfoTimingTests.py
+# Date:    19-Oct-2026
+# Version: 0.001
+##
+"""
+Test cases for the configuration loading phase timing hooks
+
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "John Westbrook"
+__email__ = "jwest@rcsb.rutgers.edu"
+__license__ = "Apache 2.0"
+__version__ = "V0.01"
+
+import logging
+import os
+import shutil
+import tempfile
+import unittest
+
+from wwpdb.utils.config.ConfigInfoData import ConfigInfoData
+from wwpdb.utils.config.ConfigInfoFileExec import ConfigInfoFileExec
+from wwpdb.utils.config.ConfigInfoGenerator import ConfigInfoGenerator
+from wwpdb.utils.config.ConfigInfoTiming import (
+    ConfigInfoTiming,
+    ConfigInfoTimingRecorder,
+)
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s]-%(module)s.%(funcName)s: %(message)s")
+logger = logging.getLogger()
+
+SITE_ID = "WWPDB_DEPLOY_TIMING_TEST"
+
+
+class ConfigInfoTimingTests(unittest.TestCase):
+    def setUp(self):
+        self.__workPath = tempfile.mkdtemp()
+        self.__topSave = os.environ.get("TOP_WWPDB_SITE_CONFIG_DIR")
+        ConfigInfoData.registerSiteConfig(SITE_ID, {"SITE_PREFIX": SITE_ID})
+
+    def tearDown(self):
+        ConfigInfoTiming.setHook(None)
+        ConfigInfoData.unregisterSiteConfig(SITE_ID)
+        if self.__topSave is None:
+            os.environ.pop("TOP_WWPDB_SITE_CONFIG_DIR", None)
+        else:
+            os.environ["TOP_WWPDB_SITE_CONFIG_DIR"] = self.__topSave
+        shutil.rmtree(self.__workPath, ignore_errors=True)
+
+    def testDataPhases(self):
+        self.assertFalse(ConfigInfoTiming.isActive())
+        self.assertFalse(ConfigInfoTiming.getPhaseTimer("ConfigInfoData").isActive())
+        rec = ConfigInfoTimingRecorder()
+        ConfigInfoTiming.setHook(rec)
+        self.assertTrue(ConfigInfoTiming.isActive())
+        ConfigInfoData(siteId=SITE_ID)
+        phaseL = [t[1] for t in rec.spanL if t[1] != "cache_import"]
+        self.assertEqual(phaseL, ["cache_lookup", "milestone_variants", "class_options"])
+        for component, _, seconds, contextD in rec.spanL:
+            self.assertEqual(component, "ConfigInfoData")
+            self.assertGreaterEqual(seconds, 0.0)
+            self.assertEqual(contextD, {"siteId": SITE_ID})
+        # the cache import is reported once per process
+        ConfigInfoData(siteId=SITE_ID)
+        self.assertEqual(len(rec.spanL), 2 * len(phaseL) + 1)
+        self.assertEqual(len([t for t in rec.spanL if t[1] == "cache_import"]), 1)
+        self.assertEqual(len(rec.getTotals()), len(phaseL) + 1)
+        # any callable may serve as a hook and hook failures do not interrupt loading
+        callL = []
+
+        def badHook(_component, phase, _seconds, _contextD):
+            callL.append(phase)
+            raise ValueError(phase)
+
+        self.assertIs(ConfigInfoTiming.setHook(badHook), rec)
+        self.assertEqual(ConfigInfoData(siteId=SITE_ID).getConfigDictionary()["SITE_PREFIX"], SITE_ID)
+        self.assertEqual(callL, phaseL)
+        self.assertIs(ConfigInfoTiming.setHook(None), badHook)
+        self.assertFalse(ConfigInfoTiming.isActive())
+
+    def testCacheBuildPhases(self):
+        gen = ConfigInfoGenerator(locations=1, sites=2, options=24, interpolationDepth=3)
+        gen.generate(self.__workPath)
+        os.environ["TOP_WWPDB_SITE_CONFIG_DIR"] = self.__workPath
+        fe = ConfigInfoFileExec(verbose=False)
+        fe.setPrivateSectionNames(gen.getPrivateSectionNames())
+        fe.addCommonSectionNames(gen.getCommonSectionNames())
+        rec = ConfigInfoTimingRecorder()
+        ConfigInfoTiming.setHook(rec)
+        siteLoc = next(iter(gen.getLocationSiteD())).lower()
+        self.assertTrue(fe.writeLocationConfigCache(siteLoc))
+        siteIdL = gen.getLocationSiteD()[siteLoc.upper()]
+        for siteId in siteIdL:
+            phaseL = [t[1] for t in rec.spanL if t[0] == "ConfigInfoFileExec" and t[3]["siteId"] == siteId]
+            self.assertEqual(phaseL, ["path_discovery", "parse", "interpolate", "deserialize", "write"])
+        tD = rec.getTotals()
+        self.assertGreater(tD[("ConfigInfoFileExec", "parse")], 0.0)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()
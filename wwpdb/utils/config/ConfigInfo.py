@@ -10,6 +10,9 @@
 # 18-Jun-2012 jdw add function to set site id from the environment
 # 25-Feb-2013 jdw correct typo in diagnostic message
 # 11-Jul-2016 jdw add optional default return value for get()
+# 19-Oct-2026     enable the lookup profiler (ConfigInfoProfiler) when WWPDB_CONFIG_PROFILE is set
+# 19-Oct-2026     use the configuration daemon (ConfigInfoDaemon) when WWPDB_CONFIG_DAEMON_SOCKET is set
+# 19-Oct-2026     refresh existing instances when the registered site configuration changes (hot reload)
 #
 ##
 """
@@ -26,6 +29,8 @@ __version__ = "V0.01"
 
 import os
 import sys
+import threading
+import weakref
 
 from wwpdb.utils.config.ConfigInfoData import ConfigInfoData
 
@@ -48,8 +53,21 @@ class ConfigInfo:
 
     SiteId provided in the constructor overrides any value in the environment.
 
+    If WWPDB_CONFIG_DAEMON_SOCKET is set in the environment the configuration is obtained from the
+    configuration daemon listening on this socket (see ConfigInfoDaemon) falling back to local
+    loading if the daemon or the site is not available.  Values obtained from the daemon are JSON
+    types (e.g. tuples are returned as lists).
+
+    Locally loaded instances follow changes to the registered site configuration (e.g. installed by
+    ConfigInfoCacheWatcher) - the configuration dictionary of each existing instance for the site is
+    resolved again and swapped in by a single assignment, so get() incurs no additional cost.
+
     """
 
+    # Locally loaded instances by site refreshed by refreshSite() -
+    _instanceD = {}  # type: dict  # noqa: RUF012
+    _instanceLock = threading.Lock()
+
     def __init__(self, siteId=None, verbose=True, log=sys.stderr):
         self.__siteId = siteId
         self.__verbose = verbose
@@ -64,9 +82,40 @@ class ConfigInfo:
                 "++ERROR - ConfigInfo()  no site identifier in constructor or WWPDB_SITE_ID in environment.\n"
             )
 
+        self.__D = None
+        socketPath = os.getenv("WWPDB_CONFIG_DAEMON_SOCKET")
+        if socketPath:
+            # imported on demand - the daemon is optional
+            from wwpdb.utils.config.ConfigInfoDaemon import (  # pylint: disable=import-outside-toplevel
+                ConfigInfoDaemonClient,
+            )
+
+            self.__D = ConfigInfoDaemonClient.getSnapshot(socketPath, self.__siteId)
+        if self.__D is None:
+            self.refresh()
+            with ConfigInfo._instanceLock:
+                instS = ConfigInfo._instanceD.get(self.__siteId)
+                if instS is None:
+                    instS = ConfigInfo._instanceD[self.__siteId] = weakref.WeakSet()
+                instS.add(self)
+
+    def refresh(self):
+        """Resolve the configuration of this locally loaded instance again (see class documentation)."""
         self.__sI = ConfigInfoData(siteId=self.__siteId, verbose=self.__verbose)
         self.__D = self.__sI.getConfigDictionary()
 
+    @classmethod
+    def refreshSite(cls, siteId):
+        """Resolve the configuration of the existing locally loaded instances for the input site again.
+
+        Returns the number of instances refreshed.
+        """
+        with cls._instanceLock:
+            instL = list(cls._instanceD.get(siteId, ()))
+        for inst in instL:
+            inst.refresh()
+        return len(instL)
+
     def get(self, keyWord, default=None):
         """Returns the site-specific value assigned to the input keyword or the default value -"""
         if keyWord is not None and keyWord in self.__D:
@@ -77,3 +126,12 @@ class ConfigInfo:
         """Print the current configuration dictionary ."""
         for ky in sorted(self.__D.keys()):
             ofh.write("+ConfigInfo.dump() key: %-40s   value: %s\n" % (ky, self.__D[ky]))
+
+
+ConfigInfoData.addRegistryListener(ConfigInfo.refreshSite)
+
+if os.getenv("WWPDB_CONFIG_PROFILE"):
+    # imported on demand - profiling is off by default
+    from wwpdb.utils.config.ConfigInfoProfiler import ConfigInfoProfiler
+
+    ConfigInfoProfiler.enableFromEnvironment()
@@ -4,7 +4,7 @@
 #
 # Updates:
 #
-#
+# 19-Oct-2026  return bool options typed at cache build time without string comparisons
 ##
 """
 Provides common access patterns for application configuration locations to minimize verbose site-config files
@@ -118,6 +118,9 @@ class ConfigInfoAppCc(ConfigInfoAppBase):
     def get_extended_ccd_supp(self):
         """Returns true if extended width CCD support enabled"""
         val = self._getValue("EXTENDED_CCD_SUPPORT", True)
+        if val is True or val is False:
+            # typed when the cache is built (see ConfigInfoSchema)
+            return val
         if val in ["True", "On", "true", "on", "1", True]:
             return True
         return False
@@ -449,6 +452,9 @@ class ConfigInfoAppCommon(ConfigInfoAppCc):
     def get_file_activity_db_support(self):
         """Returns true if file activity database support enabled"""
         val = self._getValue("FILE_ACTIVITY_DB_SUPPORT", False)
+        if val is True or val is False:
+            # typed when the cache is built (see ConfigInfoSchema)
+            return val
         if val in ["True", "On", "true", "on", "1", True]:
             return True
         return False
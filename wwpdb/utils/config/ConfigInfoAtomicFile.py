@@ -0,0 +1,111 @@
+##
+# File:    ConfigInfoAtomicFile.py
+# Date:    19-Oct-2026
+#
+# Updates:
+#   19-Oct-2026  read the umask of new files without modifying it
+##
+"""
+Atomic replacement of configuration cache and resource files.
+
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "John Westbrook"
+__email__ = "jwest@rcsb.rutgers.edu"
+__license__ = "Apache 2.0"
+__version__ = "V0.01"
+
+import logging
+import os
+import stat
+import tempfile
+
+logger = logging.getLogger(__name__)
+
+# os.replace() is not available in Python 2 where os.rename() replaces the target on POSIX systems
+_replace = getattr(os, "replace", os.rename)
+
+
+def _readUmask():
+    """Return the process umask from /proc/self/status (Linux) or None if not available."""
+    try:
+        with open("/proc/self/status") as ifh:
+            for line in ifh:
+                if line.startswith("Umask:"):
+                    return int(line.split()[1], 8)
+    except (IOError, OSError, ValueError):  # noqa: UP024
+        pass
+    return None
+
+
+# Where /proc is not available the umask is read once at import, as os.umask() can only be read by
+# setting it and toggling it later races with other threads creating files.
+_importUmask = _readUmask()
+if _importUmask is None:
+    _importUmask = os.umask(0o022)
+    os.umask(_importUmask)
+
+
+def getNewFileMode():
+    """Return the permissions of a new file created with open() subject to the process umask."""
+    umask = _readUmask()
+    return 0o666 & ~(umask if umask is not None else _importUmask)
+
+
+class ConfigInfoAtomicFile:
+    """
+    Context manager writing a file atomically -
+
+        with ConfigInfoAtomicFile(filePath, "w") as ofh:
+            json.dump(d, ofh)
+
+    Content is written to a temporary file in the target directory which is flushed, synced and
+    renamed over the target when the block completes without error.  Concurrent readers
+    see either the previous or the new content in full, never a partially written file.
+    On error the temporary file is removed and the target is left unchanged.
+
+    The permissions of an existing target are preserved, new files are created subject to the
+    process umask (as with open()).
+    """
+
+    def __init__(self, filePath, mode="w", fsync=True):
+        if mode not in ["w", "wb"]:
+            raise ValueError("unsupported atomic file mode %r" % mode)
+        self.__filePath = filePath
+        self.__mode = mode
+        self.__fsync = fsync
+        self.__tmpPath = None
+        self.__fh = None
+
+    def __enter__(self):
+        dirPath, fileName = os.path.split(os.path.abspath(self.__filePath))
+        fd, self.__tmpPath = tempfile.mkstemp(prefix="." + fileName + ".", suffix=".tmp", dir=dirPath)
+        self.__fh = os.fdopen(fd, self.__mode)
+        return self.__fh
+
+    def __exit__(self, excType, excValue, tb):
+        try:
+            if excType is None:
+                self.__fh.flush()
+                if self.__fsync:
+                    os.fsync(self.__fh.fileno())
+            self.__fh.close()
+            if excType is None:
+                os.chmod(self.__tmpPath, self.__getMode())
+                _replace(self.__tmpPath, self.__filePath)
+                self.__tmpPath = None
+        finally:
+            if self.__tmpPath is not None and os.path.exists(self.__tmpPath):
+                try:
+                    os.remove(self.__tmpPath)
+                except OSError as e:
+                    logger.info("failed removing temporary file %s - %s", self.__tmpPath, str(e))
+        return False
+
+    def __getMode(self):
+        try:
+            return stat.S_IMODE(os.stat(self.__filePath).st_mode)
+        except OSError:
+            # new file - apply the process umask to the default open() permissions
+            return getNewFileMode()
@@ -0,0 +1,205 @@
+##
+# File:    ConfigInfoBackup.py
+# Date:    19-Oct-2026
+#
+# Updates:
+##
+"""
+Timestamped backup files with bounded retention for configuration and resource files.
+
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "John Westbrook"
+__email__ = "jwest@rcsb.rutgers.edu"
+__license__ = "Apache 2.0"
+__version__ = "V0.01"
+
+import datetime
+import gzip
+import hashlib
+import logging
+import os
+import re
+import shutil
+
+from wwpdb.utils.config.ConfigInfoAtomicFile import ConfigInfoAtomicFile
+
+logger = logging.getLogger(__name__)
+
+_TIMESTAMP_FORMAT = "%Y-%m-%d-%H-%M-%S"
+_BACKUP_SUFFIX_RE = re.compile(r"^(?P<base>.+)-(?P<ts>\d{4}-\d{2}-\d{2}-\d{2}-\d{2}-\d{2})(?P<gz>\.gz)?$")
+
+
+class ConfigInfoBackup:
+    """
+    Writes timestamped backups (<file>-YYYY-MM-DD-HH-MM-SS[.gz]) of configuration and resource files and
+    applies a retention policy to the accumulated backups of each file.
+
+    Retention policy -
+
+        keepCount  - retain at most the most recent N backups (None for no limit)
+        keepDays   - remove backups older than N days, the most recent backup is always retained (None for no limit)
+        dedup      - skip a backup whose content is identical to the most recent backup, and when compacting
+                     remove backups identical to their immediate predecessor
+        compress   - write (and when compacting, convert) backups as gzip files
+
+    The default policy only skips duplicate backups.  Site policies may be configured with the options
+    SITE_CONFIG_BACKUP_KEEP_COUNT, SITE_CONFIG_BACKUP_KEEP_DAYS and SITE_CONFIG_BACKUP_COMPRESS (see fromConfig()).
+    """
+
+    def __init__(self, keepCount=None, keepDays=None, dedup=True, compress=False):
+        self.__keepCount = keepCount
+        self.__keepDays = keepDays
+        self.__dedup = dedup
+        self.__compress = compress
+
+    @classmethod
+    def fromConfig(cls, cI):
+        """Return a policy built from the backup options in the input configuration object or dictionary
+        (any object providing get(keyWord, default)).
+        """
+        try:
+            keepCount = cI.get("SITE_CONFIG_BACKUP_KEEP_COUNT", None)
+            keepDays = cI.get("SITE_CONFIG_BACKUP_KEEP_DAYS", None)
+            compress = str(cI.get("SITE_CONFIG_BACKUP_COMPRESS", "false")).lower() in ["true", "yes", "1"]
+            return cls(
+                keepCount=int(keepCount) if keepCount not in [None, ""] else None,
+                keepDays=float(keepDays) if keepDays not in [None, ""] else None,
+                compress=compress,
+            )
+        except Exception as e:  # noqa: BLE001
+            logger.error("failed reading backup retention policy options - %s", str(e))
+        return cls()
+
+    def backup(self, filePath):
+        """Write a timestamped backup of the input file and apply the retention policy to its backups.
+
+        Returns: True for success (including a skipped duplicate backup) or False otherwise
+        """
+        bckupPath = None
+        try:
+            if self.__dedup:
+                bckupL = self.getBackupList(filePath)
+                digest = self.__getDigest(filePath)
+                if bckupL and digest is not None and self.__getDigest(bckupL[-1]) == digest:
+                    logger.debug("skipping backup of unchanged file %s", filePath)
+                    return True
+            bckupPath = filePath + datetime.datetime.now().strftime("-" + _TIMESTAMP_FORMAT)  # noqa: DTZ005
+            if self.__compress:
+                bckupPath += ".gz"
+                self.__writeCompressed(filePath, bckupPath)
+            else:
+                shutil.copyfile(filePath, bckupPath)
+            self.prune(filePath)
+            return True
+        except Exception as e:  # noqa: BLE001
+            logger.info("Could not write backup file %s - %s", bckupPath, str(e))
+        return False
+
+    @staticmethod
+    def getBackupList(filePath):
+        """Return the list of backup file paths for the input file ordered by timestamp (oldest first)."""
+        dirPath, fileName = os.path.split(os.path.abspath(filePath))
+        tL = []
+        try:
+            for fn in os.listdir(dirPath):
+                mR = _BACKUP_SUFFIX_RE.match(fn)
+                if mR and mR.group("base") == fileName:
+                    tL.append((mR.group("ts"), fn))
+        except OSError as e:
+            logger.debug("failed listing backups for %s - %s", filePath, str(e))
+        return [os.path.join(dirPath, fn) for _, fn in sorted(tL)]
+
+    def prune(self, filePath):
+        """Apply the retention policy to the backups of the input file.
+
+        Returns: list of removed backup file paths
+        """
+        return self.__applyPolicy(self.getBackupList(filePath), dedup=False)
+
+    def compactDirectory(self, dirPath, recursive=True):
+        """Apply the retention policy (including duplicate removal and compression) to all of the
+        timestamped backups in the input directory.
+
+        Returns: {"files": number of backed up files, "removed": number of removed backups, "compressed": number of compressed backups}
+        """
+        retD = {"files": 0, "removed": 0, "compressed": 0}
+        for topPath, dirNameL, fileNameL in os.walk(dirPath):
+            groupD = {}
+            for fn in fileNameL:
+                mR = _BACKUP_SUFFIX_RE.match(fn)
+                if mR:
+                    groupD.setdefault(mR.group("base"), []).append((mR.group("ts"), os.path.join(topPath, fn)))
+            for base in sorted(groupD):
+                bckupL = [fp for _, fp in sorted(groupD[base])]
+                removedL = self.__applyPolicy(bckupL, dedup=self.__dedup)
+                retD["files"] += 1
+                retD["removed"] += len(removedL)
+                if self.__compress:
+                    for fp in bckupL:
+                        if fp not in removedL and not fp.endswith(".gz") and self.__compressFile(fp):
+                            retD["compressed"] += 1
+            if not recursive:
+                del dirNameL[:]
+        return retD
+
+    def __applyPolicy(self, bckupL, dedup=False):
+        removeL = []
+        if dedup:
+            prevDigest = None
+            for fp in bckupL:
+                digest = self.__getDigest(fp)
+                if digest is not None and digest == prevDigest:
+                    removeL.append(fp)
+                else:
+                    prevDigest = digest
+        keepL = [fp for fp in bckupL if fp not in removeL]
+        if self.__keepCount is not None and len(keepL) > self.__keepCount:
+            nRemove = len(keepL) - max(self.__keepCount, 0)
+            removeL.extend(keepL[:nRemove])
+            keepL = keepL[nRemove:]
+        if self.__keepDays is not None and len(keepL) > 1:
+            cutoff = datetime.datetime.now() - datetime.timedelta(days=self.__keepDays)  # noqa: DTZ005
+            for fp in keepL[:-1]:
+                mR = _BACKUP_SUFFIX_RE.match(os.path.basename(fp))
+                if datetime.datetime.strptime(mR.group("ts"), _TIMESTAMP_FORMAT) < cutoff:  # noqa: DTZ007
+                    removeL.append(fp)
+        for fp in removeL:
+            try:
+                os.remove(fp)
+            except OSError as e:
+                logger.info("failed removing backup file %s - %s", fp, str(e))
+        return removeL
+
+    @staticmethod
+    def __compressFile(filePath):
+        try:
+            ConfigInfoBackup.__writeCompressed(filePath, filePath + ".gz")
+            shutil.copystat(filePath, filePath + ".gz")
+            os.remove(filePath)
+            return True
+        except Exception as e:  # noqa: BLE001
+            logger.info("failed compressing backup file %s - %s", filePath, str(e))
+        return False
+
+    @staticmethod
+    def __writeCompressed(filePath, gzFilePath):
+        with open(filePath, "rb") as ifh, ConfigInfoAtomicFile(gzFilePath, "wb") as ofh:
+            gzfh = gzip.GzipFile(fileobj=ofh, mode="wb")
+            shutil.copyfileobj(ifh, gzfh)
+            gzfh.close()
+
+    @staticmethod
+    def __getDigest(filePath):
+        """Return the digest of the (uncompressed) content of the input file or None."""
+        try:
+            opener = gzip.open if filePath.endswith(".gz") else open
+            hD = hashlib.sha1()  # noqa: S324
+            with opener(filePath, "rb") as ifh:
+                for chunk in iter(lambda: ifh.read(65536), b""):
+                    hD.update(chunk)
+            return hD.hexdigest()
+        except Exception as e:  # noqa: BLE001
+            logger.debug("failed computing digest for %s - %s", filePath, str(e))
+        return None
@@ -0,0 +1,136 @@
+##
+# File:    ConfigInfoBulkLoader.py
+# Date:    19-Oct-2026
+#
+# Updates:
+##
+"""
+Bulk loading of the configuration options of several sites for cross-site tools.
+
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "John Westbrook"
+__email__ = "jwest@rcsb.rutgers.edu"
+__license__ = "Apache 2.0"
+__version__ = "V0.01"
+
+import json
+import logging
+import os
+import sys
+
+from wwpdb.utils.config.ConfigInfoData import ConfigInfoData
+from wwpdb.utils.config.ConfigInfoFile import ConfigInfoFile
+
+logger = logging.getLogger(__name__)
+
+
+class ConfigInfoBulkLoader:
+    """
+    Loads the configuration dictionaries of a list of sites in one pass -
+
+        bl = ConfigInfoBulkLoader()
+        siteD = bl.load(["WWPDB_DEPLOY_TEST", "PDBE_DEV", ...], register=True)
+
+    Constructing ConfigInfo(siteId=other) for each site searches the locations for the site's JSON cache
+    file in turn (ConfigInfoFileCache.getJsonConfigDictionary()).  Here the JSON cache files below
+    TOP_WWPDB_SITE_CONFIG_DIR are discovered once for all sites (searching locations in the same order so
+    that the first location providing a site is used) and the requested files are read concurrently
+    (serially where concurrent.futures is not available).
+
+    Sites registered with ConfigInfoData.registerSiteConfig() or held by the imported cache module are
+    served from memory.  Sites without configuration map to an empty dictionary as with ConfigInfo().
+    With register=True the loaded dictionaries are registered so that subsequently constructed
+    ConfigInfo() instances for these sites use them.
+    """
+
+    def __init__(self, topConfigPath=None, locations=None, maxWorkers=8):
+        self.__topConfigPath = topConfigPath if topConfigPath else os.getenv("TOP_WWPDB_SITE_CONFIG_DIR")
+        self.__locationL = list(locations) if locations else list(ConfigInfoFile.CACHE_LOCATION_NAMES)
+        self.__maxWorkers = max(1, maxWorkers)
+        self.__pathD = None
+
+    def discover(self, refresh=False):
+        """Return the JSON cache file path for each site found below the configuration top path {siteId: path}."""
+        if self.__pathD is not None and not refresh:
+            return self.__pathD
+        pathD = {}
+        for siteLoc in self.__locationL:
+            locPath = os.path.join(str(self.__topConfigPath), siteLoc)
+            try:
+                dirNameL = sorted(os.listdir(locPath))
+            except OSError:
+                continue
+            for dirName in dirNameL:
+                siteId = dirName.upper()
+                if siteId in pathD:
+                    continue
+                cachePath = os.path.join(locPath, dirName, "ConfigInfoFileCache.json")
+                if os.path.isfile(cachePath):
+                    pathD[siteId] = cachePath
+        self.__pathD = pathD
+        return pathD
+
+    def load(self, siteIds, register=False):
+        """Return the configuration dictionaries for the input site identifiers {siteId: configD}."""
+        rD = {}
+        readL = []
+        for siteId in siteIds:
+            if siteId in rD:
+                continue
+            cD = self.__getInMemory(siteId)
+            if cD is not None:
+                rD[siteId] = cD
+            else:
+                rD[siteId] = {}
+                readL.append(siteId)
+        if readL:
+            pathD = self.discover()
+            readL = [siteId for siteId in readL if siteId.upper() in pathD]
+            executorClass = self.__getExecutorClass() if len(readL) > 1 and self.__maxWorkers > 1 else None
+            if executorClass is not None:
+                with executorClass(max_workers=min(self.__maxWorkers, len(readL))) as executor:
+                    cDL = list(executor.map(lambda siteId: self.__read(siteId, pathD[siteId.upper()]), readL))
+            else:
+                cDL = [self.__read(siteId, pathD[siteId.upper()]) for siteId in readL]
+            for siteId, cD in zip(readL, cDL):
+                rD[siteId] = cD
+                if register and cD:
+                    ConfigInfoData.registerSiteConfig(siteId, cD)
+        return rD
+
+    @staticmethod
+    def __getExecutorClass():
+        try:
+            from concurrent.futures import ThreadPoolExecutor  # pylint: disable=import-outside-toplevel
+        except ImportError:
+            # Python 2 without the futures backport
+            return None
+        return ThreadPoolExecutor
+
+    @staticmethod
+    def __getInMemory(siteId):
+        cD = ConfigInfoData.getRegisteredSiteConfig(siteId)
+        if cD is not None:
+            return cD
+        # the cache module imported by ConfigInfoData for the current site - only the sites it holds are served
+        # from memory (the others are read below rather than through its JSON cache file fallback)
+        cacheModule = sys.modules.get("ConfigInfoFileCache")
+        try:
+            cls = cacheModule.ConfigInfoFileCache
+            if cls.hasConfigDictionary(siteId):
+                return cls.getConfigDictionary(siteId)
+        except Exception:  # noqa: BLE001
+            pass
+        return None
+
+    @staticmethod
+    def __read(siteId, cachePath):
+        try:
+            with open(cachePath) as infile:
+                cD = json.load(infile)
+            return cD.get(siteId, cD.get(siteId.upper(), {}))
+        except Exception as e:  # noqa: BLE001
+            logger.error("failed reading configuration cache for site %s %s - %s", siteId, cachePath, str(e))
+        return {}
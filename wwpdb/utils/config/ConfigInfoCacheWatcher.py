@@ -0,0 +1,248 @@
+##
+# File:    ConfigInfoCacheWatcher.py
+# Date:    19-Oct-2026
+#
+# Updates:
+##
+"""
+Hot reload of site configuration cache files and data set location files in long running processes.
+
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "John Westbrook"
+__email__ = "jwest@rcsb.rutgers.edu"
+__license__ = "Apache 2.0"
+__version__ = "V0.01"
+
+import ctypes
+import ctypes.util
+import json
+import logging
+import os
+import runpy
+import select
+import struct
+import sys
+import threading
+
+from wwpdb.utils.config.ConfigInfoData import ConfigInfoData
+
+logger = logging.getLogger(__name__)
+
+# inotify event masks and flags (linux/inotify.h)
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_NONBLOCK = 0o4000
+_IN_CLOEXEC = 0o2000000
+_IN_EVENT_HEADER = struct.Struct("iIII")
+
+
+class ConfigInfoCacheWatcher:
+    """
+    Watches the per-site configuration cache files (ConfigInfoFileCache.py/.json) and optionally the
+    data set location file (site_dataset_siteloc_info.json) and swaps changed content into the
+    process wide registries used by ConfigInfoData() and ConfigInfoDataSet().
+
+    Changes are detected by a background thread using inotify (Linux) or, where inotify is not
+    available, by polling the file status every pollInterval seconds.  Request paths incur no cost
+    as new dictionaries are loaded by the watcher thread and installed by a single assignment.
+
+    Callbacks registered with addCallback() are invoked on the watcher thread as -
+
+        callback(kind, filePath, dataD)   kind is "config" or "dataset"
+
+    after each change that alters the loaded content.  Content which fails to load is ignored and the
+    previous dictionaries remain in place.
+    """
+
+    def __init__(self, siteId=None, siteLoc=None, topConfigPath=None, dataSetLocFilePath=None, pollInterval=2.0, useInotify=True):
+        self.__siteId = siteId if siteId else str(os.getenv("WWPDB_SITE_ID", None)).upper()
+        siteLoc = siteLoc if siteLoc else str(os.getenv("WWPDB_SITE_LOC", None))
+        topConfigPath = topConfigPath if topConfigPath else os.getenv("TOP_WWPDB_SITE_CONFIG_DIR", "")
+        cacheDirPath = os.path.join(topConfigPath, siteLoc.lower(), self.__siteId.lower())
+        self.__pyCachePath = os.path.join(cacheDirPath, "ConfigInfoFileCache.py")
+        self.__jsonCachePath = os.path.join(cacheDirPath, "ConfigInfoFileCache.json")
+        self.__dataSetLocFilePath = dataSetLocFilePath
+        self.__pollInterval = pollInterval
+        self.__useInotify = useInotify
+        self.__kindD = {self.__pyCachePath: "config", self.__jsonCachePath: "config"}
+        if self.__dataSetLocFilePath:
+            self.__kindD[self.__dataSetLocFilePath] = "dataset"
+        self.__sigD = {}
+        self.__dataD = {}
+        self.__callbackL = []
+        self.__lock = threading.Lock()
+        self.__stopEvent = threading.Event()
+        self.__thread = None
+        self.__mode = None
+
+    def addCallback(self, callback):
+        self.__callbackL.append(callback)
+
+    def getMode(self):
+        """Return the change detection mode of the running watcher ("inotify" or "poll") or None."""
+        return self.__mode
+
+    def load(self):
+        """Load and register the current content of the watched files without notifying the callbacks.
+
+        Returns: list of loaded kinds
+        """
+        with self.__lock:
+            for filePath in self.__kindD:
+                self.__sigD[filePath] = self.__getSignature(filePath)
+            return [kind for kind in sorted(set(self.__kindD.values())) if self.__reload(kind, notify=False)]
+
+    def start(self):
+        """Load and register the current content of the watched files and start the watcher thread."""
+        self.load()
+        if self.__thread is not None:
+            return True
+        self.__stopEvent.clear()
+        fd = self.__openInotify() if self.__useInotify else None
+        self.__mode = "inotify" if fd is not None else "poll"
+        self.__thread = threading.Thread(target=self.__run, args=(fd,), name="ConfigInfoCacheWatcher")
+        self.__thread.daemon = True
+        self.__thread.start()
+        return True
+
+    def stop(self):
+        self.__stopEvent.set()
+        if self.__thread is not None:
+            self.__thread.join()
+        self.__thread = None
+        self.__mode = None
+
+    def checkNow(self):
+        """Check the watched files for changes and reload changed content.
+
+        Returns: list of reloaded kinds
+        """
+        with self.__lock:
+            kindS = set()
+            for filePath, kind in self.__kindD.items():
+                sig = self.__getSignature(filePath)
+                if sig != self.__sigD.get(filePath):
+                    self.__sigD[filePath] = sig
+                    kindS.add(kind)
+            return [kind for kind in sorted(kindS) if self.__reload(kind, notify=True)]
+
+    def __run(self, fd):
+        # failures are logged and the watcher continues with the next check
+        try:
+            if fd is None:
+                while not self.__stopEvent.wait(self.__pollInterval):
+                    try:
+                        self.checkNow()
+                    except Exception as e:  # noqa: BLE001
+                        logger.error("configuration cache watcher check failing - %s", str(e))
+                return
+            nameS = {os.path.basename(fp) for fp in self.__kindD}
+            retry = False
+            while not self.__stopEvent.is_set():
+                try:
+                    rL, _, _ = select.select([fd], [], [], 0.5)
+                    changed = bool(rL) and bool(nameS.intersection(self.__readInotifyNames(fd)))
+                    if changed or retry:
+                        retry = False
+                        self.checkNow()
+                except Exception as e:  # noqa: BLE001
+                    logger.error("configuration cache watcher check failing - %s", str(e))
+                    # the notification has been consumed - check again after the poll interval
+                    retry = True
+                    self.__stopEvent.wait(self.__pollInterval)
+        finally:
+            if fd is not None:
+                os.close(fd)
+
+    def __reload(self, kind, notify=True):
+        """Load and register the content for the input kind. Returns True if the content changed."""
+        filePath, dataD = self.__loadConfig() if kind == "config" else self.__loadDataSetLocations()
+        if dataD is None or dataD == self.__dataD.get(kind):
+            return False
+        self.__dataD[kind] = dataD
+        if kind == "config":
+            ConfigInfoData.registerSiteConfig(self.__siteId, dataD)
+        else:
+            from wwpdb.utils.config.ConfigInfoDataSet import ConfigInfoDataSet  # pylint: disable=import-outside-toplevel
+
+            ConfigInfoDataSet.registerLocationDictionary(filePath, dataD)
+        if notify:
+            for callback in self.__callbackL:
+                try:
+                    callback(kind, filePath, dataD)
+                except Exception as e:  # noqa: BLE001
+                    logger.error("configuration cache watcher callback failing for %s - %s", filePath, str(e))
+        return True
+
+    def __loadConfig(self):
+        # The Python cache preserves tuple values and is preferred as with ConfigInfoFileCache.getConfigDictionary()
+        try:
+            if os.access(self.__pyCachePath, os.R_OK):
+                nsD = runpy.run_path(self.__pyCachePath)
+                cD = nsD["ConfigInfoFileCache"].getConfigDictionary(self.__siteId)
+                if cD:
+                    return self.__pyCachePath, cD
+            if os.access(self.__jsonCachePath, os.R_OK):
+                with open(self.__jsonCachePath) as infile:
+                    cD = json.load(infile).get(self.__siteId)
+                if cD:
+                    return self.__jsonCachePath, cD
+        except Exception as e:  # noqa: BLE001
+            logger.error("failed loading configuration cache for site %s - %s", self.__siteId, str(e))
+        return self.__jsonCachePath, None
+
+    def __loadDataSetLocations(self):
+        try:
+            with open(self.__dataSetLocFilePath) as infile:
+                return self.__dataSetLocFilePath, json.load(infile)
+        except Exception as e:  # noqa: BLE001
+            logger.error("failed loading data set location file %s - %s", self.__dataSetLocFilePath, str(e))
+        return self.__dataSetLocFilePath, None
+
+    @staticmethod
+    def __getSignature(filePath):
+        try:
+            st = os.stat(filePath)
+            return (st.st_ino, st.st_size, st.st_mtime)
+        except OSError:
+            return None
+
+    def __openInotify(self):
+        """Return an inotify descriptor watching the directories of the watched files or None if unavailable."""
+        if not sys.platform.startswith("linux"):
+            return None
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+            fd = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+            if fd < 0:
+                return None
+            # files are replaced by rename so the containing directories are watched
+            mask = _IN_CLOSE_WRITE | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE
+            for dirPath in {os.path.dirname(os.path.abspath(fp)) for fp in self.__kindD}:
+                if libc.inotify_add_watch(fd, dirPath.encode(), mask) < 0:
+                    logger.info("inotify watch unavailable for %s - polling", dirPath)
+                    os.close(fd)
+                    return None
+            return fd
+        except Exception as e:  # noqa: BLE001
+            logger.info("inotify unavailable - polling - %s", str(e))
+        return None
+
+    @staticmethod
+    def __readInotifyNames(fd):
+        nameL = []
+        try:
+            buf = os.read(fd, 65536)
+        except OSError:
+            return nameL
+        offset = 0
+        while offset + _IN_EVENT_HEADER.size <= len(buf):
+            _wd, _mask, _cookie, nameLen = _IN_EVENT_HEADER.unpack_from(buf, offset)
+            offset += _IN_EVENT_HEADER.size
+            nameL.append(buf[offset : offset + nameLen].rstrip(b"\0").decode("utf-8", "replace"))
+            offset += nameLen
+        return nameL
@@ -0,0 +1,143 @@
+##
+# File:    ConfigInfoContentType.py
+# Date:    19-Oct-2026
+#
+# Updates:
+##
+"""
+Lookup indexes over the project content type, milestone and file format definitions in ConfigInfoData
+and parsing of wwPDB archive file names.
+
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "John Westbrook"
+__email__ = "jwest@rcsb.rutgers.edu"
+__license__ = "Apache 2.0"
+__version__ = "V0.01"
+
+import logging
+import os
+import re
+import threading
+
+from wwpdb.utils.config.ConfigInfoData import ConfigInfoData
+
+logger = logging.getLogger(__name__)
+
+
+class ConfigInfoContentType:
+    """
+    Precomputed indexes over CONTENT_TYPE_BASE_DICTIONARY (including milestone variants),
+    CONTENT_MILESTONE_LIST and FILE_FORMAT_EXTENSION_DICTIONARY -
+
+        acronym            -> (content type, milestone)    e.g. "sf-upload" -> ("structure-factors", "upload")
+        file extension     -> [format, ...]                e.g. "xml" -> ["pdbml", "xml"]
+        (content type, format) validity                   e.g. ("model-upload", "pdbx") -> True
+
+    The indexes are built once per process from the class-level definitions in ConfigInfoData and
+    are shared by all instances.  Where content types share an acronym the first definition is used.
+
+    File names following the archive naming convention -
+
+        <data set id>_<acronym>[-<milestone>]_P<part number>.<extension>[.V<version>]
+
+    are parsed by parseFileName().
+    """
+
+    _indexD = {}  # type: dict  # noqa: RUF012
+    _lock = threading.Lock()
+    _fileNamePattern = re.compile(r"^(?P<dataSetId>[A-Za-z]+_[0-9]+)_(?P<acronym>[A-Za-z0-9-]+)_P(?P<partNumber>[0-9]+)\.(?P<extension>[A-Za-z0-9-]+)(?:\.V(?P<version>[0-9]+))?$")
+
+    def __init__(self):
+        self.__indexD = self.__getIndex()
+
+    @classmethod
+    def __getIndex(cls):
+        if not cls._indexD:
+            with cls._lock:
+                if not cls._indexD:
+                    cls._indexD = cls.__buildIndex()
+        return cls._indexD
+
+    @staticmethod
+    def __buildIndex():
+        # the content type definitions are class-level options common to all sites
+        cD = ConfigInfoData(verbose=False, useCache=False).getConfigDictionary()
+        contentD = {}
+        acronymD = {}
+        validS = set()
+        for contentType, (formatL, acronym) in cD["CONTENT_TYPE_BASE_DICTIONARY"].items():
+            variantL = [(contentType, acronym, None)]
+            variantL.extend((contentType + "-" + ms, acronym + "-" + ms, ms) for ms in cD["CONTENT_MILESTONE_LIST"])
+            for variantType, variantAcronym, milestone in variantL:
+                contentD[variantType] = (contentType, milestone, variantAcronym, tuple(formatL))
+                validS.update((variantType, fmt) for fmt in formatL)
+                # base acronyms take precedence over an identical milestone variant acronym
+                if variantAcronym not in acronymD or (milestone is None and acronymD[variantAcronym][1] is not None):
+                    acronymD[variantAcronym] = (contentType, milestone)
+        extensionD = {}
+        for fmt, ext in cD["FILE_FORMAT_EXTENSION_DICTIONARY"].items():
+            extensionD.setdefault(ext, []).append(fmt)
+        return {
+            "content": contentD,
+            "acronym": acronymD,
+            "extension": extensionD,
+            "format": dict(cD["FILE_FORMAT_EXTENSION_DICTIONARY"]),
+            "valid": frozenset(validS),
+        }
+
+    def getContentTypeForAcronym(self, acronym):
+        """Return (base content type, milestone or None) for the input acronym (e.g. "model-upload") or None."""
+        return self.__indexD["acronym"].get(acronym)
+
+    def getAcronym(self, contentType):
+        """Return the file name acronym for the input content type (including milestone variants) or None."""
+        tup = self.__indexD["content"].get(contentType)
+        return tup[2] if tup else None
+
+    def getFormats(self, contentType):
+        """Return the list of formats allowed for the input content type (including milestone variants)."""
+        tup = self.__indexD["content"].get(contentType)
+        return list(tup[3]) if tup else []
+
+    def isValidFormat(self, contentType, formatType):
+        return (contentType, formatType) in self.__indexD["valid"]
+
+    def getExtension(self, formatType):
+        """Return the file name extension for the input format or None."""
+        return self.__indexD["format"].get(formatType)
+
+    def getFormatsForExtension(self, extension):
+        """Return the list of formats using the input file name extension (e.g. "xml" -> ["pdbml", "xml"])."""
+        return list(self.__indexD["extension"].get(extension, []))
+
+    def parseFileName(self, fileName):
+        """Parse an archive file name (or path) e.g. D_1000000001_model-upload_P1.cif.V2 -
+
+        Returns: {"dataSetId", "contentType", "milestone", "format", "partNumber", "version"} or None
+
+        contentType is the base content type.  Where several formats share the extension the first
+        format allowed for the content type is returned.  version is None for file names without a
+        version suffix.
+        """
+        mObj = self._fileNamePattern.match(os.path.basename(fileName))
+        if mObj is None:
+            return None
+        tup = self.__indexD["acronym"].get(mObj.group("acronym"))
+        if tup is None:
+            return None
+        contentType, milestone = tup
+        formatL = self.__indexD["extension"].get(mObj.group("extension"), [])
+        formatType = next((fmt for fmt in formatL if (contentType, fmt) in self.__indexD["valid"]), None)
+        if formatType is None:
+            return None
+        version = mObj.group("version")
+        return {
+            "dataSetId": mObj.group("dataSetId"),
+            "contentType": contentType,
+            "milestone": milestone,
+            "format": formatType,
+            "partNumber": int(mObj.group("partNumber")),
+            "version": int(version) if version is not None else None,
+        }
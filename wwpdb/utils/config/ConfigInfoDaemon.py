@@ -0,0 +1,413 @@
+##
+# File:    ConfigInfoDaemon.py
+# Date:    19-Oct-2026
+#
+# Updates:
+##
+"""
+Local daemon serving resolved site configuration over a Unix domain socket and its client.
+
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "John Westbrook"
+__email__ = "jwest@rcsb.rutgers.edu"
+__license__ = "Apache 2.0"
+__version__ = "V0.01"
+
+import json
+import logging
+import os
+import shutil
+import socket
+import struct
+import sys
+import threading
+import time
+
+from wwpdb.utils.config.ConfigInfoData import ConfigInfoData
+
+logger = logging.getLogger(__name__)
+
+# Frames are a header (code, payload length) followed by a JSON (UTF-8) encoded payload -
+#
+#   request  code   payload                response payload (status OK)
+#   1 get           (siteId, key)          value
+#   2 get_many      (siteId, [key, ...])   {key: value, ...} for the keys present
+#   3 snapshot      (siteId,)              {key: value, ...} complete configuration
+#   4 sites         ()                     [siteId, ...]
+#
+# Response codes are 0 (OK), 1 (site or key not found) and 2 (error, payload is the message).
+_HEADER = struct.Struct("!BI")
+_OP_GET = 1
+_OP_GET_MANY = 2
+_OP_SNAPSHOT = 3
+_OP_SITES = 4
+_STATUS_OK = 0
+_STATUS_NOT_FOUND = 1
+_STATUS_ERROR = 2
+_MAX_FRAME = 256 * 1024 * 1024
+
+
+def _encode(obj):
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def _decode(payload):
+    return json.loads(payload.decode("utf-8"))
+
+
+def _recvExact(sock, nBytes):
+    bufL = []
+    while nBytes > 0:
+        buf = sock.recv(min(nBytes, 1048576))
+        if not buf:
+            raise EOFError("connection closed")
+        bufL.append(buf)
+        nBytes -= len(buf)
+    return b"".join(bufL)
+
+
+def _recvFrame(sock):
+    code, nBytes = _HEADER.unpack(_recvExact(sock, _HEADER.size))
+    if nBytes > _MAX_FRAME:
+        raise ValueError("frame length %d exceeds limit" % nBytes)
+    return code, _recvExact(sock, nBytes)
+
+
+def _sendFrame(sock, code, payload):
+    sock.sendall(_HEADER.pack(code, len(payload)) + payload)
+
+
+class ConfigInfoDaemon:
+    """
+    Holds the resolved configuration (as returned by ConfigInfoData().getConfigDictionary()) for the input
+    sites and answers get, get_many and snapshot requests over a Unix domain socket -
+
+        python -m wwpdb.utils.config.ConfigInfoDaemon --socket /run/wwpdb/config.sock --siteid WWPDB_DEPLOY_TEST_RU
+
+    Clients select the daemon with WWPDB_CONFIG_DAEMON_SOCKET (see ConfigInfoDaemonClient and ConfigInfo).
+    Snapshots are encoded once per reload.  reload() (SIGHUP for the command line daemon) reads the cache
+    files of each site below topConfigPath (default TOP_WWPDB_SITE_CONFIG_DIR) again, searching siteLoc
+    (default WWPDB_SITE_LOC) and then the other locations, and resolves the configuration.
+
+    Payloads are JSON encoded so that daemon and clients may run different Python versions.  Values are
+    served as JSON types - tuples are returned as lists and dictionary keys as strings.  The socket is
+    created with owner only permissions (0600) by default and receives its permissions before it is
+    visible at the socket path.  A wider mode serves the configuration to every user it admits.
+    """
+
+    def __init__(self, socketPath, siteIds, mode=0o600, siteLoc=None, topConfigPath=None):
+        self.__socketPath = socketPath
+        self.__siteIdL = [siteIds] if isinstance(siteIds, str) else list(siteIds)
+        self.__mode = mode
+        self.__siteLoc = siteLoc if siteLoc else os.getenv("WWPDB_SITE_LOC")
+        self.__topConfigPath = topConfigPath
+        self.__configD = {}
+        self.__snapshotD = {}
+        self.__server = None
+        self.__thread = None
+        self.reload()
+
+    def reload(self):
+        """Read the cache files of each site, resolve the configuration and swap it in.
+
+        Returns the number of sites loaded.
+        """
+        configD = {}
+        snapshotD = {}
+        for siteId in self.__siteIdL:
+            try:
+                self.__loadCacheFiles(siteId)
+                cD = ConfigInfoData(siteId=siteId, verbose=False).getConfigDictionary()
+                snapshotD[siteId] = _encode(cD)
+                configD[siteId] = cD
+            except Exception as e:  # noqa: BLE001
+                logger.error("failed loading configuration for site %s - %s", siteId, str(e))
+        self.__configD, self.__snapshotD = configD, snapshotD
+        logger.info("loaded configuration for %d sites", len(configD))
+        return len(configD)
+
+    def __loadCacheFiles(self, siteId):
+        """Register the current content of the site cache files (the cache module imported by ConfigInfoData
+        is never imported again).  Sites without cache files are resolved as before.
+        """
+        from wwpdb.utils.config.ConfigInfoCacheWatcher import ConfigInfoCacheWatcher  # pylint: disable=import-outside-toplevel
+        from wwpdb.utils.config.ConfigInfoFile import ConfigInfoFile  # pylint: disable=import-outside-toplevel
+
+        topConfigPath = self.__topConfigPath if self.__topConfigPath else os.getenv("TOP_WWPDB_SITE_CONFIG_DIR")
+        if not topConfigPath:
+            return False
+        locL = [self.__siteLoc] if self.__siteLoc else []
+        for siteLoc in locL + list(ConfigInfoFile.CACHE_LOCATION_NAMES):
+            if os.path.isdir(os.path.join(topConfigPath, siteLoc.lower(), siteId.lower())):
+                cW = ConfigInfoCacheWatcher(siteId=siteId, siteLoc=siteLoc, topConfigPath=topConfigPath)
+                return bool(cW.load())
+        return False
+
+    def getSocketPath(self):
+        return self.__socketPath
+
+    def start(self):
+        """Serve requests on a background thread."""
+        self.__bind()
+        self.__thread = threading.Thread(target=self.__server.serve_forever, name="ConfigInfoDaemon")
+        self.__thread.daemon = True
+        self.__thread.start()
+        return True
+
+    def serveForever(self):
+        self.__bind()
+        try:
+            self.__server.serve_forever()
+        finally:
+            self.__close()
+
+    def stop(self):
+        if self.__server is not None:
+            self.__server.shutdown()
+            if self.__thread is not None:
+                self.__thread.join()
+                self.__thread = None
+            self.__close()
+
+    def __bind(self):
+        # server modules are imported here as client processes only use the protocol helpers
+        import socketserver  # pylint: disable=import-outside-toplevel
+        import tempfile  # pylint: disable=import-outside-toplevel
+
+        if os.path.exists(self.__socketPath):
+            # remove a stale socket left by a previous daemon
+            os.unlink(self.__socketPath)
+        daemon = self
+
+        class _Handler(socketserver.BaseRequestHandler):
+            def handle(self):
+                daemon.handleConnection(self.request)
+
+        # bind within a private (0700) directory and set the permissions before the socket is moved into
+        # place so that it is never reachable with the permissions derived from the umask
+        dirPath = tempfile.mkdtemp(prefix=".config-sock-", dir=os.path.dirname(os.path.abspath(self.__socketPath)))
+        try:
+            bindPath = os.path.join(dirPath, "sock")
+            self.__server = socketserver.ThreadingUnixStreamServer(bindPath, _Handler)
+            self.__server.daemon_threads = True
+            os.chmod(bindPath, self.__mode)
+            os.rename(bindPath, self.__socketPath)
+        except Exception:
+            if self.__server is not None:
+                self.__server.server_close()
+                self.__server = None
+            raise
+        finally:
+            shutil.rmtree(dirPath, ignore_errors=True)
+
+    def __close(self):
+        if self.__server is not None:
+            self.__server.server_close()
+            self.__server = None
+            try:
+                os.unlink(self.__socketPath)
+            except OSError:
+                pass
+
+    def handleConnection(self, sock):
+        """Answer requests on the input connected socket until the client disconnects."""
+        while True:
+            try:
+                code, payload = _recvFrame(sock)
+            except (EOFError, OSError, ValueError, struct.error):
+                return
+            try:
+                status, rPayload = self.__answer(code, payload)
+            except Exception as e:  # noqa: BLE001
+                status, rPayload = _STATUS_ERROR, _encode(str(e))
+            try:
+                _sendFrame(sock, status, rPayload)
+            except OSError:
+                return
+
+    def __answer(self, code, payload):
+        args = _decode(payload)
+        if code == _OP_SITES:
+            return _STATUS_OK, _encode(sorted(self.__configD))
+        siteId = args[0]
+        if code == _OP_SNAPSHOT:
+            if siteId not in self.__snapshotD:
+                return _STATUS_NOT_FOUND, b""
+            return _STATUS_OK, self.__snapshotD[siteId]
+        cD = self.__configD.get(siteId)
+        if cD is None:
+            return _STATUS_NOT_FOUND, b""
+        if code == _OP_GET:
+            if args[1] not in cD:
+                return _STATUS_NOT_FOUND, b""
+            return _STATUS_OK, _encode(cD[args[1]])
+        if code == _OP_GET_MANY:
+            return _STATUS_OK, _encode({k: cD[k] for k in args[1] if k in cD})
+        return _STATUS_ERROR, _encode("unknown request code %d" % code)
+
+
+class ConfigInfoDaemonClient:
+    """
+    Client of ConfigInfoDaemon.  Requests raise OSError (or EOFError) if the daemon is not available.
+
+    getSnapshot() is used by ConfigInfo() when WWPDB_CONFIG_DAEMON_SOCKET is set.  Snapshots are fetched
+    once per process and site, and a failure to reach the daemon or a site not served by the daemon is
+    remembered for retryInterval seconds so that constructing ConfigInfo() falls back to local loading
+    without a request per construction.  Snapshots are kept for the lifetime of the process - a reload of
+    the daemon is seen by processes started afterwards (or after reset()), while get() and getMany()
+    always return the current configuration.
+    """
+
+    _lock = threading.Lock()
+    _snapshotD = {}  # type: dict  # noqa: RUF012
+    _failedD = {}  # type: dict  # noqa: RUF012
+    _retryInterval = 30.0
+
+    def __init__(self, socketPath=None, timeout=2.0):
+        self.__socketPath = socketPath if socketPath else os.getenv("WWPDB_CONFIG_DAEMON_SOCKET")
+        self.__timeout = timeout
+        self.__sock = None
+        self.__lock = threading.Lock()
+
+    def get(self, siteId, key, default=None):
+        status, payload = self.__request(_OP_GET, (siteId, key))
+        return _decode(payload) if status == _STATUS_OK else default
+
+    def getMany(self, siteId, keyList):
+        """Return {key: value} for the keys in the input list present in the site configuration."""
+        status, payload = self.__request(_OP_GET_MANY, (siteId, list(keyList)))
+        return _decode(payload) if status == _STATUS_OK else {}
+
+    def snapshot(self, siteId):
+        """Return the complete configuration dictionary for the input site or None if the site is not served."""
+        status, payload = self.__request(_OP_SNAPSHOT, (siteId,))
+        return _decode(payload) if status == _STATUS_OK else None
+
+    def getSiteIds(self):
+        _, payload = self.__request(_OP_SITES, ())
+        return _decode(payload)
+
+    def close(self):
+        with self.__lock:
+            self.__disconnect()
+
+    def __request(self, code, args):
+        with self.__lock:
+            try:
+                if self.__sock is None:
+                    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+                    sock.settimeout(self.__timeout)
+                    try:
+                        sock.connect(self.__socketPath)
+                    except Exception:
+                        sock.close()
+                        raise
+                    self.__sock = sock
+                _sendFrame(self.__sock, code, _encode(args))
+                status, payload = _recvFrame(self.__sock)
+            except Exception:
+                self.__disconnect()
+                raise
+        if status == _STATUS_ERROR:
+            raise OSError("configuration daemon error - %s" % _decode(payload))
+        return status, payload
+
+    def __disconnect(self):
+        if self.__sock is not None:
+            try:
+                self.__sock.close()
+            finally:
+                self.__sock = None
+
+    @classmethod
+    def getSnapshot(cls, socketPath, siteId):
+        """Return the configuration dictionary for the input site served by the daemon at the input socket
+        path or None if the daemon or site is not available (see class documentation).
+        """
+        ky = (socketPath, siteId)
+        with cls._lock:
+            if ky in cls._snapshotD:
+                return cls._snapshotD[ky]
+            now = time.time()
+            if now < cls._failedD.get(socketPath, 0.0) or now < cls._failedD.get(ky, 0.0):
+                return None
+        cD = None
+        try:
+            client = cls(socketPath=socketPath)
+            try:
+                cD = client.snapshot(siteId)
+            finally:
+                client.close()
+        except Exception as e:  # noqa: BLE001
+            logger.info("configuration daemon at %s not available - %s", socketPath, str(e))
+            with cls._lock:
+                cls._failedD[socketPath] = time.time() + cls._retryInterval
+            return None
+        with cls._lock:
+            if cD is not None:
+                cls._snapshotD[ky] = cD
+            else:
+                # the site is not served - local loading is used until the retry interval has passed
+                cls._failedD[ky] = time.time() + cls._retryInterval
+        return cD
+
+    @classmethod
+    def reset(cls):
+        """Discard the snapshots, connection failures and missing sites remembered by getSnapshot()."""
+        with cls._lock:
+            cls._snapshotD = {}
+            cls._failedD = {}
+
+
+def main():  # pragma: no cover
+    import signal  # pylint: disable=import-outside-toplevel
+    from optparse import OptionParser  # pylint: disable=deprecated-module,import-outside-toplevel
+
+    usage = """
+    %prog [options]
+
+    Examples:
+
+     Serve the resolved configuration for the input sites on a Unix domain socket:
+
+       python %prog --socket=/run/wwpdb/config.sock --siteid=WWPDB_DEPLOY_TEST_RU,WWPDB_DEPLOY_TEST
+
+     Clients use the daemon when WWPDB_CONFIG_DAEMON_SOCKET is set to the socket path.
+     SIGHUP reloads the configuration from the site cache files and SIGTERM stops the daemon.
+
+     A --mode wider than 600 serves the configuration to the other users admitted by the mode.
+
+    """
+    parser = OptionParser(usage)
+    parser.add_option("--socket", dest="socketPath", default=None, help="Unix domain socket path")
+    parser.add_option("--siteid", dest="siteIds", default=None, help="Comma separated wwPDB site IDs (default WWPDB_SITE_ID)")
+    parser.add_option(
+        "--mode",
+        dest="mode",
+        default="600",
+        help="Socket file permissions (octal, default 600)",
+    )
+    parser.add_option("--locid", dest="siteLoc", default=None, help="wwPDB location ID (default WWPDB_SITE_LOC)")
+    options, _args = parser.parse_args()  # pylint: disable=unused-variable
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s]-%(module)s.%(funcName)s: %(message)s")
+
+    socketPath = options.socketPath if options.socketPath else os.getenv("WWPDB_CONFIG_DAEMON_SOCKET")
+    siteIds = options.siteIds if options.siteIds else os.getenv("WWPDB_SITE_ID")
+    if not socketPath or not siteIds:
+        sys.stderr.write("--socket and --siteid (or WWPDB_CONFIG_DAEMON_SOCKET and WWPDB_SITE_ID) are required\n")
+        sys.exit(1)
+    daemon = ConfigInfoDaemon(
+        socketPath,
+        [t.strip().upper() for t in siteIds.split(",") if t.strip()],
+        mode=int(options.mode, 8),
+        siteLoc=options.siteLoc,
+    )
+    signal.signal(signal.SIGHUP, lambda signum, frame: daemon.reload())
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    daemon.serveForever()
+
+
+if __name__ == "__main__":
+    main()
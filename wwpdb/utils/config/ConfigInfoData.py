@@ -191,6 +191,12 @@
 # 26-May-2023 zf   add 'xml-check-report' for xml checking report
 # 26-Aug-2024 zf   add 'pcm-missing-data' content type and 'csv' format
 # 19-Dec-2024 my   add 'nmrif' content type, NMRIF/NMR-STAR file containing NMR DepUI metadata (DAOTHER-8905)
+# 19-Oct-2026      add registry of site configuration dictionaries that supersede the imported cache (hot reload)
+# 19-Oct-2026      report initialization phase timings to the ConfigInfoTiming hook
+# 19-Oct-2026      build the content milestone variants once per process, add preloadSiteConfig()
+# 19-Oct-2026      notify registry listeners of registered site configuration changes
+# 19-Oct-2026      share a single copy of each registered site configuration across instances
+# 19-Oct-2026      import the ConfigInfoFileCache module on first use
 ##
 """
 Container for general and site-specific configuration data.
@@ -205,17 +211,36 @@ __version__ = "V0.01"
 
 import os
 import sys
+import time
 import traceback
 
+from wwpdb.utils.config.ConfigInfoTiming import ConfigInfoTiming
+
 if sys.version_info[0] > 2:  # noqa: UP036
     from typing import Dict, List, Tuple  # noqa: F401
 
 # ----------------------------------------------------------------------------------------------
-#  Try to import externally cached configuration options.  Gracefully ignore any errors.
-try:  # noqa: SIM105
-    from ConfigInfoFileCache import ConfigInfoFileCache  # type: ignore[import-not-found] # pylint: disable=import-error
-except:  # noqa: E722 pylint: disable=bare-except
-    pass
+#  Externally cached configuration options are imported on first use (processes served by the
+#  configuration daemon or by registered dictionaries do not import them).  Gracefully ignore any errors.
+_timer = getattr(time, "perf_counter", time.time)
+_cacheImportD = {}  # type: dict
+# reported once as phase "cache_import" by the first ConfigInfoData() reading the cache with a timing hook installed
+_cacheImportTime = 0.0
+
+
+def _getConfigInfoFileCache():
+    """Return the ConfigInfoFileCache class of the externally cached configuration module or None."""
+    global _cacheImportTime  # noqa: PLW0603 # pylint: disable=global-statement
+    if "cls" not in _cacheImportD:
+        tS = _timer()
+        try:
+            from ConfigInfoFileCache import ConfigInfoFileCache  # type: ignore[import-not-found] # pylint: disable=import-error,import-outside-toplevel
+
+            _cacheImportD["cls"] = ConfigInfoFileCache
+        except:  # noqa: E722 pylint: disable=bare-except
+            _cacheImportD["cls"] = None
+        _cacheImportTime = _timer() - tS
+    return _cacheImportD["cls"]
 
 
 class ConfigInfoData:
@@ -230,7 +255,18 @@ class ConfigInfoData:
 
     """
 
+    # Site configuration dictionaries registered at run time (e.g. by ConfigInfoCacheWatcher) superseding
+    # the imported ConfigInfoFileCache module -
+    _siteConfigRegistryD = {}  # type: dict
+    # Preloaded site configuration dictionaries including the class-level options (see preloadSiteConfig()) -
+    _siteConfigSharedD = {}  # type: dict
+    # Copies of the registered dictionaries extended with the class-level options - siteId: (registeredD, copyD)
+    _siteConfigCopyD = {}  # type: dict
+    # Callables notified of changes to the registry (see addRegistryListener()) -
+    _registryListenerL = []  # type: list
+    _cacheImportReported = False
     _contentTypeInfoD = {}  # type: dict
+    _contentMilestoneArchiveT = None
     _contentTypeInfoBaseD = {
         "model": (["pdbx", "pdb", "pdbml", "cifeps"], "model"),
         "model-emd": (["pdbx", "xml"], "model-emd"),
@@ -709,11 +745,33 @@ class ConfigInfoData:
         #    'CONTENT_TYPE_DICTIONARY', 'CONTENT_MILESTONE_LIST', 'CONTENT_TYPE_BASE_DICTIONARY', ...) are
         #     NOT externally CACHED.
         #
+        pT = ConfigInfoTiming.getPhaseTimer("ConfigInfoData", siteId=self.__siteId)
+        importTime = _cacheImportTime
+        if useCache and pT.isActive() and not ConfigInfoData._cacheImportReported:
+            ConfigInfoData._cacheImportReported = True
+            _getConfigInfoFileCache()
+            pT.add("cache_import", _cacheImportTime)
+        shared = False
         if useCache:
             readCache = False
+            phase = "cache_lookup"
             try:
-                cls = ConfigInfoFileCache()
-                cacheD = cls.getConfigDictionary(siteId=self.__siteId)
+                cacheD = ConfigInfoData._siteConfigRegistryD.get(self.__siteId)
+                if cacheD is not None and cacheD is ConfigInfoData._siteConfigSharedD.get(self.__siteId):
+                    # preloaded dictionaries include the class-level options and are shared without copying
+                    shared = True
+                elif cacheD is not None:
+                    # registered dictionaries are not modified - the class-level options are added to a copy made
+                    # once per registration and shared by the instances for the site (as is the imported cache)
+                    cacheD = self.__getRegisteredCopy(self.__siteId, cacheD)
+                else:
+                    cls = _getConfigInfoFileCache()()
+                    # cache modules written before hasConfigDictionary() was added are reported as cache_lookup
+                    hasFunc = getattr(cls, "hasConfigDictionary", None)
+                    if hasFunc is not None and not hasFunc(self.__siteId):
+                        # served by the JSON cache file search in getJsonConfigDictionary()
+                        phase = "json_fallback"
+                    cacheD = cls.getConfigDictionary(siteId=self.__siteId)
                 if self.__debug:
                     self.__lfh.write(
                         "%s.%s Imported cached configuration dictionary length %d for site %s\n"
@@ -730,6 +788,7 @@ class ConfigInfoData:
                     )  # noqa: SLF001
                     traceback.print_exc(file=self.__lfh)
                 readCache = False
+            pT.mark(phase, less=_cacheImportTime - importTime)
 
             #
             # Use fall back configuration options for now  -- to be deprecated in the future --
@@ -757,45 +816,135 @@ class ConfigInfoData:
         #  Add other class-level - common configuration components - these configuration options are tightly coupled
         #  to project operation and should remain as static declarations in this class module.
         #
-        self.__addMilestoneVariants()
-        self.__D["FILE_FORMAT_EXTENSION_DICTIONARY"] = ConfigInfoData._fileFormatExtensionD
-        self.__D["CONTENT_TYPE_DICTIONARY"] = ConfigInfoData._contentTypeInfoD
-        self.__D["CONTENT_MILESTONE_LIST"] = ConfigInfoData._contentMilestoneL
-        self.__D["CONTENT_MILESTONE_ARCHIVE_LIST"] = [
-            t for t in ConfigInfoData._contentMilestoneL if t != "upload-convert"
-        ]
-        self.__D["CONTENT_TYPE_BASE_DICTIONARY"] = ConfigInfoData._contentTypeInfoBaseD
-        self.__D["SITE_DATASET_ID_ASSIGNMENT_DICTIONARY"] = ConfigInfoData._siteDataSetIdAssignmentD
-        self.__D["SITE_DATASET_TEST_ID_ASSIGNMENT_DICTIONARY"] = ConfigInfoData._siteDataSetTestIdAssignmentD
-        self.__D["SITE_GROUP_DATASET_ID_ASSIGNMENT_DICTIONARY"] = ConfigInfoData._siteGroupDataSetIdAssignmentD
-        self.__D["PROJECT_DEPOSIT_SERVICE_DICTIONARY"] = ConfigInfoData._projectDepositSiteServiceD
-        self.__D["PROJECT_CORRESPOND_SERVICE_DICTIONARY"] = ConfigInfoData._projectCorrespondSiteServiceD
-        self.__D["PROJECT_FORWARDING_SERVICE_DICTIONARY"] = ConfigInfoData._projectForwardingSiteServiceD
-        self.__D["PROJECT_CONTENTWS_SERVICE_DICTIONARY"] = ConfigInfoData._projectContentWSiteServiceD
-        self.__D["PROJECT_VAL_REL_CUTOFF"] = ConfigInfoData._valRelCutoffD
-        self.__D["REGIONS"] = ConfigInfoData._regions
-        self.__D["PRODUCTION_SITES"] = ConfigInfoData._production_sites
-        self.__D["MESSAGE_SUBJECTS"] = ConfigInfoData._message_subjects
-        self.__D["COMMUNICATION_RELEASE_MESSAGE_SUBJECTS"] = ConfigInfoData._communication_release_message_subjects
-        self.__D["COMMUNICATION_APPROVAL_WITHOUT_CHANGES_MESSAGE_SUBJECTS"] = (
-            ConfigInfoData._communication_approval_no_correct
-        )
-        self.__D["PDBX_DICTIONARY_NAME_DICT"] = ConfigInfoData._pdbx_dictionary_name_dict
-        self.__D["SITE_REFDATA_CVS_PATH"] = ConfigInfoData._ref_data_proj_names.get("cvs_path")
-        self.__D["SITE_REFDATA_PROJ_NAME_CC"] = ConfigInfoData._ref_data_proj_names.get("ccd")
-        self.__D["SITE_REFDATA_PROJ_NAME_PRD"] = ConfigInfoData._ref_data_proj_names.get("prd")
-        self.__D["SITE_REFDATA_PROJ_NAME_PRDCC"] = ConfigInfoData._ref_data_proj_names.get("prdcc")
-        self.__D["SITE_REFDATA_PROJ_NAME_PRD_FAMILY"] = ConfigInfoData._ref_data_proj_names.get("prd_family")
+        if not shared:
+            self.__addMilestoneVariants()
+            pT.mark("milestone_variants")
+            self.__addClassOptions(self.__D)
+            pT.mark("class_options")
+
+    @classmethod
+    def __addClassOptions(cls, optD):
+        """Add the class-level common configuration options to the input dictionary."""
+        optD["FILE_FORMAT_EXTENSION_DICTIONARY"] = ConfigInfoData._fileFormatExtensionD
+        optD["CONTENT_TYPE_DICTIONARY"] = ConfigInfoData._contentTypeInfoD
+        optD["CONTENT_MILESTONE_LIST"] = ConfigInfoData._contentMilestoneL
+        # a new list for each dictionary as callers may modify it
+        optD["CONTENT_MILESTONE_ARCHIVE_LIST"] = list(ConfigInfoData._contentMilestoneArchiveT)
+        optD["CONTENT_TYPE_BASE_DICTIONARY"] = ConfigInfoData._contentTypeInfoBaseD
+        optD["SITE_DATASET_ID_ASSIGNMENT_DICTIONARY"] = ConfigInfoData._siteDataSetIdAssignmentD
+        optD["SITE_DATASET_TEST_ID_ASSIGNMENT_DICTIONARY"] = ConfigInfoData._siteDataSetTestIdAssignmentD
+        optD["SITE_GROUP_DATASET_ID_ASSIGNMENT_DICTIONARY"] = ConfigInfoData._siteGroupDataSetIdAssignmentD
+        optD["PROJECT_DEPOSIT_SERVICE_DICTIONARY"] = ConfigInfoData._projectDepositSiteServiceD
+        optD["PROJECT_CORRESPOND_SERVICE_DICTIONARY"] = ConfigInfoData._projectCorrespondSiteServiceD
+        optD["PROJECT_FORWARDING_SERVICE_DICTIONARY"] = ConfigInfoData._projectForwardingSiteServiceD
+        optD["PROJECT_CONTENTWS_SERVICE_DICTIONARY"] = ConfigInfoData._projectContentWSiteServiceD
+        optD["PROJECT_VAL_REL_CUTOFF"] = ConfigInfoData._valRelCutoffD
+        optD["REGIONS"] = ConfigInfoData._regions
+        optD["PRODUCTION_SITES"] = ConfigInfoData._production_sites
+        optD["MESSAGE_SUBJECTS"] = ConfigInfoData._message_subjects
+        optD["COMMUNICATION_RELEASE_MESSAGE_SUBJECTS"] = ConfigInfoData._communication_release_message_subjects
+        optD["COMMUNICATION_APPROVAL_WITHOUT_CHANGES_MESSAGE_SUBJECTS"] = ConfigInfoData._communication_approval_no_correct
+        optD["PDBX_DICTIONARY_NAME_DICT"] = ConfigInfoData._pdbx_dictionary_name_dict
+        optD["SITE_REFDATA_CVS_PATH"] = ConfigInfoData._ref_data_proj_names.get("cvs_path")
+        optD["SITE_REFDATA_PROJ_NAME_CC"] = ConfigInfoData._ref_data_proj_names.get("ccd")
+        optD["SITE_REFDATA_PROJ_NAME_PRD"] = ConfigInfoData._ref_data_proj_names.get("prd")
+        optD["SITE_REFDATA_PROJ_NAME_PRDCC"] = ConfigInfoData._ref_data_proj_names.get("prdcc")
+        optD["SITE_REFDATA_PROJ_NAME_PRD_FAMILY"] = ConfigInfoData._ref_data_proj_names.get("prd_family")
+        return optD
 
     def getConfigDictionary(self):
+        """Return the configuration dictionary.
+
+        For a preloaded site (see preloadSiteConfig()) this dictionary and its values are shared by all
+        instances (and by forked workers) and must be treated as read-only.  Copy before modifying.
+        As with the imported cache, the dictionary of a registered site is shared by the instances
+        constructed for the same registration.
+        """
         return self.__D
 
-    def __addMilestoneVariants(self):  # noqa: PLR6301
-        """Update base content dictionary with content milestone variants."""
-        ConfigInfoData._contentTypeInfoD = {}
+    @classmethod
+    def registerSiteConfig(cls, siteId, configD):
+        """Register the input configuration dictionary for the input site superseding the imported cache.
+
+        The registered dictionary is swapped in as a single assignment and is used by all subsequently
+        constructed instances for the site.  The dictionary must not be modified after registration.
+        Registry listeners are then notified (see addRegistryListener()).
+        """
+        cls._siteConfigRegistryD[siteId] = configD
+        cls.__notifyRegistryListeners(siteId)
+
+    @classmethod
+    def unregisterSiteConfig(cls, siteId):
+        cls._siteConfigRegistryD.pop(siteId, None)
+        cls._siteConfigSharedD.pop(siteId, None)
+        cls._siteConfigCopyD.pop(siteId, None)
+        cls.__notifyRegistryListeners(siteId)
+
+    @classmethod
+    def __getRegisteredCopy(cls, siteId, configD):
+        entry = cls._siteConfigCopyD.get(siteId)
+        if entry is None or entry[0] is not configD:
+            entry = (configD, dict(configD))
+            cls._siteConfigCopyD[siteId] = entry
+        return entry[1]
+
+    @classmethod
+    def addRegistryListener(cls, callback):
+        """Call callback(siteId) after a site configuration is registered or unregistered (e.g. ConfigInfo
+        refreshes its existing instances for the site).
+        """
+        if callback not in cls._registryListenerL:
+            cls._registryListenerL.append(callback)
+
+    @classmethod
+    def __notifyRegistryListeners(cls, siteId):
+        for callback in list(cls._registryListenerL):
+            callback(siteId)
+
+    @classmethod
+    def getRegisteredSiteConfig(cls, siteId):
+        return cls._siteConfigRegistryD.get(siteId)
+
+    @classmethod
+    def preloadSiteConfig(cls, siteId):
+        """Resolve the configuration dictionary for the input site (registered or cached) and register a
+        complete copy including the class-level options.  Subsequently constructed instances for the site
+        share this dictionary without copying (e.g. across workers forked after preloading) and neither the
+        dictionary nor its values may be modified.  Registering another dictionary for the site supersedes the preloaded dictionary.
+
+        Returns the number of site options preloaded (0 if no configuration is found for the site).
+        """
+        cacheD = cls._siteConfigRegistryD.get(siteId)
+        if cacheD is not None and cacheD is cls._siteConfigSharedD.get(siteId):
+            return len(cacheD) - len(cls.__addClassOptions({}))
+        if cacheD is None:
+            try:
+                cacheD = _getConfigInfoFileCache()().getConfigDictionary(siteId=siteId)
+            except:  # noqa: E722 pylint: disable=bare-except
+                cacheD = {}
+        if not cacheD:
+            return 0
+        sharedD = dict(cacheD)
+        cls.__addMilestoneVariants()
+        cls.__addClassOptions(sharedD)
+        cls._siteConfigSharedD[siteId] = sharedD
+        cls._siteConfigRegistryD[siteId] = sharedD
+        return len(cacheD)
+
+    @classmethod
+    def __addMilestoneVariants(cls):
+        """Update base content dictionary with content milestone variants.
+
+        The variants are built once per process and shared by all instances (e.g. across forked workers).
+        """
+        if ConfigInfoData._contentMilestoneArchiveT is not None:
+            return
+        contentTypeInfoD = {}
         for k, v in ConfigInfoData._contentTypeInfoBaseD.items():
-            ConfigInfoData._contentTypeInfoD[k] = v
+            contentTypeInfoD[k] = v
             for ms in ConfigInfoData._contentMilestoneL:
                 kM = k + "-" + ms
                 acM = v[1] + "-" + ms
-                ConfigInfoData._contentTypeInfoD[kM] = (v[0], acM)
+                contentTypeInfoD[kM] = (v[0], acM)
+        ConfigInfoData._contentTypeInfoD = contentTypeInfoD
+        ConfigInfoData._contentMilestoneArchiveT = tuple(t for t in ConfigInfoData._contentMilestoneL if t != "upload-convert")
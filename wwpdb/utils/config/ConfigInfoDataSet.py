@@ -9,6 +9,14 @@
 #  19-Aug-2016  jdw  add getDefaultSiteId()
 #  23-Aug-2016  jdw  add getDataSetLocations() and writeLocationList() and getDataSetLocationDict() and removeDataSets()
 #  01-Jan-2018  ep   add getTestIdRange()
+#  19-Oct-2026       write location file backups through the ConfigInfoBackup() retention policy
+#  19-Oct-2026       write the location file atomically with ConfigInfoAtomicFile()
+#  19-Oct-2026       add registry of location dictionaries superseding the location file (hot reload)
+#  19-Oct-2026       defer the import of oslo_concurrency until a lock is required
+#  19-Oct-2026       add transactional updateLocations() with the exception file lock and lock-free snapshot reads
+#  19-Oct-2026       add interval index for default range lookups and getLocationStatistics()
+#  19-Oct-2026       maintain a reverse site to sorted data set id index for getDataSetLocations()
+#  19-Oct-2026       use the shared ConfigInfoIdRange() interval index for default range lookups
 ##
 """
 Provides accessors for the correspondence between deposition data identifiers and
@@ -22,15 +30,17 @@ __email__ = "jwest@rcsb.rutgers.edu"
 __license__ = "Creative Commons Attribution 3.0 Unported"
 __version__ = "V0.01"
 
-import datetime
+import bisect
 import json
 import logging
+import os
 import sys
 
-from oslo_concurrency import lockutils
-
 from wwpdb.utils.config.ConfigInfo import ConfigInfo, getSiteId
 from wwpdb.utils.config.ConfigInfoApp import ConfigInfoAppDepUI
+from wwpdb.utils.config.ConfigInfoAtomicFile import ConfigInfoAtomicFile
+from wwpdb.utils.config.ConfigInfoBackup import ConfigInfoBackup
+from wwpdb.utils.config.ConfigInfoIdRange import ConfigInfoIdRange
 
 logger = logging.getLogger(__name__)
 
@@ -42,6 +52,13 @@ class ConfigInfoDataSet:
 
     """
 
+    # Location dictionaries registered at run time (e.g. by ConfigInfoCacheWatcher) by resource file path -
+    _locationRegistryD = {}  # type: dict  # noqa: RUF012
+    # Location file snapshots by resource file path - d[filePath] = ((st_ino, st_size, st_mtime), dsLocD)
+    _locationSnapshotD = {}  # type: dict  # noqa: RUF012
+    # Reverse indexes by resource file path - d[filePath] = (dsLocD, {siteId: [sorted data set ids]})
+    _locationSiteIndexD = {}  # type: dict  # noqa: RUF012
+
     def __init__(self, verbose=False, log=sys.stderr):  # noqa: ARG002 pylint: disable=unused-argument
         self.__verbose = verbose
         self.__debug = True
@@ -52,8 +69,9 @@ class ConfigInfoDataSet:
         self.__depTestIdAssignments = self.__cI.get("SITE_DATASET_TEST_ID_ASSIGNMENT_DICTIONARY")
         self.__siteBackupD = self.__cI.get("SITE_BACKUP_DICT", default={})
         self.__dsLocD = None
+        self.__rangeIndex = None
         self.__lockDirPath = self.__cI.get("SITE_SERVICE_REGISTRATION_LOCKDIR_PATH", "/tmp")  # noqa: S108
-        lockutils.set_defaults(self.__lockDirPath)
+        self.__backup = ConfigInfoBackup.fromConfig(self.__cI)
 
     def getSiteId(self, depSetId):
         """Return siteId for the input depSetId subject to site backup details -
@@ -83,13 +101,11 @@ class ConfigInfoDataSet:
         return d
 
     def getDataSetLocations(self, siteId):
-        dsL = []
+        """Return the sorted list of data set ids assigned to the input site in the location file."""
         try:
-            d = self.__readLocationDictionary()
-            for ky in d:
-                if d[ky] == siteId:
-                    dsL.append(ky)
-            return dsL
+            fp = self.__cIDepUI.get_site_dataset_siteloc_file_path()
+            siteIndexD = self.__getSiteIndex(fp, self.__getLocationSnapshot(fp))
+            return list(siteIndexD.get(siteId, []))
         except Exception as e:
             logger.info("failed reading data set locations for site %r - %s", siteId, str(e))
             if self.__debug:
@@ -97,61 +113,216 @@ class ConfigInfoDataSet:
         return []
 
     def removeDataSets(self, dataSetIdList):
-        try:
-            d = self.__readLocationDictionary()
-            for dsId in dataSetIdList:
-                if dsId in d:
-                    del d[dsId]
-            return self.__writeLocationDictionary(d)
-        except Exception as e:
-            logger.error("failed %s", str(e))
-            if self.__debug:
-                logger.exception("failed")
-        return False
+        return self.updateLocations(removeL=dataSetIdList)
 
     def writeLocationList(self, siteId, dataSetIdList):
+        return self.updateLocations(addD={dsId: siteId for dsId in dataSetIdList})
+
+    def updateLocations(self, addD=None, removeL=None, backup=True):
+        """Update the data set location file in a single transaction -
+
+        The data set ids in removeL are removed and then the data set to site assignments
+        in addD (d[<data_set_id>] = <site_id>) are added.  The current file content is read,
+        modified and written while holding the interprocess exception file lock so
+        concurrent updates are not lost.  Readers are not blocked and see either the previous
+        or the updated content.
+
+        Returns: True for success or False otherwise
+        """
+        fp = self.__cIDepUI.get_site_dataset_siteloc_file_path()
         try:
-            d = self.__readLocationDictionary()
-            for dsId in dataSetIdList:
-                d[dsId] = siteId
-            return self.__writeLocationDictionary(d)
+            with self.__getLock():
+                # the file is always read again here - an unchanged file status does not prove unchanged
+                # content (e.g. coarse mtime resolution or a recycled inode) and a stale read would drop the
+                # update of another writer.  The snapshot is only used to update the reverse index.
+                prevD = self.__getCurrentSnapshot(fp)
+                try:
+                    dsLocD = self.__loadLocationFile(fp)
+                except Exception as e:  # noqa: BLE001
+                    logger.error("failed reading data set location file %s for update - %s", fp, str(e))
+                    return False
+                if prevD is not None and dsLocD != prevD:
+                    prevD = None
+                changeL = []
+                for dsId in removeL or []:
+                    dsId = str(dsId)
+                    if dsId in dsLocD:
+                        changeL.append((dsId, dsLocD.pop(dsId), None))
+                for dsId, siteId in (addD or {}).items():
+                    dsId = str(dsId)
+                    changeL.append((dsId, dsLocD.get(dsId), siteId))
+                    dsLocD[dsId] = siteId
+                siteIndexD = self.__updateSiteIndex(fp, prevD, changeL)
+                return self.__writeLocationDictionary(fp, dsLocD, backup=backup, siteIndexD=siteIndexD)
         except Exception as e:
-            logger.error("failed data set locations for site %r - %s", siteId, str(e))
+            logger.error("failed updating data set locations in %s - %s", fp, str(e))
             if self.__debug:
-                logger.exception("failed data set locations for site %rs", siteId)
+                logger.exception("failed updating data set locations in %s", fp)
         return False
 
+    def getLocationStatistics(self, bucketSize=None):
+        """Return statistics for the data set location exceptions computed in a single pass -
+
+        d["total"]      number of exceptions
+        d["sites"]      {siteId: count} by assigned site
+        d["ranges"]     {siteId: count} by the site owning the default id range (None outside all ranges)
+        d["buckets"]    {lower id: count} by id blocks of bucketSize (only if bucketSize is provided)
+        d["redundant"]  sorted ids assigned to the site which owns them by default range
+        d["invalid"]    sorted ids which are not of the form D_<digits>
+        """
+        siteD = {}
+        rangeD = {}
+        bucketD = {}
+        redundantL = []
+        invalidL = []
+        dsLocD = self.__getLocationSnapshot()
+        for dsId, siteId in dsLocD.items():
+            siteD[siteId] = siteD.get(siteId, 0) + 1
+            try:
+                idVal = int(dsId[2:]) if dsId.startswith("D_") else int(dsId)
+            except ValueError:
+                invalidL.append(dsId)
+                continue
+            rangeSiteId = self.__getRangeSiteId(idVal)
+            rangeD[rangeSiteId] = rangeD.get(rangeSiteId, 0) + 1
+            if rangeSiteId == siteId:
+                redundantL.append(dsId)
+            if bucketSize:
+                bucket = idVal - idVal % bucketSize
+                bucketD[bucket] = bucketD.get(bucket, 0) + 1
+        rD = {"total": len(dsLocD), "sites": siteD, "ranges": rangeD, "redundant": sorted(redundantL)}
+        rD["invalid"] = sorted(invalidL)
+        if bucketSize:
+            rD["buckets"] = bucketD
+        return rD
+
     def __readLocationDictionary(self):
         """Read the dictionary cotaining data set site location information.
 
         Returns: d[<data_set_id>] = <site_id> or a empty dictionary.
         """
-        fp = self.__cIDepUI.get_site_dataset_siteloc_file_path()
+        # snapshots are shared - callers may modify the returned copy
+        return dict(self.__getLocationSnapshot())
+
+    def __getLocationSnapshot(self, fp=None):
+        """Return the shared (read-only) location dictionary for the current content of the location file.
+
+        The file is parsed only when its status has changed since the last read.  As the file is
+        replaced atomically no lock is required.
+        """
+        fp = fp if fp else self.__cIDepUI.get_site_dataset_siteloc_file_path()
+        dsLocD = ConfigInfoDataSet._locationRegistryD.get(fp)
+        if dsLocD is not None:
+            return dsLocD
         try:
+            sig = self.__getSignature(fp)
+            dsLocD = self.__getCurrentSnapshot(fp, sig)
+            if dsLocD is not None:
+                return dsLocD
             with open(fp) as infile:
-                return json.load(infile)
+                dsLocD = json.load(infile)
+            ConfigInfoDataSet._locationSnapshotD[fp] = (sig, dsLocD)
+            return dsLocD
         except Exception as e:
             logger.error("failed reading json resource file %s - %s", fp, str(e))
             if self.__debug:
                 logger.exception("failed reading json resource file %s", fp)
         return {}
 
-    @lockutils.synchronized("configdataset.exceptionfile-lock", external=True)
-    def __writeLocationDictionary(self, dsLocD, backup=True):
+    def __getCurrentSnapshot(self, fp, sig=None):
+        """Return the snapshot of the location file if it matches the current file status or None."""
+        sig = sig if sig is not None else self.__getSignature(fp)
+        snapshot = ConfigInfoDataSet._locationSnapshotD.get(fp)
+        if snapshot is not None and sig is not None and snapshot[0] == sig:
+            return snapshot[1]
+        return None
+
+    @staticmethod
+    def __getSiteIndex(fp, dsLocD):
+        """Return the reverse index {siteId: [sorted data set ids]} for the input location dictionary."""
+        entry = ConfigInfoDataSet._locationSiteIndexD.get(fp)
+        if entry is not None and entry[0] is dsLocD:
+            return entry[1]
+        siteIndexD = {}
+        for dsId, siteId in dsLocD.items():
+            siteIndexD.setdefault(siteId, []).append(dsId)
+        for dsL in siteIndexD.values():
+            dsL.sort()
+        ConfigInfoDataSet._locationSiteIndexD[fp] = (dsLocD, siteIndexD)
+        return siteIndexD
+
+    @staticmethod
+    def __updateSiteIndex(fp, prevD, changeL):
+        """Return a reverse index updated with the input changes [(dsId, oldSiteId, newSiteId),...] or None
+        if no index exists for the previous location dictionary.
+
+        The index is copied on write - only the lists of the affected sites are copied.
+        """
+        entry = ConfigInfoDataSet._locationSiteIndexD.get(fp)
+        if prevD is None or entry is None or entry[0] is not prevD:
+            return None
+        siteIndexD = dict(entry[1])
+        copiedS = set()
+        for dsId, oldSiteId, newSiteId in changeL:
+            if oldSiteId == newSiteId:
+                continue
+            for siteId in (oldSiteId, newSiteId):
+                if siteId is not None and siteId not in copiedS:
+                    siteIndexD[siteId] = list(siteIndexD.get(siteId, []))
+                    copiedS.add(siteId)
+            if oldSiteId is not None:
+                dsL = siteIndexD[oldSiteId]
+                del dsL[bisect.bisect_left(dsL, dsId)]
+            if newSiteId is not None:
+                bisect.insort(siteIndexD[newSiteId], dsId)
+        for siteId in copiedS:
+            if not siteIndexD[siteId]:
+                del siteIndexD[siteId]
+        return siteIndexD
+
+    @staticmethod
+    def __loadLocationFile(fp):
+        """Read the location file for update - a missing file is empty, other read failures are raised."""
+        if not os.path.exists(fp):
+            return {}
+        with open(fp) as infile:
+            return json.load(infile)
+
+    @staticmethod
+    def __getSignature(fp):
+        try:
+            st = os.stat(fp)
+            return (st.st_ino, st.st_size, st.st_mtime)
+        except OSError:
+            return None
+
+    def __getLock(self):
+        """Return the external (interprocess) lock serializing updates to the location files."""
+        # oslo_concurrency has a large import footprint and is only imported when a lock is required -
+        from oslo_concurrency import lockutils  # pylint: disable=import-outside-toplevel
+
+        # the lock name and lock file are those of earlier releases so that writers of different versions
+        # exclude each other (e.g. during a rolling deploy)
+        return lockutils.lock("configdataset.exceptionfile-lock", external=True, lock_path=self.__lockDirPath)
+
+    def __writeLocationDictionary(self, fp, dsLocD, backup=True, siteIndexD=None):
         """Write the input dictionary cotaining exceptional data set to site correspondences,
 
+        Must be called while holding the exception file lock.
+
         Returns: True for success or False otherwise
         """
-        fp = self.__cIDepUI.get_site_dataset_siteloc_file_path()
-
         try:
-            if backup:
-                bp = fp + datetime.datetime.now().strftime("-%Y-%m-%d-%H-%M-%S")  # noqa: DTZ005
-                d = self.__readLocationDictionary()
-                with open(bp, "w") as outfile:
-                    json.dump(d, outfile, indent=4)
-            with open(fp, "w") as outfile:
+            if backup and os.access(fp, os.R_OK):
+                self.__backup.backup(fp)
+            with ConfigInfoAtomicFile(fp, "w") as outfile:
                 json.dump(dsLocD, outfile, indent=4)
+            ConfigInfoDataSet._locationSnapshotD[fp] = (self.__getSignature(fp), dsLocD)
+            if siteIndexD is not None:
+                ConfigInfoDataSet._locationSiteIndexD[fp] = (dsLocD, siteIndexD)
+            if fp in ConfigInfoDataSet._locationRegistryD:
+                # shared with the snapshot (and reverse index) - neither is modified after this point
+                ConfigInfoDataSet._locationRegistryD[fp] = dsLocD
             return True
         except Exception as e:
             logger.error("failed writing json resource file %s - %s", fp, str(e))
@@ -159,6 +330,18 @@ class ConfigInfoDataSet:
                 logger.exception("failed writing json resource file %s", fp)
         return False
 
+    @classmethod
+    def registerLocationDictionary(cls, filePath, dsLocD):
+        """Register the input location dictionary for the resource file path superseding reads of the file.
+
+        The dictionary is swapped in as a single assignment and must not be modified after registration.
+        """
+        cls._locationRegistryD[filePath] = dsLocD
+
+    @classmethod
+    def unregisterLocationDictionary(cls, filePath):
+        cls._locationRegistryD.pop(filePath, None)
+
     def getDefaultIdRange(self, siteId):
         """Return the default upper and lower deposition data set identifier codes
         assigned to the input siteId.
@@ -189,6 +372,12 @@ class ConfigInfoDataSet:
             DEPID_START, DEPID_STOP = (-1, -1)
         return (DEPID_START, DEPID_STOP)
 
+    def __getRangeSiteId(self, idVal):
+        """Return the site owning the default id range containing the input integer id or None."""
+        if self.__rangeIndex is None:
+            self.__rangeIndex = ConfigInfoIdRange(self.__depIdAssignments)
+        return self.__rangeIndex.getSiteId(idVal)
+
     def getDefaultSiteId(self, depSetId):
         """Get the default site assignment for the input data set id."""
         return self.__getSiteId(depSetId)
@@ -203,7 +392,7 @@ class ConfigInfoDataSet:
         # check for exceptional cases --
         try:
             if self.__dsLocD is None:
-                self.__dsLocD = self.__readLocationDictionary()
+                self.__dsLocD = self.__getLocationSnapshot()
             if str(depSetId)[:2] == "D_":
                 if depSetId in self.__dsLocD:
                     return self.__dsLocD[depSetId]
@@ -226,11 +415,7 @@ class ConfigInfoDataSet:
                 idVal = int(str(depSetId)[2:])
             else:
                 idVal = int(str(depSetId))
-            for ky in self.__depIdAssignments:
-                idMin, idMax = self.__depIdAssignments[ky]
-                if (idVal >= idMin) and (idVal <= idMax):
-                    # This is to ensure a strings is returned for PDBE_PROD
-                    return str(ky)
+            return self.__getRangeSiteId(idVal)
         except ValueError as e:
             # From trying to take int
             if self.__debug:
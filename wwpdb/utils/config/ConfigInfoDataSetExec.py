@@ -6,6 +6,9 @@
 # Version: 0.001
 #
 # Updates:
+#  19-Oct-2026  add streaming bulk relocation (--stream) applying batched transactions
+#  19-Oct-2026  report location statistics in checkConfig() as a table or JSON (--json, --bucket_size)
+#  19-Oct-2026  printConfig() uses the sorted site index of getDataSetLocations()
 ##
 """
 Execuction wrapper for data set site alternate location mapping cache.
@@ -17,7 +20,9 @@ __email__ = "jwest@rcsb.rutgers.edu"
 __license__ = "Creative Commons Attribution 3.0 Unported"
 __version__ = "V0.001"
 
+import json
 import logging
+import re
 import sys
 import traceback
 from optparse import OptionParser  # pylint: disable=deprecated-module
@@ -35,26 +40,48 @@ class ConfigInfoDataSetExec:
 
     """
 
+    # Accepted data set identifiers - D_<digits> or <digits> (both converted to D_%010d)
+    _dataSetIdPattern = re.compile(r"^(D_)?([0-9]+)$")
+
     def __init__(self, verbose=True, log=sys.stderr):
         self.__lfh = log
         self.__verbose = verbose
 
-    def checkConfig(self):
-        """Perform read check for the data set configuration file."""
+    def checkConfig(self, outFormat="table", bucketSize=None, ofh=None):
+        """Perform read check for the data set configuration file and report location statistics.
+
+        Returns: statistics dictionary (see ConfigInfoDataSet.getLocationStatistics()) or None on failure
+        """
+        ofh = ofh if ofh else self.__lfh
         try:
             cfds = ConfigInfoDataSet(self.__verbose, self.__lfh)
-            d = cfds.getDataSetLocationDict()
-            self.__lfh.write("Alternate site location dictionary length = %d\n" % len(d))
-            sD = {}
-            for ky in d:
-                if d[ky] not in sD:
-                    sD[d[ky]] = 0
-                sD[d[ky]] += 1
-            for ky, val in sD.values():
-                self.__lfh.write("  Site %-40r   count %8d\n" % (ky, val))
+            sD = cfds.getLocationStatistics(bucketSize=bucketSize)
+            if outFormat == "json":
+                # ids outside all default ranges are keyed by None (null) which cannot be sorted by json.dumps()
+                jD = {ky: dict(sorted(val.items(), key=lambda t: str(t[0]))) if isinstance(val, dict) else val for ky, val in sorted(sD.items())}
+                ofh.write("%s\n" % json.dumps(jD, indent=2))
+                return sD
+            ofh.write("Alternate site location dictionary length = %d\n" % sD["total"])
+            for ky, val in sorted(sD["sites"].items(), key=lambda t: str(t[0])):
+                ofh.write("  Site %-40r   count %8d\n" % (ky, val))
+            ofh.write("Alternate locations by default site range\n")
+            for ky, val in sorted(sD["ranges"].items(), key=lambda t: str(t[0])):
+                ofh.write("  Range %-39r   count %8d\n" % (ky, val))
+            if bucketSize:
+                ofh.write("Alternate locations by id block (size %d)\n" % bucketSize)
+                for ky, val in sorted(sD["buckets"].items()):
+                    ofh.write("  Block %-12d - %-12d    count %8d\n" % (ky, ky + bucketSize - 1, val))
+            ofh.write("Redundant alternate locations (within default site range) = %d\n" % len(sD["redundant"]))
+            for dsId in sD["redundant"]:
+                ofh.write("    %12s\n" % dsId)
+            ofh.write("Invalid data set ids = %d\n" % len(sD["invalid"]))
+            for dsId in sD["invalid"]:
+                ofh.write("    %r\n" % dsId)
+            return sD
         except Exception as e:  # noqa: BLE001
             self.__lfh.write("checkConfig failing %r\n" % str(e))
             traceback.print_exc(file=self.__lfh)
+        return None
 
     def printConfig(self, siteId):
         """Print the configuration options for the input site."""
@@ -64,7 +91,7 @@ class ConfigInfoDataSetExec:
             self.__lfh.write(" Default data set range for site %-30s lower %-12d upper %-12d \n" % (siteId, lId, uId))
             dataSetIdL = cfds.getDataSetLocations(siteId)
             nDataSets = len(dataSetIdL)
-            for ii, dataSetId in enumerate(sorted(dataSetIdL)):
+            for ii, dataSetId in enumerate(dataSetIdL):
                 self.__lfh.write("    %-8d - %12s\n" % (ii, dataSetId))
             self.__lfh.write("  Total alternate data set locations = %d" % nDataSets)
         except Exception as e:  # noqa: BLE001
@@ -88,6 +115,90 @@ class ConfigInfoDataSetExec:
             self.__lfh.write("removeDataSets failing %s\n" % str(e))
             traceback.print_exc(file=self.__lfh)
 
+    def streamLocations(self, ifh, siteId=None, remove=False, batchSize=5000, progressInterval=50000):
+        """Set (siteId) or remove (remove=True) the alternate location for the data set ids read
+        one per line from the input file handle.
+
+        Input is consumed in batches of batchSize distinct ids and each batch is applied as a single
+        location file transaction.  The location file is backed up once before the first batch.  Blank
+        lines and lines starting with # are skipped, invalid ids are reported and skipped.  Ids are
+        normalized to D_%010d so that differently padded forms of an id refer to the same entry, and
+        ids repeated anywhere in the input are applied once and counted as duplicates (the ids seen are
+        kept for the whole stream).
+
+        Returns: dictionary of counts {"read", "invalid", "duplicate", "applied", "batches", "failed"}
+        """
+        countD = {"read": 0, "invalid": 0, "duplicate": 0, "applied": 0, "batches": 0, "failed": 0}
+        if not remove and not siteId:
+            self.__lfh.write("streamLocations requires a site id\n")
+            return countD
+        try:
+            cfds = ConfigInfoDataSet(self.__verbose, self.__lfh)
+            batchD = {}
+            seenS = set()
+            nextReport = progressInterval
+            for lineNo, line in enumerate(ifh, 1):
+                tS = line.strip()
+                if not tS or tS.startswith("#"):
+                    continue
+                countD["read"] += 1
+                dsId = self.__normalizeDataSetId(tS)
+                if dsId is None:
+                    countD["invalid"] += 1
+                    self.__lfh.write("streamLocations skipping invalid data set id %r at line %d\n" % (tS, lineNo))
+                    continue
+                if dsId in seenS:
+                    countD["duplicate"] += 1
+                    continue
+                seenS.add(dsId)
+                batchD[dsId] = siteId
+                if len(batchD) >= batchSize:
+                    self.__applyBatch(cfds, batchD, remove, countD)
+                    batchD = {}
+                if progressInterval and countD["read"] >= nextReport:
+                    nextReport += progressInterval
+                    self.__reportProgress(countD)
+            if batchD:
+                self.__applyBatch(cfds, batchD, remove, countD)
+            self.__reportProgress(countD)
+        except Exception as e:  # noqa: BLE001
+            self.__lfh.write("streamLocations failing for site %r - %r\n" % (siteId, str(e)))
+            traceback.print_exc(file=self.__lfh)
+        return countD
+
+    def __normalizeDataSetId(self, idS):
+        mObj = self._dataSetIdPattern.match(idS)
+        if mObj is None:
+            return None
+        return "D_%010d" % int(mObj.group(2))
+
+    @staticmethod
+    def __applyBatch(cfds, batchD, remove, countD):
+        # only the first batch backs up the location file
+        backup = countD["batches"] == 0
+        if remove:
+            ok = cfds.updateLocations(removeL=list(batchD), backup=backup)
+        else:
+            ok = cfds.updateLocations(addD=batchD, backup=backup)
+        countD["batches"] += 1
+        if ok:
+            countD["applied"] += len(batchD)
+        else:
+            countD["failed"] += len(batchD)
+
+    def __reportProgress(self, countD):
+        self.__lfh.write(
+            "  read %10d  applied %10d  invalid %8d  duplicate %8d  failed %8d  batches %6d\n"
+            % (
+                countD["read"],
+                countD["applied"],
+                countD["invalid"],
+                countD["duplicate"],
+                countD["failed"],
+                countD["batches"],
+            )
+        )
+
 
 def main():  # pragma: no cover
     usage = """usage: %prog [options]
@@ -97,6 +208,7 @@ def main():  # pragma: no cover
      Read check the data set location configuration file:
 
        python %prog --check
+       python %prog --check --json --bucket_size 100000 > stats.json
 
      Print the data set configuration for a site (requires --siteid):
 
@@ -112,12 +224,23 @@ def main():  # pragma: no cover
        python %prog --remove --siteid=WWPDB_DEPLOY_TEST_RU --dataset D_0000000000
        python %prog --remove --siteid=WWPDB_DEPLOY_TEST_RU --dataset_file  <datsetid_file>
 
+     Stream a large data set list (file or - for stdin) applying batched updates:
+
+       python %prog --set --stream --siteid=WWPDB_DEPLOY_TEST_RU --dataset_file  <datsetid_file>
+       cat <datsetid_file> | python %prog --remove --stream --dataset_file -  --batch_size 20000
+
 
     """
     parser = OptionParser(usage)
 
+    parser.add_option("--check", dest="checkConfig", action="store_true", default=False, help="Check data set configuration file")
+    parser.add_option("--json", dest="jsonOut", action="store_true", default=False, help="Write --check statistics as JSON to stdout")
     parser.add_option(
-        "--check", dest="checkConfig", action="store_true", default=False, help="Check data set configuration file"
+        "--bucket_size",
+        dest="bucketSize",
+        type="int",
+        default=None,
+        help="Report --check counts by id blocks of this size",
     )
     parser.add_option(
         "--print",
@@ -139,10 +262,28 @@ def main():  # pragma: no cover
     parser.add_option(
         "--dataset_file", dest="dataSetIdFile", default=None, help="File containing a list of data sets one per line"
     )
+    parser.add_option(
+        "--stream",
+        dest="streamOp",
+        action="store_true",
+        default=False,
+        help="Stream --dataset_file (- for stdin) applying updates in batches",
+    )
+    parser.add_option("--batch_size", dest="batchSize", type="int", default=5000, help="Data sets per update in --stream mode")
     parser.add_option("-v", "--verbose", default=True, action="store_true", dest="verbose")
 
     (options, _args) = parser.parse_args()  # pylint: disable=unused-variable
 
+    if options.streamOp and options.dataSetIdFile and (options.removeOp or (options.setOp and options.siteId)):
+        ciEx = ConfigInfoDataSetExec(verbose=options.verbose, log=sys.stderr)
+        siteId = None if options.removeOp else options.siteId
+        if options.dataSetIdFile == "-":
+            countD = ciEx.streamLocations(sys.stdin, siteId=siteId, remove=options.removeOp, batchSize=options.batchSize)
+        else:
+            with open(options.dataSetIdFile) as ifh:
+                countD = ciEx.streamLocations(ifh, siteId=siteId, remove=options.removeOp, batchSize=options.batchSize)
+        sys.exit(1 if countD["failed"] else 0)
+
     #
     # Fetch any input data set list  ---
     #
@@ -159,7 +300,10 @@ def main():  # pragma: no cover
 
     ciEx = ConfigInfoDataSetExec(verbose=options.verbose, log=sys.stderr)
     if options.checkConfig:
-        ciEx.checkConfig()
+        if options.jsonOut:
+            ciEx.checkConfig(outFormat="json", bucketSize=options.bucketSize, ofh=sys.stdout)
+        else:
+            ciEx.checkConfig(bucketSize=options.bucketSize)
 
     if options.printConfig and options.siteId:
         ciEx.printConfig(siteId=options.siteId)
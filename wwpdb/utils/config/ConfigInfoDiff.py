@@ -0,0 +1,93 @@
+##
+# File:    ConfigInfoDiff.py
+# Date:    19-Oct-2026
+#
+# Updates:
+##
+"""
+Structured differences between resolved site configuration dictionaries.
+
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "John Westbrook"
+__email__ = "jwest@rcsb.rutgers.edu"
+__license__ = "Apache 2.0"
+__version__ = "V0.01"
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class ConfigInfoDiff:
+    """
+    Compares two resolved configuration dictionaries (e.g. the dictionaries for two sites or for two
+    generations of a configuration cache file) and returns a structured list of differences.
+
+    Nested dictionaries such as the private sections (e.g. 'OS_ENVIRONMENT', 'DATABASE_SERVICES') are
+    compared option-by-option.  Values are compared after deserialization so the same option
+    rendered as a tuple (Python cache) or list (JSON cache) is treated as equal.  Values which
+    are equal but differ in type (e.g. '8080' and 8080) are reported with change type 'type'.
+
+    Each difference is reported as a dictionary -
+
+        {"path": [section, ..., option], "change": "added"|"removed"|"modified"|"type", "left": value, "right": value}
+
+    The comparison visits each option once so the cost is linear in the size of the two configurations.
+    """
+
+    def __init__(self, ignoreKeyList=None):
+        self.__ignoreD = dict.fromkeys([str(k).upper() for k in ignoreKeyList]) if ignoreKeyList else {}
+
+    def diff(self, leftD, rightD):
+        """Return the list of differences between the input configuration dictionaries ordered by option path."""
+        diffL = []
+        self.__diffDict(leftD or {}, rightD or {}, [], diffL)
+        diffL.sort(key=lambda d: [str(t) for t in d["path"]])
+        return diffL
+
+    @staticmethod
+    def summarize(diffL):
+        """Return the count of differences by change type."""
+        sD = {"added": 0, "removed": 0, "modified": 0, "type": 0}
+        for dD in diffL:
+            sD[dD["change"]] = sD.get(dD["change"], 0) + 1
+        return sD
+
+    def __diffDict(self, leftD, rightD, path, diffL):
+        for ky, lv in leftD.items():
+            if not path and str(ky).upper() in self.__ignoreD:
+                continue
+            kPath = path + [ky]
+            if ky not in rightD:
+                diffL.append({"path": kPath, "change": "removed", "left": lv, "right": None})
+                continue
+            rv = rightD[ky]
+            if isinstance(lv, dict) and isinstance(rv, dict):
+                self.__diffDict(lv, rv, kPath, diffL)
+                continue
+            change = self.__compareValues(lv, rv)
+            if change:
+                diffL.append({"path": kPath, "change": change, "left": lv, "right": rv})
+        for ky, rv in rightD.items():
+            if ky not in leftD and not (not path and str(ky).upper() in self.__ignoreD):
+                diffL.append({"path": path + [ky], "change": "added", "left": None, "right": rv})
+
+    def __compareValues(self, lv, rv):
+        """Return None for equal values, 'type' for values equal in representation only, or 'modified'."""
+        lN = self.__normalize(lv)
+        rN = self.__normalize(rv)
+        if lN == rN and type(lN) is type(rN):
+            return None
+        if str(lN) == str(rN):
+            return "type"
+        return "modified"
+
+    def __normalize(self, v):
+        # tuples are rendered as lists in JSON serialized cache files -
+        if isinstance(v, (tuple, list)):
+            return [self.__normalize(t) for t in v]
+        if isinstance(v, dict):
+            return dict((k, self.__normalize(t)) for k, t in v.items())
+        return v
@@ -11,6 +11,13 @@
 #      4-Dec-2016  jdw process additional list of section names for each configuration file.
 #     11-Oct-2017  jdw add support for private section names including wildcard chars.
 #     10-Oct-2017  jdw Preliminary support for Py2->Py3
+#     19-Oct-2026  add optional provenance tracking for options resolved by readConfigFileList()
+#     19-Oct-2026  route backups through ConfigInfoBackup() retention policy, read gzip compressed JSON cache backups
+#     19-Oct-2026  write configuration and cache files atomically with ConfigInfoAtomicFile()
+#     19-Oct-2026  accumulate the file parsing time in readConfigFileList() (see getParseTime())
+#     19-Oct-2026  compile the deserialization filter selectors into a reusable plan, add deserializeSiteConfig()
+#     19-Oct-2026  optional memo of converted values and repeated strings shared across deserializations
+#     19-Oct-2026  add hasConfigDictionary() to the generated cache module
 # -
 """
 Provides access to site-specific configuration information stored in flat files and cache files.
@@ -25,14 +32,18 @@ __version__ = "V0.01"
 
 
 import ast
-import datetime
+import gzip
 import json
 import logging
 import os
-import shutil
+import re
 import sys
+import time
 from fnmatch import fnmatchcase
 
+from wwpdb.utils.config.ConfigInfoAtomicFile import ConfigInfoAtomicFile
+from wwpdb.utils.config.ConfigInfoBackup import ConfigInfoBackup
+
 try:
     import ConfigParser  # type: ignore[import-not-found]
 except ImportError:
@@ -40,18 +51,46 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+_SECTION_RE = re.compile(r"^\[([^\]]+)\]")
+_OPTION_RE = re.compile(r"^([^\s=:#;\[][^=:]*?)\s*[=:]")
+_INTERPOLATION_RE = re.compile(r"%\(([^)]+)\)s")
+
 
 class ConfigInfoFile:
     """
     Provides access to site-specific configuration information stored in flat files and cache files.
     """
 
-    def __init__(self, verbose=False, log=sys.stderr, mockTopPath=None):  # noqa: ARG002 pylint: disable=unused-argument
+    # Deserialization filter selectors and their converters in the order these are applied -
+    _filterSelectorL = (
+        ("config_as_int", "int"),
+        ("config_as_float", "float"),
+        ("config_csv_as_list", "csv_list"),
+        ("config_csv_as_int_list", "int_list"),
+        ("config_as_object", "object"),
+    )
+    # Location search order of the JSON cache file fallback in the generated cache module -
+    CACHE_LOCATION_NAMES = ("rcsb-east", "rcsb-west", "pdbj", "pdbe", "pdbc")
+
+    def __init__(self, verbose=False, log=sys.stderr, mockTopPath=None, trackProvenance=False, backupPolicy=None):  # noqa: ARG002 pylint: disable=unused-argument
         self.__debug = True
+        # Retention policy applied to timestamped backups of configuration and cache files -
+        self.__backup = backupPolicy if backupPolicy is not None else ConfigInfoBackup()
         if mockTopPath:
             self.__mockdefaults = {"test_mockpath_env": mockTopPath}
         else:
             self.__mockdefaults = {}
+        #
+        # Provenance side table populated by readConfigFileList() when tracking is enabled -
+        #   provEntryL[i] = (keyU, fileIndex, sectionName, lineNumber, (refEntryIndex, refEntryIndex, ...))
+        #   provD[(sectionU or None, keyU)] = i
+        self.__trackProvenance = trackProvenance
+        self.__provFileL = []
+        self.__provEntryL = []
+        self.__provD = {}
+        self.__parseTime = 0.0
+        # Compiled deserialization filter plans keyed by the selector values (see compileFilterPlan())
+        self.__filterPlanD = {}
 
     def readSiteConfig(self, siteId, configFilePath):
         """Read the input configuration file and return a configuration dictionary for
@@ -107,17 +146,28 @@ class ConfigInfoFile:
 
         """
         retD = {}
+        track = self.__trackProvenance
+        self.__provFileL = []
+        self.__provEntryL = []
+        self.__provD = {}
+        self.__parseTime = 0.0
+        timer = getattr(time, "perf_counter", time.time)
         try:
             defaultD = {}
             saveD = {}
+            # Provenance bookkeeping (only when tracking) - source of each substitution default and per-file line maps
+            defaultSrcD = {}
+            lineMapD = {}
             # For each configuration file in turn -- accumulated content provides default value substition values for subsequent files -
             #
             # Template substitution performed explicitly here using any preceding content in the 'common' namespace --
             if configPathSectionList is not None:
                 for configFilePath, sectionName, context in configPathSectionList:
+                    tS = timer()
                     config = ConfigParser.RawConfigParser(defaults=self.__mockdefaults, allow_no_value=True)
                     config.read(configFilePath)
                     sectionL = config.sections()
+                    self.__parseTime += timer() - tS
                     for tsn in sectionL:
                         if tsn == sectionName or fnmatchcase(tsn, sectionName):
                             kvTupL = config.items(tsn.lower())
@@ -125,6 +175,8 @@ class ConfigInfoFile:
                             #    defaultD[k] = v
                             if self.__debug:
                                 logger.info("fetching section %s length %d", tsn, len(kvTupL))
+                            if track:
+                                fIdx, lineD = self.__getProvenanceFileInfo(configFilePath, lineMapD)
                             if context == "common":
                                 for k, v in kvTupL:
                                     # Respect existing values in the order of config files -
@@ -136,9 +188,15 @@ class ConfigInfoFile:
                                             continue
                                         # update substitution defaults ...
                                         defaultD[k] = saveD[k]
+                                        if track:
+                                            lineNo = lineD.get((tsn.lower(), k))
+                                            defaultSrcD[k] = self.__addProvenance(None, k, fIdx, tsn, lineNo, v, defaultSrcD)
                             elif context == "private":
                                 pD = {}
                                 pDU = {}
+                                if track:
+                                    # the private section replaces any preceding instance -
+                                    self.__removeProvenanceSection(tsn.upper())
                                 for k, v in kvTupL:
                                     if k not in pD:
                                         try:
@@ -149,9 +207,14 @@ class ConfigInfoFile:
                                         # update substitution defaults ...
                                         defaultD[k] = pD[k]
                                         pDU[k.upper()] = pD[k]
+                                        if track:
+                                            lineNo = lineD.get((tsn.lower(), k))
+                                            defaultSrcD[k] = self.__addProvenance(tsn, k, fIdx, tsn, lineNo, v, defaultSrcD)
                                 saveD[tsn.upper()] = pDU
                             for k, v in saveD.items():
                                 defaultD[k] = v
+                                if track and (None, k.upper()) in self.__provD:
+                                    defaultSrcD[k] = self.__provD[(None, k.upper())]
 
             # Copy the accumulated saved items for return with upper-cased keys --
             for k, v in saveD.items():
@@ -163,6 +226,98 @@ class ConfigInfoFile:
 
         return retD
 
+    def getParseTime(self):
+        """Return the time (seconds) spent parsing configuration files in the last call to readConfigFileList()."""
+        return self.__parseTime
+
+    def __getProvenanceFileInfo(self, configFilePath, lineMapD):
+        """Return the interned index of the input configuration file path and its (section, option) line map."""
+        if configFilePath not in lineMapD:
+            lineMapD[configFilePath] = (len(self.__provFileL), self.__readOptionLineMap(configFilePath))
+            self.__provFileL.append(configFilePath)
+        return lineMapD[configFilePath]
+
+    @staticmethod
+    def __readOptionLineMap(configFilePath):
+        """Return a dictionary of the first line number for each option in the input configuration file.
+
+        Returns: d[(sectionName.lower(), option.lower())] = lineNumber
+        """
+        lineD = {}
+        try:
+            section = None
+            with open(configFilePath) as ifh:
+                for lineNo, line in enumerate(ifh, 1):
+                    mS = _SECTION_RE.match(line)
+                    if mS:
+                        section = mS.group(1).strip().lower()
+                        continue
+                    mO = _OPTION_RE.match(line)
+                    if mO and section is not None:
+                        lineD.setdefault((section, mO.group(1).strip().lower()), lineNo)
+        except Exception as e:  # noqa: BLE001
+            logger.info("failed scanning option lines in %s - %s", configFilePath, str(e))
+        return lineD
+
+    def __addProvenance(self, privateSectionName, key, fIdx, sectionName, lineNo, rawValue, defaultSrcD):
+        """Record the provenance of a resolved option and return its entry index."""
+        refL = []
+        if rawValue is not None and "%(" in rawValue:
+            for ref in _INTERPOLATION_RE.findall(rawValue):
+                if ref in defaultSrcD and defaultSrcD[ref] not in refL:
+                    refL.append(defaultSrcD[ref])
+        idx = len(self.__provEntryL)
+        self.__provEntryL.append((key.upper(), fIdx, sectionName, lineNo, tuple(refL)))
+        self.__provD[(privateSectionName.upper() if privateSectionName else None, key.upper())] = idx
+        return idx
+
+    def __removeProvenanceSection(self, sectionU):
+        # Entries are retained for the interpolation chains of options that referenced them -
+        for pKey in [t for t in self.__provD if t[0] == sectionU]:
+            del self.__provD[pKey]
+
+    def getProvenance(self, key, sectionName=None):
+        """Return the provenance of an option resolved by the most recent call to readConfigFileList()
+        with provenance tracking enabled (e.g. ConfigInfoFile(trackProvenance=True)).
+
+        Options in private sections are identified by the input section name.
+
+        Returns: {"file": path, "section": name, "line": lineNumber, "interpolation": [{"key":,"file":,"section":,"line":},...]}
+                 or None if the option was not resolved.
+
+        The interpolation chain lists the options substituted into the value in order of first reference
+        including any options referenced indirectly.
+        """
+        pKey = (sectionName.upper() if sectionName else None, str(key).upper())
+        if pKey not in self.__provD:
+            return None
+        idx = self.__provD[pKey]
+        _, fIdx, tsn, lineNo, refT = self.__provEntryL[idx]
+        chainL = []
+        seen = {idx}
+        stack = list(reversed(refT))
+        while stack:
+            rIdx = stack.pop()
+            if rIdx in seen:
+                continue
+            seen.add(rIdx)
+            rKey, rfIdx, rSection, rLine, rRefT = self.__provEntryL[rIdx]
+            chainL.append({"key": rKey, "file": self.__provFileL[rfIdx], "section": rSection, "line": rLine})
+            stack.extend(reversed(rRefT))
+        return {"file": self.__provFileL[fIdx], "section": tsn, "line": lineNo, "interpolation": chainL}
+
+    def getProvenanceDictionary(self):
+        """Return the provenance of all options resolved by the most recent call to readConfigFileList()
+        organized like the returned configuration dictionary (private section options nested by section name).
+        """
+        retD = {}
+        for sU, kU in self.__provD:
+            if sU is None:
+                retD[kU] = self.getProvenance(kU)
+            else:
+                retD.setdefault(sU, {})[kU] = self.getProvenance(kU, sectionName=sU)
+        return retD
+
     def writeConfig(self, configFilePath, sectionL, sectionD, requireBackup=True, sortKeys=True):
         """Write configuration file for the key-value options in the input section dictionary.
 
@@ -191,7 +346,7 @@ class ConfigInfoFile:
             if not ok and requireBackup:
                 logger.error("failed writing backup config file for %s", configFilePath)
                 return False
-            with open(configFilePath, "w") as configfile:
+            with ConfigInfoAtomicFile(configFilePath, "w") as configfile:
                 config.write(configfile)
             return True
         except Exception as e:  # noqa: BLE001
@@ -200,7 +355,39 @@ class ConfigInfoFile:
                 logger.exception("failing %s", str(e))
         return False
 
-    def deserializeConfig(self, configD, optionD=None):
+    def compileFilterPlan(self, optionD):
+        """Return the deserialization plan {OPTION: (converter, ...)} for the filter selectors in the input
+        options (see deserializeConfig()).  Plans are compiled once for each distinct set of selector values.
+        """
+        return self.__compileFilterPlan(optionD)[0]
+
+    def __compileFilterPlan(self, optionD):
+        """Return the deserialization plan and the list of selector keys found in the input options."""
+        selectorNameD = dict(ConfigInfoFile._filterSelectorL)
+        selectorD = {}
+        if optionD is not None:
+            for k, v in optionD.items():
+                kL = k.lower()
+                if kL in selectorNameD:
+                    # later keys supersede earlier keys differing only in case
+                    selectorD[kL] = (k, v)
+        selectorKeyL = [k for k, _ in selectorD.values()]
+        planKey = tuple((name, selectorD[name][1]) for name, _ in ConfigInfoFile._filterSelectorL if name in selectorD)
+        plan = self.__filterPlanD.get(planKey)
+        if plan is None:
+            planD = {}
+            for name, converter in ConfigInfoFile._filterSelectorL:
+                if name in selectorD:
+                    for t in selectorD[name][1].split(","):
+                        if len(t.strip()) > 0:
+                            cL = planD.setdefault(t.strip().upper(), [])
+                            if converter not in cL:
+                                cL.append(converter)
+            plan = {k: tuple(cL) for k, cL in planD.items()}
+            self.__filterPlanD[planKey] = plan
+        return plan, selectorKeyL
+
+    def deserializeConfig(self, configD, optionD=None, plan=None, memoD=None):
         """Apply an adhoc set of filters on the input configuration dictionary.
         Input option values are assumed to be the string values returned by the configuration file parser.
 
@@ -222,67 +409,50 @@ class ConfigInfoFile:
         all values are tested for the literal 'None' string which is converted to a None value.
 
         All input option keys (optionD) are processed with leading and trailing whitespace stripped and
-        in upper case.
+        in upper case.  A plan compiled by compileFilterPlan() may be provided in place of optionD.
+
+        A memo dictionary (memoD) shared across calls (e.g. for the sites of a location) holds the converted
+        value for each (converter, string value) and a single instance of each repeated string.  Values taken
+        from the memo are shared by the returned dictionaries and must not be modified.
 
         Returns an updated dictionary of configuration options with values cast according filter conditions.
 
         """
         retD = {}
-        objD = {}
-        lstD = {}
-        intD = {}
-        fltD = {}
-        iLstD = {}
         try:
-            if optionD is not None:
-                optD = dict((k.lower(), v) for k, v in optionD.items())
-                if "config_as_object" in optD:
-                    objD = dict.fromkeys(
-                        [t.strip().upper() for t in optD["config_as_object"].split(",") if len(t.strip()) > 0]
-                    )
-                if "config_csv_as_list" in optD:
-                    lstD = dict.fromkeys(
-                        [t.strip().upper() for t in optD["config_csv_as_list"].split(",") if len(t.strip()) > 0]
-                    )
-                if "config_as_int" in optD:
-                    intD = dict.fromkeys(
-                        [t.strip().upper() for t in optD["config_as_int"].split(",") if len(t.strip()) > 0]
-                    )
-                if "config_as_float" in optD:
-                    fltD = dict.fromkeys(
-                        [t.strip().upper() for t in optD["config_as_float"].split(",") if len(t.strip()) > 0]
-                    )
-                if "config_csv_as_int_list" in optD:
-                    iLstD = dict.fromkeys(
-                        [t.strip().upper() for t in optD["config_csv_as_int_list"].split(",") if len(t.strip()) > 0]
-                    )
-            #
-            # if self.__debug:
-            #   print "Filter as object", objD
-            #
-            for k, v in configD.items():
-                retD[k] = v
-                if v == "None":
-                    retD[k] = None
+            if plan is None:
+                plan = self.__compileFilterPlan(optionD)[0]
+            self.__applyFilterPlan(configD, plan, retD, memoD=memoD)
+        except Exception as e:  # noqa: BLE001
+            logger.info("failed configuration filter")
+            if self.__debug:
+                logger.exception("failed configuration filter %s", str(e))
 
-                if k in intD:
-                    retD[k] = int(v)
+        return retD
 
-                if k in fltD:
-                    retD[k] = float(v)
+    def deserializeSiteConfig(self, configD, memoD=None):
+        """Deserialize the input site configuration dictionary and each of its sections (dictionary values)
+        using the filter selectors of the top-level options.  The top level and the sections are processed
+        in a single pass with one compiled plan unless the selector options are themselves converted.
+        See deserializeConfig() for the optional memo dictionary.
 
+        Returns the deserialized site configuration dictionary.
+        """
+        retD = {}
+        try:
+            plan, selectorKeyL = self.__compileFilterPlan(configD)
+            if not any(k in plan or configD[k] == "None" for k in selectorKeyL):
                 try:
-                    if k in lstD:
-                        retD[k] = [t.strip() for t in v.split(",")]
-                    if k in iLstD:
-                        retD[k] = [int(t.strip()) for t in v.split(",")]
-                except Exception as e:  # noqa: BLE001
-                    logger.error("failed csv filter %r %r - %s", k, v, str(e))
-                try:
-                    if k in objD:
-                        retD[k] = ast.literal_eval(v)
-                except Exception as e:  # noqa: BLE001
-                    logger.error("failed eval filter %r %r - %s", k, v, str(e))
+                    self.__applyFilterPlan(configD, plan, retD, sectionPlan=plan, memoD=memoD)
+                    return retD
+                except Exception:  # noqa: BLE001
+                    # repeat in separate passes to reproduce the partial result of a failing int|float filter
+                    retD = {}
+            # sections are filtered with the deserialized selectors
+            retD = self.deserializeConfig(configD, plan=plan, memoD=memoD)
+            for k, v in retD.items():
+                if isinstance(v, dict):
+                    retD[k] = self.deserializeConfig(v, optionD=retD, memoD=memoD)
         except Exception as e:  # noqa: BLE001
             logger.info("failed configuration filter")
             if self.__debug:
@@ -290,6 +460,57 @@ class ConfigInfoFile:
 
         return retD
 
+    def __applyFilterPlan(self, configD, plan, retD, sectionPlan=None, memoD=None):
+        """Store the filtered options of configD in retD.  Dictionary values are filtered with sectionPlan if provided.
+
+        Conversion failures for list and object filters are logged, while int and float failures stop the
+        filtering of the remaining options (as raised to the caller).
+        """
+        for k, v in configD.items():
+            if memoD is not None:
+                k = memoD.setdefault(k, k)
+                retD[k] = None if v == "None" else memoD.setdefault(v, v) if isinstance(v, str) else v
+            else:
+                retD[k] = None if v == "None" else v
+            if sectionPlan is not None and isinstance(v, dict):
+                retD[k] = self.deserializeConfig(v, plan=sectionPlan, memoD=memoD)
+            converterL = plan.get(k)
+            if converterL is None:
+                continue
+            csvFailed = False
+            for converter in converterL:
+                if csvFailed and converter == "int_list":
+                    # converted with csv_list in a single step
+                    continue
+                try:
+                    if memoD is not None and isinstance(v, str):
+                        ky = (converter, v)
+                        if ky not in memoD:
+                            memoD[ky] = self.__convertValue(converter, v)
+                        retD[k] = memoD[ky]
+                    else:
+                        retD[k] = self.__convertValue(converter, v)
+                except Exception as e:  # noqa: BLE001
+                    if converter in ("int", "float"):
+                        raise
+                    if converter == "object":
+                        logger.error("failed eval filter %r %r - %s", k, v, str(e))
+                    else:
+                        csvFailed = True
+                        logger.error("failed csv filter %r %r - %s", k, v, str(e))
+
+    @staticmethod
+    def __convertValue(converter, v):
+        if converter == "int":
+            return int(v)
+        if converter == "float":
+            return float(v)
+        if converter == "object":
+            return ast.literal_eval(v)
+        if converter == "csv_list":
+            return [t.strip() for t in v.split(",")]
+        return [int(t.strip()) for t in v.split(",")]
+
     def serializeConfig(self, configD, optionD=None):
         """Apply an adhoc set of filters on the input configuration dictionary.
         Input option values are assumed to be python objects to be converted to strings for output
@@ -350,16 +571,8 @@ class ConfigInfoFile:
 
         return retD
 
-    @staticmethod
-    def __copyWithTimeStamp(filePath):
-        try:
-            bckupPath = filePath + datetime.datetime.now().strftime("-%Y-%m-%d-%H-%M-%S")  # noqa: DTZ005
-            shutil.copyfile(filePath, bckupPath)
-            return True
-        except Exception as e:  # noqa: BLE001
-            logger.info("Could not write backup file %s - %s", bckupPath, str(e))
-
-        return False
+    def __copyWithTimeStamp(self, filePath):
+        return self.__backup.backup(filePath)
 
     def writePythonConfigCache(self, cacheD, cacheFilePath, withBackup=True):
         """Write a Python cache file containing configuration option data in the input cache dictionary.
@@ -383,11 +596,15 @@ class ConfigInfoFileCache(object):
         except:
             return cls.getJsonConfigDictionary(siteId)
 
+    @classmethod
+    def hasConfigDictionary(cls, siteId):
+        return siteId in cls._configD
+
     @classmethod
     def getJsonConfigDictionary(cls, siteId):
         try:
             p = os.getenv("TOP_WWPDB_SITE_CONFIG_DIR")
-            for l in ["rcsb-east", "rcsb-west", "pdbj", "pdbe", "pdbc"]:
+            for l in %r:
                 jsonPath = os.path.join(p,l,siteId.lower(),"ConfigInfoFileCache.json")
                 if os.access(jsonPath, os.R_OK):
                     with open(jsonPath, "r") as infile:
@@ -424,11 +641,11 @@ class ConfigInfoFileCache(object):
                     if not ok:
                         logger.error("failed writing backup cache file for %s", cacheFilePath)
                         return False
-            with open(cacheFilePath, "wb") as cacheFile:
+            with ConfigInfoAtomicFile(cacheFilePath, "wb") as cacheFile:
                 if sys.version_info[0] > 2:  # noqa: UP036
-                    cacheFile.write((template % cacheD).encode())
+                    cacheFile.write((template % (cacheD, list(self.CACHE_LOCATION_NAMES))).encode())
                 else:
-                    cacheFile.write(template % cacheD)
+                    cacheFile.write(template % (cacheD, list(self.CACHE_LOCATION_NAMES)))
             return True
         except Exception as e:  # noqa: E722
             logger.info("failed writing %s - %s", cacheFilePath, str(e))
@@ -445,7 +662,7 @@ class ConfigInfoFileCache(object):
                     if not ok:
                         logger.error("failed writing backup cache file for %s", cacheFilePath)
                         return False
-            with open(cacheFilePath, "w") as outfile:
+            with ConfigInfoAtomicFile(cacheFilePath, "w") as outfile:
                 json.dump(cacheD, outfile, indent=4)
             return True
         except Exception as e:
@@ -455,9 +672,10 @@ class ConfigInfoFileCache(object):
         return False
 
     def readJsonConfigCache(self, cacheFilePath):
-        """Read a JSON cache file and return a dictionary containing configuration option data."""
+        """Read a JSON cache file (or gzip compressed backup) and return a dictionary containing configuration option data."""
         try:
-            with open(cacheFilePath) as infile:
+            opener = gzip.open if cacheFilePath.endswith(".gz") else open
+            with opener(cacheFilePath, "rt") as infile:
                 return json.load(infile)
         except Exception as e:
             logger.info("failed reading %s - %s", cacheFilePath, str(e))
@@ -18,6 +18,17 @@
 #  12-Apr-2017  jdw   add missing site-common and common configuration paths in search for private configuration sections.
 #  11-Oct-2017  jdw   add back_server_* private section
 #  05-Oct-2018   ep   add options to inject a mock environment variable into config. Add support for a R/O source tree and R/W cache directory
+#  19-Oct-2026        add --provenance option reporting the source file, section, line and interpolation chain of each option
+#  19-Oct-2026        add --diff and --diffcache options comparing sites and cache file generations
+#  19-Oct-2026        add backup retention policy options and --compactbackups
+#  19-Oct-2026        write pre-rendered shell and httpd environment files with the cache files
+#  19-Oct-2026        write the host site map used by ConfigInfoShellExec with the cache files
+#  19-Oct-2026        add --checkranges analyzing the data set id range assignments (combine with --writecache at cache build time)
+#  19-Oct-2026        add getConfigPathSectionList()
+#  19-Oct-2026        report configuration read and cache write phase timings to the ConfigInfoTiming hook
+#  19-Oct-2026        cast known options to their declared types (ConfigInfoSchema) and report validation errors
+#  19-Oct-2026        deserialize site options and sections in one pass (ConfigInfoFile.deserializeSiteConfig())
+#  19-Oct-2026        share converted values and repeated strings across the sites of a location build
 """
 Execuction wrapper for configuration option and cache file management.
 
@@ -35,7 +46,14 @@ import sys
 import traceback
 from optparse import SUPPRESS_HELP, OptionParser  # pylint: disable=deprecated-module
 
+from wwpdb.utils.config.ConfigInfoBackup import ConfigInfoBackup
+from wwpdb.utils.config.ConfigInfoData import ConfigInfoData
+from wwpdb.utils.config.ConfigInfoDiff import ConfigInfoDiff
 from wwpdb.utils.config.ConfigInfoFile import ConfigInfoFile
+from wwpdb.utils.config.ConfigInfoIdRange import ConfigInfoIdRange
+from wwpdb.utils.config.ConfigInfoSchema import ConfigInfoSchema
+from wwpdb.utils.config.ConfigInfoShellExec import ConfigInfoShellExec
+from wwpdb.utils.config.ConfigInfoTiming import ConfigInfoTiming
 
 logging.basicConfig(level=logging.INFO, format="[%(levelname)s]-%(module)s.%(funcName)s: %(message)s")
 logger = logging.getLogger()
@@ -63,6 +81,13 @@ class ConfigInfoFileExec:
         self.__privateSectionNameList = []
         # additional configuration sections added to the common namespace
         self.__extraCommonSectionNameList = []
+        # retention policy for timestamped backups (default from the project common configuration)
+        self.__backupPolicy = None
+        # declared types of known options applied to deserialized configurations
+        self.__schema = ConfigInfoSchema()
+        self.__schemaErrorL = []
+        # converted values and repeated strings shared by the sites of a location build (writeLocationConfigCache())
+        self.__memoD = None
 
     def setPrivateSectionNames(self, sectionNameList):
         self.__privateSectionNameList = sectionNameList
@@ -76,6 +101,22 @@ class ConfigInfoFileExec:
     def __getExtraCommonSectionNames(self):
         return self.__extraCommonSectionNameList
 
+    def setSchema(self, schemaD=None):
+        """Add (or override) the declared types of options (see ConfigInfoSchema) - {option: type name}"""
+        self.__schema = ConfigInfoSchema(schemaD=schemaD)
+
+    def getSchemaErrors(self):
+        """Return the validation errors [(siteLoc, siteId, message), ...] of the configurations read by this instance."""
+        return list(self.__schemaErrorL)
+
+    def setBackupPolicy(self, keepCount=None, keepDays=None, dedup=True, compress=False):
+        self.__backupPolicy = ConfigInfoBackup(keepCount=keepCount, keepDays=keepDays, dedup=dedup, compress=compress)
+
+    def __getBackupPolicy(self):
+        if self.__backupPolicy is None:
+            self.__backupPolicy = ConfigInfoBackup.fromConfig(self.__getCommonConfig())
+        return self.__backupPolicy
+
     def testConfigPath(self, accessType="read"):
         ok = True
         try:
@@ -178,33 +219,47 @@ class ConfigInfoFileExec:
 
         return cfPathSectionList
 
+    def getConfigPathSectionList(self, siteLoc, siteId):
+        """Return the search path of configuration file paths and section names for the input location and site
+        using the current common and private section name settings (see readConfigFileList()).
+        """
+        return self.__getConfigPathSectionList(siteLoc, siteId, self.__getExtraCommonSectionNames(), self.__getPrivateSectionNames())
+
     def __getSiteConfig(self, siteLoc, siteId, deserialize=True):
         """Return the complete site of configuration options for the input location and site."""
         cD = {}
+        pT = ConfigInfoTiming.getPhaseTimer("ConfigInfoFileExec", siteLoc=siteLoc, siteId=siteId)
         try:
             privateSectionNameList = self.__getPrivateSectionNames()
             extraCommonSectionNameList = self.__getExtraCommonSectionNames()
             pathSectList = self.__getConfigPathSectionList(
                 siteLoc, siteId, extraCommonSectionNameList, privateSectionNameList
             )
+            pT.mark("path_discovery")
             if self.__debug:
                 self.__lfh.write("__getSiteConfig Path list for location %r site %r\n" % (siteLoc, siteId))
                 for pTup in pathSectList:
                     self.__lfh.write("__getSiteConfig %r\n" % pTup)
             cf = ConfigInfoFile(mockTopPath=self.__mockTopPath, verbose=self.__verbose, log=self.__lfh)
             cD = cf.readConfigFileList(configPathSectionList=pathSectList)
+            # file parsing is timed within readConfigFileList() and the balance is string interpolation
+            pT.add("parse", cf.getParseTime())
+            pT.mark("interpolate", less=cf.getParseTime())
             if deserialize:
-                cD = cf.deserializeConfig(cD, optionD=cD)
-                # Deserialize any subsections -  avoid checking for private section name with wildcards.
+                # Deserialize the options and any subsections -  avoid checking for private section name with wildcards.
                 if True:  # pylint: disable=using-constant-test
-                    for k, v in cD.items():
-                        if isinstance(v, dict):
-                            cD[k] = cf.deserializeConfig(cD[k], optionD=cD)
+                    cD = cf.deserializeSiteConfig(cD, memoD=self.__memoD)
                 else:
+                    cD = cf.deserializeConfig(cD, optionD=cD)
                     for sectionName in privateSectionNameList:
                         sU = sectionName.upper()
                         if sU in cD:
                             cD[sU] = cf.deserializeConfig(cD[sU], optionD=cD[sU])
+                cD, errorL = self.__schema.apply(cD)
+                for msg in errorL:
+                    self.__lfh.write("schema validation error for location %r site %r - %s\n" % (siteLoc, siteId, msg))
+                    self.__schemaErrorL.append((siteLoc, siteId, msg))
+                pT.mark("deserialize")
         except Exception as e:  # noqa: BLE001
             self.__lfh.write("__getSiteConfig failing for location %r site %r - %r\n" % (siteLoc, siteId, str(e)))
             traceback.print_exc(file=self.__lfh)
@@ -250,6 +305,96 @@ class ConfigInfoFileExec:
             self.__lfh.write("printConfig failing for location %r site %r - %r\n" % (siteLoc, siteId, str(e)))
             traceback.print_exc(file=self.__lfh)
 
+    def getProvenance(self, siteLoc, siteId):
+        """Return the provenance of the configuration options for the input location and site.
+
+        Returns: d[option] = {"file":, "section":, "line":, "interpolation": [...]} with private section
+                 options stored in embedded dictionaries using section name keys.
+        """
+        pD = {}
+        try:
+            pathSectList = self.__getConfigPathSectionList(siteLoc, siteId, self.__getExtraCommonSectionNames(), self.__getPrivateSectionNames())
+            cf = ConfigInfoFile(mockTopPath=self.__mockTopPath, verbose=self.__verbose, log=self.__lfh, trackProvenance=True)
+            cf.readConfigFileList(configPathSectionList=pathSectList)
+            pD = cf.getProvenanceDictionary()
+        except Exception as e:  # noqa: BLE001
+            self.__lfh.write("getProvenance failing for location %r site %r - %r\n" % (siteLoc, siteId, str(e)))
+            traceback.print_exc(file=self.__lfh)
+        return pD
+
+    def printProvenance(self, siteLoc, siteId, keyWord=None):
+        """Print the provenance of the configuration options (or the input option) for the input location and site."""
+        try:
+            pD = self.getProvenance(siteLoc, siteId)
+            kyU = str(keyWord).upper() if keyWord else None
+            for k in sorted(pD.keys()):
+                v = pD[k]
+                if "file" not in v:
+                    for k1 in sorted(v.keys()):
+                        if kyU is None or kyU in (k, k1):
+                            self.__printProvenanceItem("%s.%s" % (k, k1), v[k1])
+                elif kyU is None or kyU == k:
+                    self.__printProvenanceItem(k, v)
+        except Exception as e:  # noqa: BLE001
+            self.__lfh.write("printProvenance failing for location %r site %r - %r\n" % (siteLoc, siteId, str(e)))
+            traceback.print_exc(file=self.__lfh)
+
+    def __printProvenanceItem(self, ky, pD):
+        self.__lfh.write(" +++ %-45s  %s:%s [%s]\n" % (ky, pD["file"], pD["line"], pD["section"]))
+        for rD in pD["interpolation"]:
+            self.__lfh.write(" ---  --- <<< %-41s  %s:%s [%s]\n" % (rD["key"], rD["file"], rD["line"], rD["section"]))
+
+    def diffConfig(self, siteLoc, siteId, otherSiteLoc, otherSiteId):
+        """Return the list of differences between the resolved configuration options of two location/site pairs.
+
+        Returns: [{"path": [section, ..., option], "change": , "left": , "right": }, ...] (see ConfigInfoDiff)
+        """
+        try:
+            leftD = self.__getSiteConfig(siteLoc, siteId, deserialize=True)
+            rightD = self.__getSiteConfig(otherSiteLoc, otherSiteId, deserialize=True)
+            return ConfigInfoDiff().diff(leftD, rightD)
+        except Exception as e:  # noqa: BLE001
+            self.__lfh.write("diffConfig failing for location %r site %r and location %r site %r - %r\n" % (siteLoc, siteId, otherSiteLoc, otherSiteId, str(e)))
+            traceback.print_exc(file=self.__lfh)
+        return []
+
+    def getConfigCacheBackupList(self, siteLoc, siteId):
+        """Return the list of timestamped backups of the JSON cache file for the input location and site (oldest first)."""
+        return ConfigInfoBackup.getBackupList(self.__getSiteJsonCachePath(siteLoc, siteId))
+
+    def diffConfigCache(self, siteLoc, siteId, backupFilePath=None):
+        """Return the list of differences between a backup generation of the JSON cache file (default the most
+        recent timestamped backup) and the current JSON cache file for the input location and site.
+        """
+        try:
+            if backupFilePath is None:
+                bckupL = self.getConfigCacheBackupList(siteLoc, siteId)
+                if not bckupL:
+                    self.__lfh.write("No cache file backups for location %r site %r\n" % (siteLoc, siteId))
+                    return []
+                backupFilePath = bckupL[-1]
+            cf = ConfigInfoFile(mockTopPath=self.__mockTopPath, verbose=self.__verbose, log=self.__lfh)
+            leftD = cf.readJsonConfigCache(backupFilePath).get(siteId.upper(), {})
+            rightD = cf.readJsonConfigCache(self.__getSiteJsonCachePath(siteLoc, siteId)).get(siteId.upper(), {})
+            return ConfigInfoDiff().diff(leftD, rightD)
+        except Exception as e:  # noqa: BLE001
+            self.__lfh.write("diffConfigCache failing for location %r site %r - %r\n" % (siteLoc, siteId, str(e)))
+            traceback.print_exc(file=self.__lfh)
+        return []
+
+    def printDiff(self, diffL):
+        """Print the input list of configuration differences."""
+        for dD in diffL:
+            ky = ".".join([str(t) for t in dD["path"]])
+            if dD["change"] == "added":
+                self.__lfh.write(" +++ %-45s  %r\n" % (ky, dD["right"]))
+            elif dD["change"] == "removed":
+                self.__lfh.write(" --- %-45s  %r\n" % (ky, dD["left"]))
+            else:
+                self.__lfh.write(" !!! %-45s  %r -> %r (%s)\n" % (ky, dD["left"], dD["right"], dD["change"]))
+        sD = ConfigInfoDiff.summarize(diffL)
+        self.__lfh.write("differences: added %d removed %d modified %d type %d\n" % (sD["added"], sD["removed"], sD["modified"], sD["type"]))
+
     def writeConfigCache(self, siteLoc, siteId, skipEmpty=True):
         """Write Python and JSON format cache files using the configuration options for input location and site."""
         self.__lfh.write("Starting writeConfigCache\n")
@@ -258,14 +403,23 @@ class ConfigInfoFileExec:
             if ((cD is None) or (len(cD) < 1)) and skipEmpty:
                 self.__lfh.write("SKIPPING update of empty cache files for location %r site %r\n" % (siteLoc, siteId))
                 return False
-            cf = ConfigInfoFile(mockTopPath=self.__mockTopPath, verbose=self.__verbose, log=self.__lfh)
+            pT = ConfigInfoTiming.getPhaseTimer("ConfigInfoFileExec", siteLoc=siteLoc, siteId=siteId)
+            cf = ConfigInfoFile(
+                mockTopPath=self.__mockTopPath,
+                verbose=self.__verbose,
+                log=self.__lfh,
+                backupPolicy=self.__getBackupPolicy(),
+            )
             cfCachePath = self.__getSitePythonCachePath(siteLoc, siteId)
             cf.writePythonConfigCache(cacheD={siteId.upper(): cD}, cacheFilePath=cfCachePath)
             cfCachePath = self.__getSiteJsonCachePath(siteLoc, siteId)
             cf.writeJsonConfigCache(cacheD={siteId.upper(): cD}, cacheFilePath=cfCachePath)
+            self.__writeEnvironmentFiles(cD, cfCachePath)
+            pT.mark("write")
             self.__lfh.write(
                 "updating cache files with %d options for location %r site %r\n" % (len(cD), siteLoc, siteId)
             )
+            self.writeHostSiteMap()
             return True
         except Exception as e:  # noqa: BLE001
             self.__lfh.write("writeConfigCache failing for location %r site %r - %r\n" % (siteLoc, siteId, str(e)))
@@ -281,6 +435,7 @@ class ConfigInfoFileExec:
             siteIdList = []
             if siteLoc.upper() in siteD:
                 siteIdList = siteD[siteLoc.upper()]
+            self.__memoD = {}
             for siteId in siteIdList:
                 cD = self.__getSiteConfig(siteLoc, siteId, deserialize=True)
                 if ((cD is None) or (len(cD) < 1)) and skipEmpty:
@@ -288,13 +443,21 @@ class ConfigInfoFileExec:
                         "SKIPPING update of empty cache files for location %r site %r\n" % (siteLoc, siteId)
                     )
                     continue
-                cf = ConfigInfoFile(mockTopPath=self.__mockTopPath, verbose=self.__verbose, log=self.__lfh)
+                pT = ConfigInfoTiming.getPhaseTimer("ConfigInfoFileExec", siteLoc=siteLoc, siteId=siteId)
+                cf = ConfigInfoFile(
+                    mockTopPath=self.__mockTopPath,
+                    verbose=self.__verbose,
+                    log=self.__lfh,
+                    backupPolicy=self.__getBackupPolicy(),
+                )
                 cfPath = self.__getSiteConfigPath(siteLoc, siteId, "none")[0]
                 if os.path.exists(cfPath):
                     cfCachePath = self.__getSitePythonCachePath(siteLoc, siteId)
                     cf.writePythonConfigCache(cacheD={siteId.upper(): cD}, cacheFilePath=cfCachePath)
                     cfCachePath = self.__getSiteJsonCachePath(siteLoc, siteId)
                     cf.writeJsonConfigCache(cacheD={siteId.upper(): cD}, cacheFilePath=cfCachePath)
+                    self.__writeEnvironmentFiles(cD, cfCachePath)
+                    pT.mark("write")
                     self.__lfh.write(
                         "updating cache files with %d options for location %r site %r\n" % (len(cD), siteLoc, siteId)
                     )
@@ -303,15 +466,95 @@ class ConfigInfoFileExec:
                         "skipping cache files with for location %r site %r as site.cfg missing %s \n"
                         % (siteLoc, siteId, cfPath)
                     )
+            self.writeHostSiteMap()
             return True
         except Exception as e:  # noqa: BLE001
             self.__lfh.write(
                 "writeLocationConfigCache failing for location %r site %r - %r\n" % (siteLoc, siteId, str(e))
             )
             traceback.print_exc(file=self.__lfh)
+        finally:
+            self.__memoD = None
 
         return False
 
+    def checkIdRanges(self, quiet=False):
+        """Analyze the data set, test data set and group data set id range assignments for overlapping,
+        shadowed and malformed ranges and report gaps and unassigned blocks (unless quiet).
+
+        Returns: {assignment dictionary name: analysis (see ConfigInfoIdRange.analyze())}
+        """
+        rD = {}
+        # the assignment dictionaries are class-level options common to all sites
+        cD = ConfigInfoData(verbose=False, useCache=False).getConfigDictionary()
+        for name in [
+            "SITE_DATASET_ID_ASSIGNMENT_DICTIONARY",
+            "SITE_DATASET_TEST_ID_ASSIGNMENT_DICTIONARY",
+            "SITE_GROUP_DATASET_ID_ASSIGNMENT_DICTIONARY",
+        ]:
+            aD = ConfigInfoIdRange(cD[name]).analyze()
+            rD[name] = aD
+            if not quiet:
+                self.__lfh.write("%s ranges %d\n" % (name, aD["ranges"]))
+            for siteId, rng in aD["invalid"]:
+                self.__lfh.write("  ERROR   invalid range for %s %r\n" % (siteId, rng))
+            for siteId, otherSiteId, lower, upper, ownerSiteId in aD["overlaps"]:
+                self.__lfh.write("  WARNING range for %s overlaps %s at %d - %d (owned by %s)\n" % (siteId, otherSiteId, lower, upper, ownerSiteId))
+            for siteId in aD["shadowed"]:
+                self.__lfh.write("  WARNING range for %s is hidden by earlier ranges\n" % siteId)
+            if quiet:
+                continue
+            for siteId, ownerSiteId, lower, upper in aD["aliases"]:
+                self.__lfh.write("  alias      %-36s %12d - %-12d owned by %s\n" % (siteId, lower, upper, ownerSiteId))
+            for lower, upper in aD["gaps"]:
+                self.__lfh.write("  gap        %-36s %12d - %d\n" % ("", lower, upper))
+            for lower, upper in aD["unassigned"]:
+                self.__lfh.write("  unassigned %-36s %12d - %d\n" % ("", lower, upper))
+        return rD
+
+    def writeHostSiteMap(self):
+        """Write the compact host name to location and site map (common/host_site_map.json) from the
+        host_site_defaults section of the project common configuration file.
+        """
+        cfPath = self.__getCommonConfigPath()[0]
+        if not os.access(cfPath, os.R_OK):
+            return False
+        ok = ConfigInfoShellExec.writeHostSiteMap(self.__topConfigPath, commonConfigPath=cfPath)
+        if not ok:
+            self.__lfh.write("writeHostSiteMap failing for %s\n" % cfPath)
+        return ok
+
+    def __writeEnvironmentFiles(self, cD, jsonCachePath):
+        """Write pre-rendered environment files (site.env.sh, site.env.csh, httpd.env) next to the JSON cache
+        file stamped with the fingerprint of the cache file.
+        """
+        fingerprint = ConfigInfoShellExec.getCacheFingerprint(jsonCachePath)
+        if fingerprint is None:
+            self.__lfh.write("skipping environment files - missing cache file %s\n" % jsonCachePath)
+            return False
+        return ConfigInfoShellExec.writeEnvironmentFiles(cD, os.path.dirname(jsonCachePath), fingerprint)
+
+    def compactBackups(self, siteLoc=None, siteId=None):
+        """Apply the backup retention policy to the timestamped backups within the configuration tree
+        (or within the subtree for the input location and site).
+
+        Returns: {"files": number of backed up files, "removed": number of removed backups, "compressed": number of compressed backups}
+        """
+        self.__lfh.write("Starting compactBackups\n")
+        try:
+            dirPath = self.__topConfigPath
+            if siteLoc is not None:
+                dirPath = os.path.join(dirPath, siteLoc.lower())
+                if siteId is not None:
+                    dirPath = os.path.join(dirPath, siteId.lower())
+            retD = self.__getBackupPolicy().compactDirectory(dirPath)
+            self.__lfh.write("compacted backups of %d files in %s removed %d compressed %d\n" % (retD["files"], dirPath, retD["removed"], retD["compressed"]))
+            return retD
+        except Exception as e:  # noqa: BLE001
+            self.__lfh.write("compactBackups failing for location %r site %r - %r\n" % (siteLoc, siteId, str(e)))
+            traceback.print_exc(file=self.__lfh)
+        return {}
+
     def __getLocSiteD(self):
         # Fetch custom location site details from the global common configuration file -
         comD = self.__getCommonConfig()
@@ -359,10 +602,38 @@ def main():  # pragma: no cover
 
        python %prog --print --siteid=WWPDB_DEPLOY_TEST_RU --locid=rcsb-east
 
+     Print the source file, section, line and interpolation chain of each option (or only --key) for a site:
+
+       python %prog --provenance --siteid=WWPDB_DEPLOY_TEST_RU --locid=rcsb-east --key=SITE_DEPLOY_PATH
+
+     Compare the configuration options of two sites (--otherlocid defaults to --locid):
+
+       python %prog --diff --siteid=WWPDB_DEPLOY_TEST_RU --locid=rcsb-east --othersiteid=WWPDB_DEPLOY_PRODUCTION_RU
+
+     Compare the current JSON cache file with its most recent timestamped backup (or --backupfile):
+
+       python %prog --diffcache --siteid=WWPDB_DEPLOY_TEST_RU --locid=rcsb-east
+
      Write/update the Python and JSON cache files for the specified site (requires --locid or both --locid & --siteid).
 
        python %prog --writecache --siteid=WWPDB_DEPLOY_TEST_RU --locid=rcsb-east
 
+     Analyze the data set id range assignments for overlaps, gaps and unassigned blocks (add to --writecache
+     to check the assignments when building the cache files):
+
+       python %prog --checkranges
+       python %prog --writecache --checkranges --locid=rcsb-east
+
+     Write the host name to location and site map used by ConfigInfoShellExec --hostname (also written by --writecache):
+
+       python %prog --writehostmap
+
+     Remove redundant timestamped backup files within the configuration tree (optionally limited to --locid/--siteid)
+     keeping at most --keep backups per file, none older than --keepdays (the latest is always kept), and gzip
+     the remainder with --gzip.  These policy options also apply to the backups written by --writecache.
+
+       python %prog --compactbackups --locid=rcsb-east --keep=10 --keepdays=90 --gzip
+
      Include additional locally scoped configuration sections using --sections="sec1,sec2,..." that
      will be stored in embedded dictionaries using section name keys (default=os_environment,httpd_services)
 
@@ -383,6 +654,31 @@ def main():  # pragma: no cover
         default=False,
         help="Print the configuration options a site (--siteid) within a location (--locid)",
     )
+    parser.add_option(
+        "--provenance",
+        dest="printProvenance",
+        action="store_true",
+        default=False,
+        help="Print the origin of the configuration options a site (--siteid) within a location (--locid)",
+    )
+    parser.add_option("--key", dest="keyWord", default=None, help="Restrict --provenance to a single option")
+    parser.add_option(
+        "--diff",
+        dest="diffConfig",
+        action="store_true",
+        default=False,
+        help="Compare the configuration options of a site (--siteid/--locid) with another (--othersiteid/--otherlocid)",
+    )
+    parser.add_option("--othersiteid", dest="otherSiteId", default=None, help="wwPDB site ID compared by --diff")
+    parser.add_option("--otherlocid", dest="otherLocId", default=None, help="wwPDB location ID compared by --diff")
+    parser.add_option(
+        "--diffcache",
+        dest="diffCache",
+        action="store_true",
+        default=False,
+        help="Compare the JSON cache file for a site (--siteid/--locid) with a timestamped backup",
+    )
+    parser.add_option("--backupfile", dest="backupFile", default=None, help="Cache file backup compared by --diffcache")
     parser.add_option(
         "--writecache",
         dest="writeCache",
@@ -391,6 +687,32 @@ def main():  # pragma: no cover
         help="Write configuration cache file for a site (--siteid) within a location (--locid)",
     )
 
+    parser.add_option(
+        "--checkranges",
+        dest="checkRanges",
+        action="store_true",
+        default=False,
+        help="Analyze the data set id range assignments for overlaps, gaps and unassigned blocks",
+    )
+    parser.add_option(
+        "--writehostmap",
+        dest="writeHostMap",
+        action="store_true",
+        default=False,
+        help="Write the host name to location and site map (common/host_site_map.json)",
+    )
+    parser.add_option(
+        "--compactbackups",
+        dest="compactBackups",
+        action="store_true",
+        default=False,
+        help="Apply the backup retention policy to the timestamped backup files in the configuration tree",
+    )
+    parser.add_option("--keep", dest="keepCount", type="int", default=None, help="Number of backups retained per file")
+    parser.add_option("--keepdays", dest="keepDays", type="float", default=None, help="Age in days of retained backups")
+    parser.add_option("--gzip", dest="compress", action="store_true", default=False, help="Compress backup files")
+    parser.add_option("--nodedup", dest="noDedup", action="store_true", default=False, help="Retain backups with duplicate content")
+
     parser.add_option("--siteid", dest="siteId", default=None, help="wwPDB site ID (e.g. WWPDB_DEPLOY_TEST_RU)")
     parser.add_option(
         "--locid", dest="locId", default=None, help="wwPDB location ID (e.g. pdbe, pdbj, rcsb-east, ... )"
@@ -442,6 +764,9 @@ def main():  # pragma: no cover
         commonSectionNameList = ["database_services", "validation_services"]
     cI.addCommonSectionNames(sectionNameList=commonSectionNameList)
 
+    if options.keepCount is not None or options.keepDays is not None or options.compress or options.noDedup:
+        cI.setBackupPolicy(keepCount=options.keepCount, keepDays=options.keepDays, dedup=not options.noDedup, compress=options.compress)
+
     if (
         options.checkConfig
         and options.siteId is not None
@@ -458,6 +783,16 @@ def main():  # pragma: no cover
     ):
         cI.printConfig(siteLoc=options.locId, siteId=options.siteId)
 
+    if options.printProvenance and options.siteId is not None and options.locId is not None and cI.testConfigPath(accessType="read"):
+        cI.printProvenance(siteLoc=options.locId, siteId=options.siteId, keyWord=options.keyWord)
+
+    if options.diffConfig and options.siteId is not None and options.locId is not None and options.otherSiteId is not None and cI.testConfigPath(accessType="read"):
+        otherLocId = options.otherLocId if options.otherLocId else options.locId
+        cI.printDiff(cI.diffConfig(options.locId, options.siteId, otherLocId, options.otherSiteId))
+
+    if options.diffCache and options.siteId is not None and options.locId is not None and cI.testConfigPath(accessType="read"):
+        cI.printDiff(cI.diffConfigCache(options.locId, options.siteId, backupFilePath=options.backupFile))
+
     if (
         options.writeCache
         and options.siteId is not None
@@ -473,6 +808,15 @@ def main():  # pragma: no cover
     ):
         cI.writeLocationConfigCache(siteLoc=options.locId)
 
+    if options.checkRanges:
+        cI.checkIdRanges()
+
+    if options.writeHostMap and cI.testConfigPath(accessType="write"):
+        cI.writeHostSiteMap()
+
+    if options.compactBackups and cI.testConfigPath(accessType="write"):
+        cI.compactBackups(siteLoc=options.locId, siteId=options.siteId)
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,239 @@
+##
+# File:    ConfigInfoGenerator.py
+# Date:    19-Oct-2026
+#
+# Updates:
+##
+"""
+Generator of synthetic site configuration trees for load testing the configuration cache build.
+
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "John Westbrook"
+__email__ = "jwest@rcsb.rutgers.edu"
+__license__ = "Apache 2.0"
+__version__ = "V0.01"
+
+import logging
+import os
+import random
+
+from wwpdb.utils.config.ConfigInfoFile import ConfigInfoFile
+
+logger = logging.getLogger(__name__)
+
+
+class ConfigInfoGenerator:
+    """
+    Writes a configuration tree with the layout of TOP_WWPDB_SITE_CONFIG_DIR -
+
+        common/common.cfg                   [common] options, selectors and location site dictionary,
+                                            [host_site_defaults], [database_services] and private sections
+        <location>/site_common/common.cfg   [site_common] options and private and wildcard sections
+        <location>/<siteid>/site.cfg        [<siteid>] options and private and wildcard sections
+
+    Each file holds an interpolation chain of the input depth (e.g. top_path_3 = %(top_path_2)s/level_3)
+    and path options reference random levels of the chains available to them in resolution order
+    (site.cfg, site_common/common.cfg and then common/common.cfg).  Options cycle through string, path,
+    integer, float, comma separated list, integer list and object values with the matching
+    config_as_* and config_csv_as_* selectors in the [common] section.  Site files override a fraction
+    of the common options.
+
+    Options in the private sections of the common configuration file are not interpolated as this file is
+    also read section by section with ConfigParser interpolation (e.g. ConfigInfoFileExec.__getCommonConfig()).
+
+    The output is determined by the input parameters and random seed.
+    """
+
+    LOCATION_NAMES = ConfigInfoFile.CACHE_LOCATION_NAMES
+    PRIVATE_SECTION_NAMES = ("os_environment", "httpd_services", "install_environment", "validation_services")
+    WILDCARD_SECTION_PATTERNS = ("backup_server_*", "test_setup_*")
+    COMMON_SECTION_NAMES = ("database_services",)
+
+    def __init__(
+        self,
+        locations=5,
+        sites=10,
+        options=200,
+        commonOptions=None,
+        interpolationDepth=4,
+        privateSections=3,
+        privateOptions=20,
+        wildcardSections=2,
+        overrideFraction=0.1,
+        seed=1,
+    ):
+        self.__nLocations = locations
+        self.__nSites = sites
+        self.__nOptions = options
+        self.__nCommonOptions = options if commonOptions is None else commonOptions
+        self.__depth = max(1, interpolationDepth)
+        self.__nPrivate = min(privateSections, len(self.PRIVATE_SECTION_NAMES))
+        self.__nPrivateOptions = privateOptions
+        self.__nWildcard = wildcardSections
+        self.__overrideFraction = overrideFraction
+        self.__seed = seed
+
+    def getLocationSiteD(self):
+        """Return the generated site identifiers organized by location {LOCATION: [SITEID, ...]}."""
+        locSiteD = {}
+        for ii in range(self.__nLocations):
+            loc = self.LOCATION_NAMES[ii] if ii < len(self.LOCATION_NAMES) else "location-%d" % ii
+            locSiteD[loc.upper()] = ["WWPDB_SYNTH_%s_%03d" % (loc.upper().replace("-", "_"), jj) for jj in range(self.__nSites)]
+        return locSiteD
+
+    def getPrivateSectionNames(self):
+        """Return the private section names (including wildcard patterns) used in the generated files."""
+        return list(self.PRIVATE_SECTION_NAMES[: self.__nPrivate]) + ["host_site_defaults"] + list(self.WILDCARD_SECTION_PATTERNS)
+
+    def getCommonSectionNames(self):
+        """Return the extra section names added to the common namespace in the generated files."""
+        return list(self.COMMON_SECTION_NAMES)
+
+    def generate(self, topPath):
+        """Write the configuration tree below topPath.
+
+        Returns: {"locations": number, "sites": number, "files": number, "options": number of option lines}
+        """
+        rng = random.Random(self.__seed)
+        cf = ConfigInfoFile()
+        locSiteD = self.getLocationSiteD()
+        sD = {"locations": len(locSiteD), "sites": 0, "files": 0, "options": 0}
+
+        sectionL, sectionD = self.__getCommonSections(rng, locSiteD)
+        self.__write(cf, os.path.join(topPath, "common", "common.cfg"), sectionL, sectionD, sD)
+        for loc, siteIdL in locSiteD.items():
+            sectionL, sectionD = self.__getSiteCommonSections(rng, loc)
+            self.__write(cf, os.path.join(topPath, loc.lower(), "site_common", "common.cfg"), sectionL, sectionD, sD)
+            for siteId in siteIdL:
+                sectionL, sectionD = self.__getSiteSections(rng, loc, siteId)
+                self.__write(cf, os.path.join(topPath, loc.lower(), siteId.lower(), "site.cfg"), sectionL, sectionD, sD)
+                sD["sites"] += 1
+        logger.info(
+            "generated %d locations %d sites %d files %d options in %s",
+            sD["locations"],
+            sD["sites"],
+            sD["files"],
+            sD["options"],
+            topPath,
+        )
+        return sD
+
+    @staticmethod
+    def __write(cf, filePath, sectionL, sectionD, sD):
+        dirPath = os.path.dirname(filePath)
+        if not os.path.isdir(dirPath):
+            os.makedirs(dirPath)
+        if not cf.writeConfig(filePath, sectionL, sectionD, requireBackup=False, sortKeys=False):
+            raise OSError("failed writing %s" % filePath)
+        sD["files"] += 1
+        sD["options"] += sum(len(sectionD[sectionName]) for sectionName in sectionL)
+
+    def __getChain(self, prefix, root):
+        """Return the ordered options of an interpolation chain and the list of its keys."""
+        d = {"%s_0" % prefix: root}
+        for level in range(1, self.__depth + 1):
+            d["%s_%d" % (prefix, level)] = "%%(%s_%d)s/level_%d" % (prefix, level - 1, level)
+        return d, list(d)
+
+    @staticmethod
+    def __getValue(rng, kind, idx, chainKeyL):
+        """Return the raw value for an option of the input kind (see __getKind())."""
+        if kind == "path":
+            return "%%(%s)s/option_%d" % (rng.choice(chainKeyL), idx)
+        if kind == "int":
+            return str(rng.randint(1, 65535))
+        if kind == "float":
+            return "%.3f" % rng.uniform(0.0, 100.0)
+        if kind == "csv":
+            return ", ".join("item_%d" % rng.randint(0, 99) for _ in range(rng.randint(1, 6)))
+        if kind == "int_list":
+            return ",".join(str(rng.randint(0, 9999)) for _ in range(rng.randint(1, 6)))
+        if kind == "object":
+            return repr({"name": "option_%d" % idx, "values": [rng.randint(0, 99) for _ in range(3)], "flag": True})
+        if kind == "none":
+            return "None"
+        return "value_%d_%d" % (idx, rng.randint(0, 999999))
+
+    @staticmethod
+    def __getKind(idx):
+        kindL = ["path", "str", "int", "path", "csv", "str", "int_list", "path", "object", "float", "none", "str"]
+        return kindL[idx % len(kindL)]
+
+    def __getOptions(self, rng, prefix, count, chainKeyL, start=0):
+        return {"%s_%04d" % (prefix, ii): self.__getValue(rng, self.__getKind(ii), ii, chainKeyL) for ii in range(start, start + count)}
+
+    def __getSelectors(self):
+        """Return the config_as_* and config_csv_as_* selector options for the generated common and site options."""
+        selD = {
+            "int": "config_as_int",
+            "float": "config_as_float",
+            "csv": "config_csv_as_list",
+            "int_list": "config_csv_as_int_list",
+            "object": "config_as_object",
+        }
+        keyD = {v: [] for v in selD.values()}
+        keyD["config_as_object"].extend(["SITE_LOCATION_SITE_DICT", "SITE_BACKUP_DICT"])
+        for prefix, count in [("common_opt", self.__nCommonOptions), ("site_opt", self.__nOptions)]:
+            for ii in range(count):
+                kind = self.__getKind(ii)
+                if kind in selD:
+                    keyD[selD[kind]].append(("%s_%04d" % (prefix, ii)).upper())
+        return {k: ", ".join(v) for k, v in keyD.items() if v}
+
+    def __getPlainOptions(self, rng, prefix, count):
+        return {"%s_%03d" % (prefix, ii): "value_%d_%d" % (ii, rng.randint(0, 999999)) for ii in range(count)}
+
+    def __getCommonSections(self, rng, locSiteD):
+        chainD, chainKeyL = self.__getChain("top_path", "/net/wwpdb_synthetic")
+        commonD = self.__getSelectors()
+        commonD["site_location_site_dict"] = repr(locSiteD)
+        commonD["site_backup_dict"] = "{}"
+        commonD.update(chainD)
+        commonD.update(self.__getOptions(rng, "common_opt", self.__nCommonOptions, chainKeyL))
+        hostD = {}
+        for loc, siteIdL in locSiteD.items():
+            for jj, siteId in enumerate(siteIdL):
+                hostD["host%03d.%s.example.org" % (jj, loc.lower())] = "%s,%s" % (loc.lower(), siteId)
+            hostD["node*.%s.example.org" % loc.lower()] = "%s,%s" % (loc.lower(), siteIdL[0] if siteIdL else "")
+        sectionD = {
+            "common": commonD,
+            "host_site_defaults": hostD,
+            "database_services": {"db_host": "db.example.org", "db_port": "3306", "db_user": "wwpdb"},
+        }
+        for sectionName in self.PRIVATE_SECTION_NAMES[: self.__nPrivate]:
+            sectionD[sectionName] = self.__getPlainOptions(rng, sectionName + "_common", self.__nPrivateOptions)
+        return list(sectionD), sectionD
+
+    def __getSiteCommonSections(self, rng, loc):
+        chainD, chainKeyL = self.__getChain("loc_path", "/net/%s" % loc.lower())
+        siteCommonD = {"site_loc_opt": loc.lower()}
+        siteCommonD.update(chainD)
+        nOverride = int(self.__nCommonOptions * self.__overrideFraction)
+        siteCommonD.update(self.__getOptions(rng, "common_opt", nOverride, chainKeyL, start=self.__nCommonOptions - nOverride))
+        sectionD = {"site_common": siteCommonD, "database_services": {"db_host": "db.%s.example.org" % loc.lower()}}
+        sectionD.update(self.__getPrivateSections(rng, loc.lower() + "_common", chainKeyL + ["top_path_1"]))
+        return list(sectionD), sectionD
+
+    def __getSiteSections(self, rng, loc, siteId):
+        chainD, chainKeyL = self.__getChain("site_path", "/net/%s/%s" % (loc.lower(), siteId.lower()))
+        siteD = {"site_prefix": siteId}
+        siteD.update(chainD)
+        siteD.update(self.__getOptions(rng, "site_opt", self.__nOptions, chainKeyL))
+        nOverride = int(self.__nCommonOptions * self.__overrideFraction)
+        siteD.update(self.__getOptions(rng, "common_opt", nOverride, chainKeyL))
+        sectionD = {siteId.lower(): siteD}
+        # private sections may reference the site, location and project chains
+        refKeyL = chainKeyL + ["loc_path_%d" % self.__depth, "top_path_%d" % self.__depth]
+        sectionD.update(self.__getPrivateSections(rng, siteId.lower(), refKeyL))
+        return list(sectionD), sectionD
+
+    def __getPrivateSections(self, rng, prefix, chainKeyL):
+        sectionD = {}
+        sectionNameL = list(self.PRIVATE_SECTION_NAMES[: self.__nPrivate])
+        for pattern in self.WILDCARD_SECTION_PATTERNS:
+            sectionNameL.extend(pattern.replace("*", str(ii + 1)) for ii in range(self.__nWildcard))
+        for sectionName in sectionNameL:
+            sectionD[sectionName] = {"%s_%s_%03d" % (sectionName, prefix, ii): "%%(%s)s/%s_%d" % (rng.choice(chainKeyL), sectionName, ii) for ii in range(self.__nPrivateOptions)}
+        return sectionD
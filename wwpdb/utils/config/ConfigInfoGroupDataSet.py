@@ -3,6 +3,7 @@
 # Date:    23-Oct-2016
 #
 # Updates:
+#  19-Oct-2026       use the ConfigInfoIdRange() interval index for default group range lookups
 ##
 """
 Provides accessors for the correspondence between deposition data identifiers and
@@ -20,6 +21,7 @@ import logging
 import sys
 
 from wwpdb.utils.config.ConfigInfo import ConfigInfo
+from wwpdb.utils.config.ConfigInfoIdRange import ConfigInfoIdRange
 
 logger = logging.getLogger(__name__)
 
@@ -36,6 +38,7 @@ class ConfigInfoGroupDataSet:
         self.__debug = True
         self.__cI = ConfigInfo(siteId=None, verbose=self.__verbose)
         self.__groupIdAssignments = self.__cI.get("SITE_GROUP_DATASET_ID_ASSIGNMENT_DICTIONARY")
+        self.__rangeIndex = None
 
     def getDefaultGroupIdRange(self, siteId):
         """Return the default upper and lower group deposition data set identifier codes
@@ -70,10 +73,9 @@ class ConfigInfoGroupDataSet:
                 idVal = int(str(groupId)[2:])
             else:
                 idVal = int(str(groupId))
-            for ky in self.__groupIdAssignments:
-                idMin, idMax = self.__groupIdAssignments[ky]
-                if (idVal >= idMin) and (idVal <= idMax):
-                    return ky
+            if self.__rangeIndex is None:
+                self.__rangeIndex = ConfigInfoIdRange(self.__groupIdAssignments)
+            return self.__rangeIndex.getSiteId(idVal)
         except Exception as e:
             if self.__debug:
                 logger.exception("failed checking group range for %r with %s", groupId, str(e))
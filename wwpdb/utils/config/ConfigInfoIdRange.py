@@ -0,0 +1,124 @@
+##
+# File:    ConfigInfoIdRange.py
+# Date:    19-Oct-2026
+#
+# Updates:
+##
+"""
+Interval index and consistency analysis for site data set identifier range assignments.
+
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "John Westbrook"
+__email__ = "jwest@rcsb.rutgers.edu"
+__license__ = "Apache 2.0"
+__version__ = "V0.01"
+
+import bisect
+import heapq
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class ConfigInfoIdRange:
+    """
+    Interval index over an identifier range assignment dictionary {siteId: (idMin, idMax)}
+    (e.g. SITE_DATASET_ID_ASSIGNMENT_DICTIONARY).
+
+    Ranges are inclusive.  Where ranges overlap an identifier belongs to the first site in
+    dictionary order, as with a sequential search of the assignment dictionary.  The index is a
+    sorted list of non-overlapping segments searched by bisection and is built in O(n log n).
+    """
+
+    def __init__(self, assignD):
+        self.__rangeL = []
+        self.__invalidL = []
+        for ii, (siteId, rng) in enumerate((assignD or {}).items()):
+            try:
+                idMin, idMax = int(rng[0]), int(rng[1])
+            except (TypeError, ValueError, IndexError):
+                self.__invalidL.append((str(siteId), rng))
+                continue
+            if idMin > idMax:
+                self.__invalidL.append((str(siteId), rng))
+                continue
+            self.__rangeL.append((idMin, idMax, str(siteId), ii))
+        self.__segmentL = self.__buildSegments(self.__rangeL)
+        self.__startL = [seg[0] for seg in self.__segmentL]
+
+    def getSiteId(self, idVal):
+        """Return the site owning the input integer identifier or None."""
+        ii = bisect.bisect_right(self.__startL, idVal) - 1
+        if ii >= 0 and idVal <= self.__segmentL[ii][1]:
+            return self.__segmentL[ii][2]
+        return None
+
+    def getSegments(self):
+        """Return the sorted list of non-overlapping owned segments [(start, end, siteId),...]."""
+        return list(self.__segmentL)
+
+    def analyze(self, unassignedSiteId="UNASSIGNED"):
+        """Return the consistency report for the range assignments -
+
+        d["ranges"]      number of valid ranges
+        d["invalid"]     [(siteId, range),...] malformed or reversed ranges
+        d["aliases"]     [(siteId, ownerSiteId, idMin, idMax),...] ranges identical to an earlier range
+        d["overlaps"]    [(siteId, otherSiteId, lower, upper, ownerSiteId),...] partially overlapping ranges
+        d["shadowed"]    [siteId,...] sites (other than aliases) owning no identifiers
+        d["gaps"]        [(lower, upper),...] identifiers between ranges owned by no site
+        d["unassigned"]  [(lower, upper),...] identifiers owned by the unassigned site
+
+        Ranges are sorted once and swept in order - O(n log n) in the number of ranges.  Each
+        overlap is reported against the earlier range (by start) reaching furthest.
+        """
+        rD = {"ranges": len(self.__rangeL), "invalid": list(self.__invalidL), "aliases": [], "overlaps": []}
+        gapL = []
+        # upper bound, site and dictionary order of the range reaching furthest so far (none before the first range)
+        reachMax, reachSiteId, reachOrder = None, None, None
+        firstD = {}
+        # identical ranges are visited in dictionary order so the first is the owner
+        for idMin, idMax, siteId, order in sorted(self.__rangeL, key=lambda t: (t[0], t[1], t[3])):
+            if (idMin, idMax) in firstD:
+                rD["aliases"].append((siteId, firstD[(idMin, idMax)], idMin, idMax))
+                continue
+            firstD[(idMin, idMax)] = siteId
+            if reachMax is not None and idMin <= reachMax:
+                ownerSiteId = reachSiteId if reachOrder < order else siteId
+                rD["overlaps"].append((siteId, reachSiteId, idMin, min(idMax, reachMax), ownerSiteId))
+            elif reachMax is not None and idMin > reachMax + 1:
+                gapL.append((reachMax + 1, idMin - 1))
+            if reachMax is None or idMax > reachMax:
+                reachMax, reachSiteId, reachOrder = idMax, siteId, order
+        aliasS = {t[0] for t in rD["aliases"]}
+        ownerS = {seg[2] for seg in self.__segmentL}
+        rD["shadowed"] = sorted({t[2] for t in self.__rangeL} - ownerS - aliasS)
+        rD["gaps"] = gapL
+        rD["unassigned"] = [(seg[0], seg[1]) for seg in self.__segmentL if seg[2] == unassignedSiteId]
+        return rD
+
+    @staticmethod
+    def __buildSegments(rangeL):
+        """Return the sorted owned segments for the input ranges [(idMin, idMax, siteId, order),...]."""
+        boundaryL = sorted({idMin for idMin, _, _, _ in rangeL} | {idMax + 1 for _, idMax, _, _ in rangeL})
+        startL = sorted(rangeL)
+        # heap of the ranges covering the current boundary ordered by dictionary order - expired ranges are
+        # discarded when they reach the top
+        activeL = []
+        jj = 0
+        segmentL = []
+        for start, nextStart in zip(boundaryL[:-1], boundaryL[1:]):
+            while jj < len(startL) and startL[jj][0] <= start:
+                heapq.heappush(activeL, (startL[jj][3], startL[jj][1], startL[jj][2]))
+                jj += 1
+            while activeL and activeL[0][1] < start:
+                heapq.heappop(activeL)
+            if not activeL:
+                continue
+            siteId = activeL[0][2]
+            if segmentL and segmentL[-1][2] == siteId and segmentL[-1][1] == start - 1:
+                segmentL[-1] = (segmentL[-1][0], nextStart - 1, siteId)
+            else:
+                segmentL.append((start, nextStart - 1, siteId))
+        return segmentL
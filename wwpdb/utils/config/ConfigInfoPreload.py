@@ -0,0 +1,142 @@
+##
+# File:    ConfigInfoPreload.py
+# Date:    19-Oct-2026
+#
+# Updates:
+##
+"""
+Pre-fork warm-up of site configuration for preforking application servers.
+
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "John Westbrook"
+__email__ = "jwest@rcsb.rutgers.edu"
+__license__ = "Apache 2.0"
+__version__ = "V0.01"
+
+import gc
+import inspect
+import logging
+import warnings
+
+from wwpdb.utils.config.ConfigInfoContentType import ConfigInfoContentType
+from wwpdb.utils.config.ConfigInfoData import ConfigInfoData
+
+logger = logging.getLogger(__name__)
+
+
+class ConfigInfoPreload:
+    """
+    Resolves configuration in a server master process before workers are forked so that the
+    configuration objects are created once and shared copy-on-write by all workers -
+
+        ConfigInfoPreload.preload(["WWPDB_DEPLOY_TEST_RU"])    e.g. in a gunicorn configuration with preload_app
+
+    For each site the complete configuration dictionary is registered (ConfigInfoData.preloadSiteConfig())
+    and is shared by ConfigInfo instances without the per-instance copy (which touches the reference count
+    of every option), and the public get_*() accessors of the ConfigInfoApp* classes are evaluated so that
+    the derived application paths resolve (and any failing accessor is reported before workers start).  The
+    class-level content type definitions and indexes are built once.  The shared dictionary (and the values
+    returned by ConfigInfo.get() for a preloaded site) must be treated as read-only.
+
+    Finally the garbage collector is run and the surviving objects are moved to the permanent generation
+    (gc.freeze(), Python 3.7+) so that collections in the workers do not write to the pages holding them.
+    Reference count updates on the options a worker uses still copy the pages holding those options.
+    """
+
+    _siteIdL = []  # type: list  # noqa: RUF012
+
+    @classmethod
+    def preload(cls, siteIds, apps=True, freeze=True):
+        """Resolve the configuration for the input site identifiers and optionally freeze the result.
+
+        siteIds   site identifier or list of site identifiers
+        apps      evaluate the ConfigInfoApp* accessors for each site
+        freeze    collect garbage and move the remaining objects to the permanent generation
+
+        Returns: {siteId: {"options": n, "accessors": n, "failed": [accessor, ...]}, ...}
+        """
+        siteIdL = [siteIds] if isinstance(siteIds, str) else list(siteIds)
+        rD = {}
+        ConfigInfoContentType()
+        for siteId in siteIdL:
+            nOpts = ConfigInfoData.preloadSiteConfig(siteId)
+            if nOpts == 0:
+                logger.warning("no cached configuration found for site %s", siteId)
+            # builds the class-level content type definitions for sites without cached configuration -
+            ConfigInfoData(siteId=siteId, verbose=False)
+            nAcc, failedL = cls.__resolveApps(siteId) if apps else (0, [])
+            if failedL:
+                logger.warning("site %s failing accessors %s", siteId, ", ".join(failedL))
+            rD[siteId] = {"options": nOpts, "accessors": nAcc, "failed": failedL}
+            if siteId not in cls._siteIdL:
+                cls._siteIdL.append(siteId)
+        if freeze:
+            cls.freeze()
+        return rD
+
+    @classmethod
+    def getPreloadedSiteIds(cls):
+        return list(cls._siteIdL)
+
+    @staticmethod
+    def freeze():
+        """Collect garbage and move all tracked objects to the permanent generation (where supported)."""
+        gc.collect()
+        if not hasattr(gc, "freeze"):
+            logger.info("gc.freeze() is not supported by this interpreter")
+            return False
+        gc.freeze()
+        return True
+
+    @staticmethod
+    def __getAppClasses():
+        # imported here as ConfigInfoApp depends on ConfigInfo -
+        from wwpdb.utils.config import ConfigInfoApp  # pylint: disable=import-outside-toplevel
+
+        return [v for k, v in sorted(vars(ConfigInfoApp).items()) if inspect.isclass(v) and k.startswith("ConfigInfoApp") and v.__module__ == ConfigInfoApp.__name__]
+
+    @classmethod
+    def __resolveApps(cls, siteId):
+        """Evaluate the public get_*() accessors requiring no arguments for each ConfigInfoApp* class."""
+        nAcc = 0
+        failedL = []
+        for appClass in cls.__getAppClasses():
+            try:
+                app = appClass(siteId=siteId, verbose=False)
+            except Exception as e:  # noqa: BLE001
+                failedL.append(appClass.__name__)
+                logger.debug("site %s failing %s - %s", siteId, appClass.__name__, str(e))
+                continue
+            for name in sorted(dir(appClass)):
+                if not name.startswith("get_"):
+                    continue
+                func = getattr(app, name)
+                if not callable(func) or not cls.__hasNoRequiredArgs(func):
+                    continue
+                nAcc += 1
+                try:
+                    with warnings.catch_warnings():
+                        warnings.simplefilter("ignore")
+                        func()
+                except Exception as e:  # noqa: BLE001
+                    failedL.append("%s.%s" % (appClass.__name__, name))
+                    logger.debug("site %s failing %s.%s - %s", siteId, appClass.__name__, name, str(e))
+        return nAcc, failedL
+
+    @staticmethod
+    def __hasNoRequiredArgs(func):
+        if not hasattr(inspect, "signature"):
+            # Python 2 - the arguments of bound methods include self
+            try:
+                spec = inspect.getargspec(func)  # pylint: disable=deprecated-method,no-member
+            except TypeError:
+                return False
+            nArgs = len(spec.args) - (1 if inspect.ismethod(func) else 0)
+            return nArgs <= len(spec.defaults or ())
+        try:
+            sig = inspect.signature(func)
+        except (TypeError, ValueError):
+            return False
+        return all(p.default is not p.empty or p.kind in (p.VAR_POSITIONAL, p.VAR_KEYWORD) for p in sig.parameters.values())
@@ -0,0 +1,287 @@
+##
+# File:    ConfigInfoProfiler.py
+# Date:    19-Oct-2026
+#
+# Updates:
+##
+"""
+Opt-in access profiler counting configuration option lookups by key and caller module.
+
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "John Westbrook"
+__email__ = "jwest@rcsb.rutgers.edu"
+__license__ = "Apache 2.0"
+__version__ = "V0.01"
+
+import atexit
+import json
+import logging
+import os
+import signal
+import sys
+import threading
+
+from wwpdb.utils.config.ConfigInfoAtomicFile import ConfigInfoAtomicFile
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+_PACKAGE_PREFIX = "wwpdb.utils.config."
+
+
+class ConfigInfoProfiler:
+    """
+    Counts the lookups made through ConfigInfo.get() and ConfigInfoAppBase._getValue()/_getlegacy()
+    for each option key and caller module.  Each lookup is classified as -
+
+        hit       the key is present in the site configuration
+        miss      the key is absent (or None) and no default was supplied
+        default   the key is absent (or None) and the supplied default was returned
+
+    The caller module is the first calling module outside of this package so that lookups made by the
+    ConfigInfoApp* accessors are attributed to the application module using them.  Lookups made
+    within ConfigInfoApp* accessors are counted once under the accessor (_getValue or _getlegacy).
+
+    Profiling is off by default and the methods are not modified.  enable() installs instrumented
+    methods on the classes (so that existing instances are included) and disable() restores the
+    originals.  Setting WWPDB_CONFIG_PROFILE in the environment enables profiling when ConfigInfo is
+    first imported -
+
+        WWPDB_CONFIG_PROFILE=1                          report to stderr
+        WWPDB_CONFIG_PROFILE=/tmp/cfg-profile-{pid}.txt report to this file ({pid} is the process id, a
+                                                        .json extension selects JSON output)
+
+    The report is written at process exit and on SIGUSR1 (where available).
+    """
+
+    _lock = threading.Lock()
+    _local = threading.local()
+    _countD = {}  # type: dict  # noqa: RUF012
+    _callerD = {}  # type: dict  # noqa: RUF012
+    _originalD = {}  # type: dict  # noqa: RUF012
+    _reportPath = None
+    _signum = None
+    _prevHandler = None
+    _atExitRegistered = False
+
+    @classmethod
+    def isEnabled(cls):
+        return bool(cls._originalD)
+
+    @classmethod
+    def enable(cls, reportPath=None, signum=None, atExit=True):
+        """Install the instrumented lookup methods.
+
+        reportPath  report file path (default stderr)
+        signum      signal number triggering a report (e.g. signal.SIGUSR1)
+        atExit      write the report at process exit
+        """
+        # imported here as ConfigInfo may enable profiling while it is being imported
+        from wwpdb.utils.config.ConfigInfo import ConfigInfo  # pylint: disable=import-outside-toplevel
+        from wwpdb.utils.config.ConfigInfoApp import ConfigInfoAppBase  # pylint: disable=import-outside-toplevel
+
+        with cls._lock:
+            cls._reportPath = reportPath
+            if not cls._originalD:
+                wrapD = {
+                    (ConfigInfo, "get"): cls.__wrapGet,
+                    (ConfigInfoAppBase, "_getValue"): cls.__wrapGetValue,
+                    (ConfigInfoAppBase, "_getlegacy"): cls.__wrapGetLegacy,
+                }
+                for (klass, name), wrap in wrapD.items():
+                    func = getattr(klass, name)
+                    cls._originalD[(klass, name)] = func
+                    setattr(klass, name, wrap(func))
+            if atExit and not cls._atExitRegistered:
+                atexit.register(cls.__reportAtExit)
+                cls._atExitRegistered = True
+        if signum is not None and cls._signum is None:
+            try:
+                cls._prevHandler = signal.signal(signum, cls.__reportOnSignal)
+                cls._signum = signum
+            except ValueError as e:
+                # signal handlers may only be installed from the main thread
+                logger.info("profile report signal handler not installed - %s", str(e))
+        return True
+
+    @classmethod
+    def enableFromEnvironment(cls):
+        """Enable profiling as described by WWPDB_CONFIG_PROFILE (see class documentation)."""
+        value = os.getenv("WWPDB_CONFIG_PROFILE")
+        if not value:
+            return False
+        reportPath = None if value.lower() in ("1", "on", "true", "yes", "stderr") else value
+        return cls.enable(reportPath=reportPath, signum=getattr(signal, "SIGUSR1", None))
+
+    @classmethod
+    def disable(cls):
+        """Restore the original lookup methods.  Counts are retained until reset()."""
+        with cls._lock:
+            for (klass, name), func in cls._originalD.items():
+                setattr(klass, name, func)
+            cls._originalD = {}
+        if cls._signum is not None:
+            try:
+                signal.signal(cls._signum, cls._prevHandler if cls._prevHandler is not None else signal.SIG_DFL)
+            except ValueError as e:
+                logger.info("profile report signal handler not restored - %s", str(e))
+            cls._signum = None
+            cls._prevHandler = None
+
+    @classmethod
+    def reset(cls):
+        with cls._lock:
+            cls._countD = {}
+            cls._callerD = {}
+
+    @classmethod
+    def __wrapGet(cls, func):
+        def get(self, keyWord, default=None):
+            val = func(self, keyWord, _MISSING)
+            appCall = getattr(cls._local, "appCall", None)
+            if appCall is not None:
+                # the option lookup of a ConfigInfoApp* accessor is counted under the accessor
+                cls._local.appCall = None
+                cls.__count(appCall[0], keyWord, cls.__classify(val, appCall[1]))
+            elif not getattr(cls._local, "inApp", False):
+                cls.__count("get", keyWord, cls.__classify(val, default))
+            return default if val is _MISSING else val
+
+        get.__doc__ = func.__doc__
+        return get
+
+    @classmethod
+    def __wrapGetValue(cls, func):
+        def getter(self, key, default=None):
+            cls.__enterApp("_getValue", default)
+            try:
+                return func(self, key, default)
+            finally:
+                cls.__exitApp()
+
+        getter.__doc__ = func.__doc__
+        return getter
+
+    @classmethod
+    def __wrapGetLegacy(cls, func):
+        # stacklevel default as for ConfigInfoAppBase._getlegacy()
+        def getter(self, key, default=None, stacklevel=4):
+            cls.__enterApp("_getlegacy", default)
+            try:
+                # account for this frame in the deprecation warning stack level
+                return func(self, key, default, stacklevel=stacklevel + 1)
+            finally:
+                cls.__exitApp()
+
+        getter.__doc__ = func.__doc__
+        return getter
+
+    @classmethod
+    def __enterApp(cls, accessor, default):
+        cls._local.appCall = (accessor, default)
+        cls._local.inApp = True
+
+    @classmethod
+    def __exitApp(cls):
+        cls._local.appCall = None
+        cls._local.inApp = False
+
+    @staticmethod
+    def __classify(val, default):
+        # a key present with the value None is treated as absent (see class documentation)
+        if val is _MISSING or val is None:
+            return "miss" if default is None else "default"
+        return "hit"
+
+    @classmethod
+    def __count(cls, accessor, key, outcome):
+        frame = sys._getframe(2)  # noqa: SLF001 pylint: disable=protected-access
+        caller = frame.f_globals.get("__name__", "?")
+        while frame is not None and frame.f_globals.get("__name__", "").startswith(_PACKAGE_PREFIX):
+            frame = frame.f_back
+        if frame is not None:
+            caller = frame.f_globals.get("__name__", "?")
+        ky = (accessor, key)
+        with cls._lock:
+            countL = cls._countD.get(ky)
+            if countL is None:
+                countL = cls._countD[ky] = [0, 0, 0]
+                cls._callerD[ky] = {}
+            countL[("hit", "miss", "default").index(outcome)] += 1
+            callerD = cls._callerD[ky]
+            callerD[caller] = callerD.get(caller, 0) + 1
+
+    @classmethod
+    def getReport(cls):
+        """Return the lookup counts sorted by decreasing number of lookups -
+
+        [{"accessor":, "key":, "hits":, "misses":, "defaults":, "total":, "callers": [[module, count], ...]}, ...]
+        """
+        with cls._lock:
+            itemL = [(ky, list(countL), dict(cls._callerD[ky])) for ky, countL in cls._countD.items()]
+        rL = []
+        for (accessor, key), (hits, misses, defaults), callerD in itemL:
+            rL.append(
+                {
+                    "accessor": accessor,
+                    "key": str(key),
+                    "hits": hits,
+                    "misses": misses,
+                    "defaults": defaults,
+                    "total": hits + misses + defaults,
+                    "callers": [[m, n] for m, n in sorted(callerD.items(), key=lambda t: (-t[1], t[0]))],
+                }
+            )
+        rL.sort(key=lambda d: (-d["total"], d["key"], d["accessor"]))
+        return rL
+
+    @classmethod
+    def writeReport(cls, ofh=None, fmt="text"):
+        """Write the sorted report to the input file handle (default stderr) as text or json."""
+        ofh = ofh if ofh is not None else sys.stderr
+        rL = cls.getReport()
+        if fmt == "json":
+            json.dump({"pid": os.getpid(), "lookups": rL}, ofh, indent=2)
+            ofh.write("\n")
+            return True
+        ofh.write("ConfigInfo lookup profile - pid %d - %d lookups of %d keys\n" % (os.getpid(), sum(d["total"] for d in rL), len({d["key"] for d in rL})))
+        ofh.write("%-10s %-48s %9s %9s %9s %9s  %s\n" % ("accessor", "key", "total", "hits", "misses", "defaults", "callers"))
+        for d in rL:
+            ofh.write(
+                "%-10s %-48s %9d %9d %9d %9d  %s\n"
+                % (
+                    d["accessor"],
+                    d["key"],
+                    d["total"],
+                    d["hits"],
+                    d["misses"],
+                    d["defaults"],
+                    " ".join("%s:%d" % (m, n) for m, n in d["callers"]),
+                )
+            )
+        return True
+
+    @classmethod
+    def dump(cls, reportPath=None):
+        """Write the report to the input path (default the path given to enable() or stderr)."""
+        reportPath = reportPath if reportPath is not None else cls._reportPath
+        try:
+            if reportPath is None:
+                return cls.writeReport(sys.stderr)
+            filePath = reportPath.replace("{pid}", str(os.getpid()))
+            with ConfigInfoAtomicFile(filePath, "w") as ofh:
+                return cls.writeReport(ofh, fmt="json" if filePath.endswith(".json") else "text")
+        except Exception as e:  # noqa: BLE001
+            logger.error("failed writing configuration lookup profile %r - %s", reportPath, str(e))
+        return False
+
+    @classmethod
+    def __reportAtExit(cls):
+        if cls.isEnabled():
+            cls.dump()
+
+    @classmethod
+    def __reportOnSignal(cls, signum, frame):  # noqa: ARG003 pylint: disable=unused-argument
+        cls.dump()
@@ -0,0 +1,123 @@
+##
+# File:    ConfigInfoSchema.py
+# Date:    19-Oct-2026
+#
+# Updates:
+##
+"""
+Declarative value types for known configuration options applied when cache files are built.
+
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "John Westbrook"
+__email__ = "jwest@rcsb.rutgers.edu"
+__license__ = "Apache 2.0"
+__version__ = "V0.01"
+
+import ast
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class ConfigInfoSchema:
+    """
+    Casts the values of known configuration options to their declared types -
+
+        bool       "True", "On", "true", "on" and "1" are True; "False", "Off", "false", "off", "0" and "" are False
+        int        integer
+        float      floating point number
+        csv_list   comma separated values as a list of strings
+        int_list   comma separated values as a list of integers
+        object     literal (e.g. dict, list or tuple) representation
+
+    ConfigInfoFileExec applies the schema to the top-level options of each site while building the
+    cache files so that runtime reads return typed values without parsing.  Options already converted
+    by the inline selectors (e.g. config_as_int) are checked against the declared type, and None values
+    are left unchanged.
+
+    Values that cannot be converted are reported as validation errors.  Unrecognized bool values are
+    cast to False as by the runtime accessors.
+
+    The built-in declarations cover the options parsed by the ConfigInfoApp* accessors on every call
+    (EXTENDED_CCD_SUPPORT and FILE_ACTIVITY_DB_SUPPORT).  Options typed by inline selectors in the
+    configuration files keep them; site-specific declarations are added with
+    ConfigInfoFileExec.setSchema().  ConfigInfo.get() returns the cast values, so callers reading a
+    declared bool option directly receive True or False rather than the configured string.
+    """
+
+    _schemaD = {"EXTENDED_CCD_SUPPORT": "bool", "FILE_ACTIVITY_DB_SUPPORT": "bool"}  # type: dict  # noqa: RUF012
+    _trueT = ("True", "On", "true", "on", "1")
+    _falseT = ("False", "Off", "false", "off", "0", "")
+
+    def __init__(self, schemaD=None):
+        self.__schemaD = dict(ConfigInfoSchema._schemaD)
+        if schemaD:
+            self.__schemaD.update(schemaD)
+        for key, typeName in self.__schemaD.items():
+            if not hasattr(self, "_cast_" + typeName):
+                raise ValueError("unsupported type %r for option %s" % (typeName, key))
+
+    def getSchema(self):
+        return dict(self.__schemaD)
+
+    def apply(self, configD):
+        """Return a copy of the input configuration dictionary with the known options cast to their declared
+        types and the list of validation errors ["option: message", ...].
+        """
+        retD = dict(configD)
+        errorL = []
+        for key, typeName in self.__schemaD.items():
+            if key not in retD or retD[key] is None:
+                continue
+            val = retD[key]
+            try:
+                retD[key], msg = getattr(self, "_cast_" + typeName)(val)
+            except Exception as e:  # noqa: BLE001
+                msg = "cannot convert %r to %s - %s" % (val, typeName, str(e))
+            if msg:
+                errorL.append("%s: %s" % (key, msg))
+        return retD, errorL
+
+    @classmethod
+    def _cast_bool(cls, val):
+        if isinstance(val, bool):
+            return val, None
+        if val in (0, 1) and isinstance(val, int):
+            return bool(val), None
+        if val in cls._trueT:
+            return True, None
+        if val in cls._falseT:
+            return False, None
+        return False, "unrecognized bool value %r (treated as False)" % (val,)
+
+    @staticmethod
+    def _cast_int(val):
+        if isinstance(val, bool):
+            raise TypeError("bool value")
+        return int(val), None
+
+    @staticmethod
+    def _cast_float(val):
+        if isinstance(val, bool):
+            raise TypeError("bool value")
+        return float(val), None
+
+    @staticmethod
+    def _cast_csv_list(val):
+        if isinstance(val, list):
+            return [str(t) for t in val], None
+        return [t.strip() for t in val.split(",")], None
+
+    @staticmethod
+    def _cast_int_list(val):
+        if isinstance(val, list):
+            return [int(t) for t in val], None
+        return [int(t.strip()) for t in val.split(",")], None
+
+    @staticmethod
+    def _cast_object(val):
+        if isinstance(val, str):
+            return ast.literal_eval(val), None
+        return val, None
@@ -10,6 +10,11 @@
 #      16-May-2016 jdw add bootstrap support for reading flat config files directly --
 #       4-Dec-2016 jdw add support for extra common configuration sections
 #       5-Dec-2016 jdw add export for validation and database services -
+#      19-Oct-2026     add single pass export of multiple sections to separate files or a combined file
+#      19-Oct-2026     serve pre-rendered environment files stamped with the cache fingerprint, load the cache lazily
+#      19-Oct-2026     resolve host names from a precomputed host site map including fnmatch style host patterns
+#      19-Oct-2026     preserve the permissions of rewritten environment files, read the umask without modifying it
+#      19-Oct-2026     write environment files with ConfigInfoAtomicFile
 ##
 """
 Execuction wrapper for shell configuration using project configuration files.
@@ -22,6 +27,8 @@ __email__ = "jwest@rcsb.rutgers.edu"
 __license__ = "Creative Commons Attribution 3.0 Unported"
 __version__ = "V0.001"
 
+import hashlib
+import json
 import os
 import sys
 import traceback
@@ -36,8 +43,11 @@ try:
     import ConfigParser  # type: ignore[import-not-found]
 except ImportError:
     import configparser as ConfigParser  # noqa: N812
+from fnmatch import fnmatchcase
 from optparse import OptionParser  # pylint: disable=deprecated-module
 
+from wwpdb.utils.config.ConfigInfoAtomicFile import ConfigInfoAtomicFile
+
 
 class ConfigInfoShellExec:
     """
@@ -47,15 +57,32 @@ class ConfigInfoShellExec:
 
     + by host as argument (fqdn)
 
-        expects  <TOP_WWPDB_SITE_CONFIG_DIR>/common/common.cfg  containing mapping data
+        expects  <TOP_WWPDB_SITE_CONFIG_DIR>/common/common.cfg  containing mapping data (section host_site_defaults)
+
+        Host names are resolved from the compact map <TOP_WWPDB_SITE_CONFIG_DIR>/common/host_site_map.json
+        written with the cache files (see writeHostSiteMap()).  If this map is missing or older than
+        its source common.cfg then the mapping data are read from common.cfg.  Host names are matched
+        exactly (case insensitive) and then against host patterns containing fnmatch wildcards
+        (e.g. node*.cluster.org) in the order of their appearance in common.cfg.
 
     + by site using explicit arguments for siteLoc and siteId -
 
     both require: TOP_WWPDB_SITE_CONFIG_DIR in the environment or as argument
 
+    Pre-rendered environment files (site.env.sh, site.env.csh and httpd.env) written with the cache
+    files by ConfigInfoFileExec are served for the shell and httpd exports when the fingerprint
+    stamped in the file matches the current JSON cache file.  These files may also be sourced directly.
 
     """
 
+    # Pre-rendered environment files - (export section, shell type) -> file name
+    _envFileD = {  # noqa: RUF012
+        ("OS_ENVIRONMENT", "bash"): "site.env.sh",
+        ("OS_ENVIRONMENT", "csh"): "site.env.csh",
+        ("HTTPD_SERVICES", "bash"): "httpd.env",
+    }
+    _envFingerprintPrefix = "# ConfigInfoFileCache.json sha256 "
+
     def __init__(
         self,
         topConfigPath=None,
@@ -71,7 +98,9 @@ class ConfigInfoShellExec:
         self.__siteId = None
         self.__siteLoc = None
         self.__topConfigPath = None
-        self.__cD = {}
+        self.__cacheFlag = cacheFlag
+        # configuration options are loaded on first use (see __getConfig())
+        self.__cD = None
         #
         # Complete list of sections maintained as private namespaces
         self.__privateSectionNameList = [
@@ -84,6 +113,15 @@ class ConfigInfoShellExec:
         #
         # additional configuration sections added to the common namespace
         self.__extraCommonSectionNameList = ["database_services", "validation_services"]
+        #
+        # Exported private sections by export name
+        self.__exportSectionD = {
+            "shell": "OS_ENVIRONMENT",
+            "httpd": "HTTPD_SERVICES",
+            "install": "INSTALL_ENVIRONMENT",
+            "validation": "VALIDATION_SERVICES",
+            "database": "DATABASE_SERVICES",
+        }
 
         if topConfigPath is None:
             topConfigPath = os.getenv("TOP_WWPDB_SITE_CONFIG_DIR", default=None)
@@ -92,10 +130,15 @@ class ConfigInfoShellExec:
             self.__topConfigPath = topConfigPath
             self.__siteLoc, self.__siteId = self.__setup(topConfigPath, hostName, siteLoc, siteId)
 
-            if cacheFlag:
-                self.__cD = self.__getConfigD(self.__topConfigPath, self.__siteLoc, self.__siteId)
-            else:
-                self.__cD = self.__getSiteConfigRaw(self.__topConfigPath, self.__siteLoc, self.__siteId)
+    def __getConfig(self):
+        if self.__cD is None:
+            self.__cD = {}
+            if self.__topConfigPath is not None and self.__siteLoc is not None and self.__siteId is not None:
+                if self.__cacheFlag:
+                    self.__cD = self.__getConfigD(self.__topConfigPath, self.__siteLoc, self.__siteId)
+                else:
+                    self.__cD = self.__getSiteConfigRaw(self.__topConfigPath, self.__siteLoc, self.__siteId)
+        return self.__cD
 
     def __setup(self, topConfigPath, inpHostName, inpSiteLoc, inpSiteId):
         """ """
@@ -110,20 +153,102 @@ class ConfigInfoShellExec:
             siteId = inpSiteId
         elif inpHostName is not None:
             # read host mapping data
-            fp = self.__getCommonConfigPath(topConfigPath)
-            cD = self.__readConfigTextFile(fp)
-            if "HOST_SITE_DEFAULTS" in cD:
-                hnU = str(inpHostName).upper()
-                if hnU in cD["HOST_SITE_DEFAULTS"]:
-                    tL = cD["HOST_SITE_DEFAULTS"][hnU].split(",")
-                    siteLoc = tL[0]
-                    siteId = tL[1]
+            mapD = self.__readHostSiteMap(topConfigPath)
+            if mapD is None:
+                fp = self.__getCommonConfigPath(topConfigPath)[0]
+                mapD = self.__buildHostSiteMap(self.__readHostSiteDefaults(fp))
+            siteLoc, siteId = self.lookupHostSite(mapD, inpHostName)
         else:
             self.__lfh.write("FAILING configuration could not be resolved\n")
         if self.__debug:
             self.__lfh.write("_setup returns siteLoc %r siteId %r\n" % (siteLoc, siteId))
         return siteLoc, siteId
 
+    @staticmethod
+    def __getHostSiteMapPath(topConfigPath):
+        return os.path.join(topConfigPath, "common", "host_site_map.json")
+
+    def __readHostSiteMap(self, topConfigPath):
+        """Return the precomputed host site map or None if this is missing or older than its source file."""
+        try:
+            with open(self.__getHostSiteMapPath(topConfigPath)) as ifh:
+                mapD = json.load(ifh)
+            srcD = mapD["source"]
+            st = os.stat(srcD["path"])
+            if st.st_mtime != srcD["mtime"] or st.st_size != srcD["size"]:
+                if self.__debug:
+                    self.__lfh.write("host site map is stale for %s\n" % srcD["path"])
+                return None
+            return mapD
+        except Exception as e:  # noqa: BLE001
+            if self.__debug:
+                self.__lfh.write("host site map unavailable %r\n" % str(e))
+        return None
+
+    @staticmethod
+    def __readHostSiteDefaults(commonConfigPath):
+        """Return the ordered host site defaults in the input configuration file as [(host or pattern, value), ...]."""
+        if sys.version_info[0] > 2:  # noqa: UP036
+            config = ConfigParser.ConfigParser()
+        else:
+            config = ConfigParser.SafeConfigParser()  # pylint: disable=no-member
+        config.read(commonConfigPath)
+        if not config.has_section("host_site_defaults"):
+            return []
+        return config.items("host_site_defaults")
+
+    @staticmethod
+    def __buildHostSiteMap(hostSiteL):
+        """Return the host site map for the input ordered host site defaults -
+
+        {"hosts": {HOSTNAME: [siteLoc, siteId], ...}, "patterns": [[hostpattern, siteLoc, siteId], ...]}
+        """
+        hostD = {}
+        patternL = []
+        for ky, val in hostSiteL:
+            tL = [t.strip() for t in val.split(",")]
+            if len(tL) < 2:
+                continue
+            if any(c in ky for c in "*?["):
+                patternL.append([ky.lower(), tL[0], tL[1]])
+            else:
+                hostD[ky.upper()] = [tL[0], tL[1]]
+        return {"hosts": hostD, "patterns": patternL}
+
+    @staticmethod
+    def lookupHostSite(mapD, hostName):
+        """Return (siteLoc, siteId) for the input host name in the input host site map or (None, None)."""
+        hostD = mapD.get("hosts", {})
+        hnU = str(hostName).upper()
+        if hnU in hostD:
+            return hostD[hnU][0], hostD[hnU][1]
+        hnL = str(hostName).lower()
+        for pattern, siteLoc, siteId in mapD.get("patterns", []):
+            if fnmatchcase(hnL, pattern):
+                return siteLoc, siteId
+        return None, None
+
+    @classmethod
+    def writeHostSiteMap(cls, topConfigPath, commonConfigPath=None):
+        """Write the compact host site map <topConfigPath>/common/host_site_map.json from the host_site_defaults
+        section of the input common configuration file (default <topConfigPath>/common/common.cfg).
+
+        Returns: True for success or False otherwise
+        """
+        try:
+            if commonConfigPath is None:
+                commonConfigPath = cls.__getCommonConfigPath(topConfigPath)[0]
+            commonConfigPath = os.path.abspath(commonConfigPath)
+            st = os.stat(commonConfigPath)
+            mapD = cls.__buildHostSiteMap(cls.__readHostSiteDefaults(commonConfigPath))
+            mapD["source"] = {"path": commonConfigPath, "mtime": st.st_mtime, "size": st.st_size}
+            mapS = json.dumps(mapD, sort_keys=True, separators=(",", ":"))
+            cls.__writeTextFile(cls.__getHostSiteMapPath(topConfigPath), [mapS])
+            return True
+        except Exception as e:  # noqa: BLE001
+            sys.stderr.write("writeHostSiteMap failing for %r - %r\n" % (topConfigPath, str(e)))
+        return False
+
     def __getPrivateSectionNames(self):
         return self.__privateSectionNameList
 
@@ -197,37 +322,6 @@ class ConfigInfoShellExec:
     #     cfPath = os.path.join(topConfigPath, siteLoc.lower(), siteId.lower(), "ConfigInfoFileCache.json")
     #     return cfPath
 
-    def __readConfigTextFile(self, configFilePath):
-        """Read the input configuration file and return a dictionary of configuration items
-        where all configuration keys are converted to upper case.  The returned dictionary is
-        organized in configuration sections (e.g. retD[sectionN.upper()]={k1:v1,k2:v2,...})
-
-        """
-        retD = {}
-        try:
-            if sys.version_info[0] > 2:  # noqa: UP036
-                # Python 3.2 deprecates SafeConfigParser()
-                config = ConfigParser.ConfigParser()
-            else:
-                config = ConfigParser.SafeConfigParser()  # pylint: disable=no-member
-            # print configFilePath
-            config.read(configFilePath)
-            sectionL = config.sections()
-            # print sectionL
-            for section in sectionL:
-                kvTupL = config.items(section)
-                sKyU = section.upper()
-                d = {}
-                for k, v in kvTupL:
-                    d[k.upper()] = v
-                retD[sKyU] = d
-        except Exception as e:  # noqa: BLE001
-            self.__lfh.write("FAILED reading %s - %s\n" % (configFilePath, str(e)))
-            if self.__debug:
-                traceback.print_exc(file=self.__lfh)
-
-        return retD
-
     def __getConfigPathSectionList(
         self, topConfigPath, siteLoc, siteId, extraCommonSectionNameList, privateSectionNameList
     ):
@@ -460,7 +554,7 @@ class ConfigInfoShellExec:
         return retD
 
     def printConfig(self):
-        return self.__printConfig(self.__siteLoc, self.__siteId, self.__cD)
+        return self.__printConfig(self.__siteLoc, self.__siteId, self.__getConfig())
 
     def __printConfig(self, siteLoc, siteId, cD):
         """Print the configuration options for the input location and site."""
@@ -480,41 +574,133 @@ class ConfigInfoShellExec:
                 traceback.print_exc(file=self.__lfh)
 
     def shellConfig(self, shellType="bash"):
-        return self.__exportConfig(
-            self.__siteLoc, self.__siteId, self.__cD, expKey="OS_ENVIRONMENT", shellType=shellType
-        )
+        if self.__serveEnvFile("OS_ENVIRONMENT", shellType):
+            return None
+        return self.__exportConfig(self.__siteLoc, self.__siteId, self.__getConfig(), expKey="OS_ENVIRONMENT", shellType=shellType)
 
     def httpdConfig(self, shellType="bash"):
-        return self.__exportConfig(
-            self.__siteLoc, self.__siteId, self.__cD, expKey="HTTPD_SERVICES", shellType=shellType
-        )
+        if self.__serveEnvFile("HTTPD_SERVICES", shellType):
+            return None
+        return self.__exportConfig(self.__siteLoc, self.__siteId, self.__getConfig(), expKey="HTTPD_SERVICES", shellType=shellType)
 
     def installConfig(self, shellType="bash"):
-        return self.__exportConfig(
-            self.__siteLoc, self.__siteId, self.__cD, expKey="INSTALL_ENVIRONMENT", shellType=shellType
-        )
+        return self.__exportConfig(self.__siteLoc, self.__siteId, self.__getConfig(), expKey="INSTALL_ENVIRONMENT", shellType=shellType)
 
     def validationConfig(self, shellType="bash"):
-        return self.__exportConfig(
-            self.__siteLoc, self.__siteId, self.__cD, expKey="VALIDATION_SERVICES", shellType=shellType
-        )
+        return self.__exportConfig(self.__siteLoc, self.__siteId, self.__getConfig(), expKey="VALIDATION_SERVICES", shellType=shellType)
 
     def databaseConfig(self, shellType="bash"):
-        return self.__exportConfig(
-            self.__siteLoc, self.__siteId, self.__cD, expKey="DATABASE_SERVICES", shellType=shellType
-        )
+        return self.__exportConfig(self.__siteLoc, self.__siteId, self.__getConfig(), expKey="DATABASE_SERVICES", shellType=shellType)
+
+    def exportSections(self, exportNameList, shellType="bash", outDirPath=None, outFilePath=None):
+        """Export the private sections for the input export names (e.g. shell, httpd, install, validation,
+        database) in a single pass over the loaded configuration -
+
+            outDirPath  - write each section to <outDirPath>/<export name>.env.<sh|csh>
+            outFilePath - write all sections to a single file with each section delimited by guard comments
+            otherwise   - write all sections to the log stream as with the individual export methods
+
+        Returns: True for success or False otherwise
+        """
+        try:
+            ext = "csh" if shellType in ["csh", "tcsh"] else "sh"
+            allL = []
+            for exportName in exportNameList:
+                if exportName not in self.__exportSectionD:
+                    self.__lfh.write("WARNING - skipping unknown export section %r\n" % exportName)
+                    continue
+                expKey = self.__exportSectionD[exportName]
+                lineL = self.__renderSection(self.__getConfig(), expKey, shellType)
+                if outDirPath:
+                    self.__writeTextFile(os.path.join(outDirPath, "%s.env.%s" % (exportName, ext)), lineL)
+                elif outFilePath:
+                    allL.append("# --- begin %s ---\n" % expKey)
+                    allL.extend(lineL)
+                    allL.append("# --- end %s ---\n" % expKey)
+                else:
+                    allL.extend(lineL)
+            if outFilePath and not outDirPath:
+                self.__writeTextFile(outFilePath, allL)
+            elif not outDirPath:
+                self.__lfh.write("".join(allL))
+            return True
+        except Exception as e:  # noqa: BLE001
+            self.__lfh.write("exportSections failing for location %r site %r - %r\n" % (self.__siteLoc, self.__siteId, str(e)))
+            if self.__debug:
+                traceback.print_exc(file=self.__lfh)
+        return False
+
+    @staticmethod
+    def __writeTextFile(filePath, lineL):
+        """Write the input lines replacing the target file by rename so that concurrent readers see complete content."""
+        with ConfigInfoAtomicFile(filePath, "w", fsync=False) as ofh:
+            ofh.write("".join(lineL))
+
+    def __serveEnvFile(self, expKey, shellType):
+        """Write the content of the pre-rendered environment file for the input section and shell type
+        if this file matches the current JSON cache file.   Returns True if the file was served.
+        """
+        try:
+            if not self.__cacheFlag or self.__topConfigPath is None or self.__siteLoc is None or self.__siteId is None:
+                return False
+            fileName = self._envFileD.get((expKey, "csh" if shellType in ["csh", "tcsh"] else shellType))
+            if fileName is None:
+                return False
+            dirPath = os.path.dirname(self.__getSitePythonCachePath(self.__topConfigPath, self.__siteLoc, self.__siteId))
+            with open(os.path.join(dirPath, fileName)) as ifh:
+                header = ifh.readline()
+                content = ifh.read()
+            fingerprint = self.getCacheFingerprint(os.path.join(dirPath, "ConfigInfoFileCache.json"))
+            if fingerprint is None or header.strip() != (self._envFingerprintPrefix + fingerprint).strip():
+                return False
+            self.__lfh.write(content)
+            return True
+        except Exception as e:  # noqa: BLE001
+            if self.__debug:
+                self.__lfh.write("__serveEnvFile failing for %r %r - %r\n" % (expKey, shellType, str(e)))
+        return False
+
+    @staticmethod
+    def getCacheFingerprint(jsonCacheFilePath):
+        """Return the sha256 digest of the input JSON cache file or None."""
+        try:
+            with open(jsonCacheFilePath, "rb") as ifh:
+                return hashlib.sha256(ifh.read()).hexdigest()
+        except Exception:  # noqa: BLE001
+            return None
+
+    @classmethod
+    def writeEnvironmentFiles(cls, cD, dirPath, fingerprint):
+        """Write the pre-rendered environment files for the input configuration dictionary in the input
+        directory stamped with the input cache fingerprint.   Returns True for success or False otherwise.
+        """
+        try:
+            for (expKey, shellType), fileName in sorted(cls._envFileD.items()):
+                lineL = [cls._envFingerprintPrefix + fingerprint + "\n"]
+                lineL.extend(cls.__renderSection(cD, expKey, shellType))
+                cls.__writeTextFile(os.path.join(dirPath, fileName), lineL)
+            return True
+        except Exception as e:  # noqa: BLE001
+            sys.stderr.write("writeEnvironmentFiles failing for %r - %r\n" % (dirPath, str(e)))
+        return False
+
+    @staticmethod
+    def __renderSection(cD, expKey, shellType):
+        lineL = []
+        if expKey in cD:
+            dd = cD[expKey]
+            for k in sorted(dd.keys()):
+                v = dd[k]
+                if shellType in ["bash", "sh"]:
+                    lineL.append('export %s="%s"\n' % (k, v))
+                elif shellType in ["csh", "tcsh"]:
+                    lineL.append('setenv %s "%s"\n' % (k, v))
+        return lineL
 
     def __exportConfig(self, siteLoc, siteId, cD, expKey="OS_ENVIRONMENT", shellType="bash"):
         """Print the configuration options for the input location and site."""
         try:
-            if expKey in cD:
-                dd = cD[expKey]
-                for k in sorted(dd.keys()):
-                    v = dd[k]
-                    if shellType in ["bash", "sh"]:
-                        self.__lfh.write('export %s="%s"\n' % (k, v))
-                    elif shellType in ["csh", "tcsh"]:
-                        self.__lfh.write('setenv %s "%s"\n' % (k, v))
+            self.__lfh.write("".join(self.__renderSection(cD, expKey, shellType)))
         except Exception as e:  # noqa: BLE001
             if self.__debug:
                 self.__lfh.write("__exportConfig failing for location %r site %r - %r\n" % (siteLoc, siteId, str(e)))
@@ -535,6 +721,11 @@ def main():  # pragma: no cover
 
        python %prog --shell --configpath=/wwpdb_da/site-config --hostname=myhost.wwpdb.org --shellType='bash'
 
+     Export several sections in a single pass (--export=shell,httpd,install,validation,database or --export=all)
+     to separate files <outdir>/<section>.env.<sh|csh> or to a single file with guard comments (--outfile):
+
+       python %prog --export=all --configpath=/wwpdb_da/site-config --hostname=myhost.wwpdb.org --outdir=/tmp/env
+
      Print the all configuration options  (requires both --locid & --siteid or --hostname):
 
        python %prog --print --configpath=/wwpdb_da/site-config --siteid=WWPDB_DEPLOY_TEST_RU --locid=rcsb-east
@@ -593,6 +784,14 @@ def main():  # pragma: no cover
         default=False,
         help="Export database services environment for (--siteid) at location (--locid) or host",
     )
+    parser.add_option(
+        "--export",
+        dest="exportSections",
+        default=None,
+        help="Comma separated list of sections exported in a single pass (shell,httpd,install,validation,database or all)",
+    )
+    parser.add_option("--outdir", dest="outDirPath", default=None, help="Directory for files written by --export")
+    parser.add_option("--outfile", dest="outFilePath", default=None, help="Combined file written by --export")
     parser.add_option("-v", "--verbose", default=True, action="store_true", dest="verbose")
     parser.add_option("--nocache", default=False, action="store_true", dest="nocacheFlag")
 
@@ -638,6 +837,14 @@ def main():  # pragma: no cover
     if options.databaseConfig:
         cI.databaseConfig(shellType=options.shellType)
 
+    if options.exportSections:
+        exportNameList = [str(x).strip().lower() for x in options.exportSections.split(",") if str(x).strip()]
+        if "all" in exportNameList:
+            exportNameList = ["shell", "httpd", "install", "validation", "database"]
+        ok = cI.exportSections(exportNameList, shellType=options.shellType, outDirPath=options.outDirPath, outFilePath=options.outFilePath)
+        if not ok:
+            sys.exit(1)
+
 
 if __name__ == "__main__":
     main()
@@ -6,6 +6,7 @@
 #         17-May-2016 jdw add getSiteDownTimeRange()
 #         17-May-2016 jdw add  getCorrespondenceService()
 #          1-Jun-2016 jdw add getForwardingService()
+#         19-Oct-2026     defer the import of urllib and ssl until a service is probed
 ##
 """
 Provides accessors for deposition site availability/unavailability information.
@@ -22,13 +23,6 @@ import datetime
 import json
 import logging
 import sys
-
-try:
-    from urllib.error import HTTPError, URLError
-    from urllib.request import urlopen
-except ImportError:  # pragma: no cover
-    from urllib2 import HTTPError, URLError, urlopen  # type: ignore[import-not-found,no-redef]
-import ssl
 import traceback
 
 from wwpdb.utils.config.ConfigInfo import ConfigInfo
@@ -108,6 +102,15 @@ class ConfigInfoSiteAccess:
         return {}
 
     def isServiceReachable(self, siteId, timeout=2):
+        # urllib and ssl are only imported when a service is probed -
+        import ssl  # pylint: disable=import-outside-toplevel
+
+        try:
+            from urllib.error import HTTPError, URLError  # pylint: disable=import-outside-toplevel
+            from urllib.request import urlopen  # pylint: disable=import-outside-toplevel
+        except ImportError:  # pragma: no cover
+            from urllib2 import HTTPError, URLError, urlopen  # type: ignore[import-not-found,no-redef]
+
         # This restores the same behavior as before.
         context = ssl.create_default_context()
         context.check_hostname = False
@@ -0,0 +1,139 @@
+##
+# File:    ConfigInfoTiming.py
+# Date:    19-Oct-2026
+#
+# Updates:
+##
+"""
+Pluggable phase timing hooks for configuration loading and cache builds.
+
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "John Westbrook"
+__email__ = "jwest@rcsb.rutgers.edu"
+__license__ = "Apache 2.0"
+__version__ = "V0.01"
+
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+_timer = getattr(time, "perf_counter", time.time)
+
+
+class ConfigInfoTimingHook:
+    """Callback interface for phase timings.  Subclass and override onPhase() or register any callable
+    accepting the same arguments with ConfigInfoTiming.setHook().
+
+    component   reporting class (e.g. "ConfigInfoData", "ConfigInfoFileExec")
+    phase       phase name (e.g. "cache_lookup", "parse")
+    seconds     elapsed time of the phase
+    contextD    context of the operation (e.g. {"siteId": ...})
+
+    The default hook does nothing and timing is skipped while it is installed.
+    """
+
+    def onPhase(self, component, phase, seconds, contextD):
+        pass
+
+    def __call__(self, component, phase, seconds, contextD):
+        self.onPhase(component, phase, seconds, contextD)
+
+
+class ConfigInfoTimingRecorder(ConfigInfoTimingHook):
+    """Hook collecting phase timings in memory (e.g. for diagnostics or tests)."""
+
+    def __init__(self):
+        self.__lock = threading.Lock()
+        self.spanL = []
+
+    def onPhase(self, component, phase, seconds, contextD):
+        with self.__lock:
+            self.spanL.append((component, phase, seconds, dict(contextD)))
+
+    def getTotals(self):
+        """Return the accumulated time for each phase {(component, phase): seconds}."""
+        tD = {}
+        with self.__lock:
+            for component, phase, seconds, _ in self.spanL:
+                tD[(component, phase)] = tD.get((component, phase), 0.0) + seconds
+        return tD
+
+
+class _NullPhaseTimer:
+    def isActive(self):  # noqa: PLR6301
+        return False
+
+    def mark(self, phase, less=0.0):
+        pass
+
+    def add(self, phase, seconds):
+        pass
+
+
+class _PhaseTimer:
+    """Reports the time between successive calls to mark() as the named phase."""
+
+    def __init__(self, hook, component, contextD):
+        self.__hook = hook
+        self.__component = component
+        self.__contextD = contextD
+        self.__tS = _timer()
+
+    def isActive(self):  # noqa: PLR6301
+        return True
+
+    def mark(self, phase, less=0.0):
+        """Report the time since the previous mark (less the input seconds reported separately) as phase."""
+        tE = _timer()
+        self.add(phase, max(0.0, tE - self.__tS - less))
+        self.__tS = _timer()
+
+    def add(self, phase, seconds):
+        """Report the input duration as phase."""
+        try:
+            self.__hook(self.__component, phase, seconds, self.__contextD)
+        except Exception as e:  # noqa: BLE001
+            logger.error("timing hook failed for %s %s - %s", self.__component, phase, str(e))
+
+
+class ConfigInfoTiming:
+    """
+    Process wide registry of the phase timing hook.
+
+        ConfigInfoTiming.setHook(hook)       install a hook (None restores the no-op default)
+        pT = ConfigInfoTiming.getPhaseTimer("ConfigInfoData", siteId=siteId)
+        ...
+        pT.mark("cache_lookup")             report the time since the timer was created or last marked
+
+    getPhaseTimer() returns a shared timer with no-op methods while the default hook is installed.
+    """
+
+    _defaultHook = ConfigInfoTimingHook()
+    _hook = _defaultHook
+    _nullTimer = _NullPhaseTimer()
+
+    @classmethod
+    def setHook(cls, hook=None):
+        """Install the input hook (callable or ConfigInfoTimingHook) and return the previous hook."""
+        prevHook = cls._hook
+        cls._hook = hook if hook is not None else cls._defaultHook
+        return prevHook
+
+    @classmethod
+    def getHook(cls):
+        return cls._hook
+
+    @classmethod
+    def isActive(cls):
+        return cls._hook is not cls._defaultHook
+
+    @classmethod
+    def getPhaseTimer(cls, component, **contextD):
+        hook = cls._hook
+        if hook is cls._defaultHook:
+            return cls._nullTimer
+        return _PhaseTimer(hook, component, contextD)